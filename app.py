@@ -1,16 +1,19 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from flask_socketio import SocketIO
+from flask_socketio import SocketIO, emit
 import yfinance as yf
 import pandas as pd
-import talib
-import numpy as np
-from ta import add_all_ta_features
-from ta.utils import dropna
 import logging
 from datetime import datetime
 import asyncio
-from deriv_api import DerivAPI
+from concurrent.futures import ThreadPoolExecutor
+from deriv_pool import deriv_pool
+from candle_cache import candle_store, yf_download_lock
+from candle_aggregator import candle_aggregator
+from history_store import epoch
+from signals import combine_data, generate_trade_signals, process_data
+from tick_stream import TickStreamManager
+from screener import screener
 import websockets
 
 # Setup logging
@@ -21,6 +24,24 @@ app = Flask(__name__)
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Maximum number of concurrent fetches per data source
+FETCH_CONCURRENCY = {
+    'yfinance': 6,
+    'deriv': 6,
+}
+yf_executor = ThreadPoolExecutor(
+    max_workers=FETCH_CONCURRENCY['yfinance'], thread_name_prefix='yfinance')
+
+# History window and intervals analysed for every symbol
+START_DATE = '2020-01-01'
+END_DATE = '2026-05-29'
+INTERVALS = ['3mo', '1mo', '1wk', '1d', '1h', '30m']
+
+# Upper bound on the symbols accepted by one /api/signals request
+MAX_BATCH_SYMBOLS = 500
+# Upper bound on the symbols accepted by one /api/screen request
+MAX_SCREEN_SYMBOLS = 5000
+
 
 @socketio.on('connect')
 def handle_connect():
@@ -29,6 +50,7 @@ def handle_connect():
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    tick_streams.unsubscribe_all(request.sid)
     print('Client disconnected')
 
 # Deriv Connection
@@ -36,9 +58,7 @@ def handle_disconnect():
 
 async def initialize_deriv_api(app_id, api_token):
     try:
-        api = DerivAPI(
-            app_id=app_id, endpoint=f'wss://ws.derivws.com/websockets/v3?app_id={app_id}&auth_token={api_token}')
-        await api.api_connect()
+        api = await deriv_pool.acquire(app_id, api_token)
         logging.info("Successfully connected to DerivAPI")
         return api
     except Exception as e:
@@ -93,20 +113,6 @@ async def fetch_deriv_data(api, symbol, interval, start_date, end_date):
         return pd.DataFrame()
 
 
-def combine_data(yf_data, deriv_data):
-    combined_data = pd.concat([yf_data, deriv_data])
-    combined_data = combined_data[~combined_data.index.duplicated(
-        keep='first')]
-    combined_data.sort_index(inplace=True)
-    return combined_data
-
-
-def calculate_probability(atr, close_price):
-    max_atr = close_price * 0.1
-    probability = (atr / max_atr) * 100
-    return round(probability, 2)
-
-
 def recommend_lot_size(probability, account_balance):
     risk_per_trade = 0.01
     if probability >= 80:
@@ -122,16 +128,20 @@ def recommend_lot_size(probability, account_balance):
     return round(lot_size, 2)
 
 
-def download_data(ticker_symbol, interval, start_date, end_date):
+def download_yf_data(ticker_symbol, interval, start_date, end_date):
     logging.info(
         f"Downloading data for {ticker_symbol} from {start_date} to {end_date} with interval {interval}")
     try:
-        data = yf.download(ticker_symbol, start=start_date,
-                           end=end_date, interval=interval)
+        # yf.download keeps its results in module-level state, so concurrent
+        # calls for the same ticker clobber each other; Ticker.history does not
+        data = yf.Ticker(ticker_symbol).history(
+            start=start_date, end=end_date, interval=interval, actions=False)
         if data.empty:
             logging.info(
                 f"No data available for {ticker_symbol} at interval {interval}")
             return None
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
         logging.info(
             f"Successfully downloaded data for {ticker_symbol} at interval {interval}")
         return data
@@ -141,75 +151,143 @@ def download_data(ticker_symbol, interval, start_date, end_date):
         return None
 
 
-def process_data(data_frames):
-    signals = {}
+def download_data(ticker_symbol, interval, start_date, end_date):
+    # Only bars newer than the last cached one are downloaded
+    return candle_store.get('yfinance', ticker_symbol, interval, start_date, end_date,
+                            lambda start, end: download_yf_data(ticker_symbol, interval, start, end))
 
-    for interval, data in data_frames.items():
-        logging.info(f"Processing data for interval {interval}")
-        data = dropna(data)
 
-        if len(data) < 50:
-            logging.info(f"Not enough data for interval {interval}")
+def download_yf_batch(ticker_symbols, interval, start_date, end_date):
+    logging.info(
+        f"Downloading data for {len(ticker_symbols)} tickers from {start_date} to {end_date} with interval {interval}")
+    try:
+        with yf_download_lock:
+            data = yf.download(ticker_symbols, start=start_date, end=end_date, interval=interval,
+                               group_by='ticker', auto_adjust=True, actions=False, progress=False,
+                               threads=FETCH_CONCURRENCY['yfinance'], multi_level_index=True)
+    except Exception as e:
+        logging.error(
+            f"Error downloading data for {len(ticker_symbols)} tickers at interval {interval}: {e}")
+        return {}
+    return split_yf_batch(data, ticker_symbols, interval)
+
+
+def split_yf_batch(data, ticker_symbols, interval):
+    """Split a multi-ticker yf.download frame into one OHLCV frame per ticker."""
+    results = {}
+    if data is None or data.empty:
+        return results
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    tickers = set(data.columns.get_level_values(0))
+    for ticker_symbol in ticker_symbols:
+        frame = data[ticker_symbol].dropna(how='all') if ticker_symbol in tickers else None
+        if frame is None or frame.empty:
+            logging.info(
+                f"No data available for {ticker_symbol} at interval {interval}")
             continue
+        frame.columns.name = None
+        results[ticker_symbol] = frame
+    return results
+
+
+def download_batch(ticker_symbols, interval, start_date, end_date):
+    # Tickers already cached up to end_date are not downloaded again
+    return candle_store.get_many('yfinance', ticker_symbols, interval, start_date, end_date,
+                                 lambda tickers, start, end: download_yf_batch(tickers, interval, start, end))
+
+
+async def fetch_interval_data(api, symbol, ticker_symbol, interval, start_date, end_date, deriv_semaphore):
+    if candle_aggregator.is_warm(symbol, interval):
+        # intraday bars built from the live tick stream need no download
+        logging.info(f"Using streamed candles for {symbol} at interval {interval}")
+        return candle_aggregator.frame(symbol, interval)
+    loop = asyncio.get_running_loop()
+    yf_data = await loop.run_in_executor(
+        yf_executor, download_data, ticker_symbol, interval, start_date, end_date)
+    if yf_data is None or len(yf_data) < 50:
+        async with deriv_semaphore:
+            deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, end_date)
+        yf_data = combine_data(yf_data, deriv_data)
+    return yf_data
 
-        data['EMA_50'] = talib.EMA(data['Close'], timeperiod=50)
-        data['RSI'] = talib.RSI(data['Close'], timeperiod=14)
-        data['MACD'], data['MACD_Signal'], data['MACD_Hist'] = talib.MACD(
-            data['Close'], fastperiod=12, slowperiod=26, signalperiod=9)
-        data['Upper_BB'], data['Middle_BB'], data['Lower_BB'] = talib.BBANDS(
-            data['Close'], timeperiod=20)
-        data['Stoch_K'], data['Stoch_D'] = talib.STOCH(
-            data['High'], data['Low'], data['Close'], fastk_period=14, slowk_period=3, slowd_period=3)
-        data['ATR'] = talib.ATR(data['High'], data['Low'],
-                                data['Close'], timeperiod=14)
-        data['OBV'] = talib.OBV(data['Close'], data['Volume'])
-
-        if len(data) >= 15:
-            data = add_all_ta_features(
-                data, open="Open", high="High", low="Low", close="Close", volume="Volume", fillna=True)
-
-        conditions = [
-            (data['EMA_50'] > data['Close']),
-            (data['RSI'] < 30),
-            (data['MACD_Hist'] > 0),
-            (data['Close'] < data['Lower_BB']),
-            (data['Stoch_K'] < data['Stoch_D']),
-        ]
-
-        data['Signal'] = np.where(np.all(conditions, axis=0), 1, 0)
-        data['Position'] = data['Signal'].diff()
-        signals[interval] = data.iloc[-1] if not data.empty else None
-        logging.info(
-            f"Processed data for interval {interval}: {signals[interval]}")
 
-    return signals
+async def fetch_all_intervals(api, symbol, ticker_symbol, intervals, start_date, end_date):
+    deriv_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY['deriv'])
+    results = await asyncio.gather(*(
+        fetch_interval_data(api, symbol, ticker_symbol,
+                            interval, start_date, end_date, deriv_semaphore)
+        for interval in intervals))
+
+    data_frames = {}
+    for interval, yf_data in zip(intervals, results):
+        if yf_data is not None:
+            data_frames[interval] = yf_data
+    return data_frames
+
+
+async def fetch_batch(api, symbols, intervals, start_date, end_date):
+    """Return {symbol: {interval: data}}; yfinance is hit once per interval for all symbols."""
+    loop = asyncio.get_running_loop()
+    ticker_symbols = {symbol: f'{symbol}=X' for symbol in symbols}
+    yf_results = await asyncio.gather(*(
+        loop.run_in_executor(yf_executor, download_batch, list(ticker_symbols.values()),
+                             interval, start_date, end_date)
+        for interval in intervals))
+
+    data_frames = {symbol: {} for symbol in symbols}
+    for interval, downloaded in zip(intervals, yf_results):
+        for symbol in symbols:
+            if candle_aggregator.is_warm(symbol, interval):
+                data_frames[symbol][interval] = candle_aggregator.frame(symbol, interval)
+            else:
+                data_frames[symbol][interval] = downloaded.get(ticker_symbols[symbol])
+
+    deriv_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY['deriv'])
+
+    async def top_up(symbol, interval):
+        async with deriv_semaphore:
+            deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, end_date)
+        data_frames[symbol][interval] = combine_data(data_frames[symbol][interval], deriv_data)
 
+    await asyncio.gather(*(
+        top_up(symbol, interval)
+        for symbol in symbols for interval in intervals
+        if data_frames[symbol][interval] is None or len(data_frames[symbol][interval]) < 50))
 
-def generate_trade_signals(signals):
-    logging.info("Generating trade signals")
+    return {symbol: {interval: data for interval, data in frames.items()
+                     if data is not None and not data.empty}
+            for symbol, frames in data_frames.items()}
 
-    for interval in ['30m', '1h']:
-        if signals.get(interval) is not None:
-            recent_signal = signals[interval]
-            trade_signal = 'buy' if recent_signal['Signal'] == 1 else 'sell'
-            entry_price = recent_signal['Close']
-            probability = calculate_probability(
-                recent_signal['ATR'], recent_signal['Close'])
-            logging.info(
-                f"Trade signal: {trade_signal} for interval {interval}")
-            return trade_signal, entry_price, probability, interval
 
-    if signals.get('1d') is not None:
-        recent_signal = signals['1d']
-        trade_signal = 'buy' if recent_signal['Signal'] == 1 else 'sell'
-        entry_price = recent_signal['Close']
-        probability = calculate_probability(
-            recent_signal['ATR'], recent_signal['Close'])
-        logging.info(f"Trade signal: {trade_signal} for daily interval")
-        return trade_signal, entry_price, probability, '1d'
+async def compute_signal(api, symbol):
+    ticker_symbol = f'{symbol}=X'
+    data_frames = await fetch_all_intervals(
+        api, symbol, ticker_symbol, INTERVALS, START_DATE, END_DATE)
+    signals = process_data(data_frames, symbol=symbol)
+    return generate_trade_signals(signals)
+
+
+# Streaming: one upstream tick subscription per symbol, fanned out to rooms
+tick_streams = TickStreamManager(socketio, signal_fn=compute_signal)
+
 
-    logging.info("No trade signal generated")
-    return 'hold', None, 0, 'No signal'
+@socketio.on('subscribe_ticks')
+def handle_subscribe_ticks(data):
+    symbol = data.get('symbol')
+    app_id = data.get('app_id')
+    api_token = data.get('api_token')
+    if not symbol or not app_id or not api_token:
+        emit('tick_error', {'errors': 'Invalid input'})
+        return
+    tick_streams.subscribe(request.sid, symbol, app_id, api_token)
+
+
+@socketio.on('unsubscribe_ticks')
+def handle_unsubscribe_ticks(data):
+    symbol = data.get('symbol')
+    if symbol:
+        tick_streams.unsubscribe(request.sid, symbol)
 
 
 @app.route('/api/trade', methods=['POST'])
@@ -229,28 +307,12 @@ async def trade():
     if not symbol or not amount or not contract_type or not app_id or not api_token:
         return jsonify({'errors': 'Invalid input'}), 400
 
-    ticker_symbol = f'{symbol}=X'
-    start_date = '2020-01-01'
-    end_date = '2026-05-29'
-
-    intervals = ['3mo', '1mo', '1wk', '1d', '1h', '30m']
-    data_frames = {}
-
     api = await initialize_deriv_api(app_id, api_token)
     if api is None:
         return jsonify({'errors': 'Failed to connect to DerivAPI'}), 500
 
-    for interval in intervals:
-        yf_data = download_data(ticker_symbol, interval, start_date, end_date)
-        if yf_data is None or len(yf_data) < 50:
-            deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, end_date)
-            yf_data = combine_data(yf_data, deriv_data)
-        if yf_data is not None:
-            data_frames[interval] = yf_data
-
-    signals = process_data(data_frames)
-    trade_signal, entry_price, probability, timeframe_displayed = generate_trade_signals(
-        signals)
+    trade_signal, entry_price, probability, timeframe_displayed = await compute_signal(
+        api, symbol)
 
     if trade_signal != 'hold':
         stop_loss = entry_price * \
@@ -279,5 +341,83 @@ async def trade():
 
     return jsonify(result)
 
+
+@app.route('/api/signals', methods=['POST'])
+async def batch_signals():
+    logging.info("Received request at /api/signals")
+    data = request.json
+
+    symbols = data.get('symbols')
+    intervals = data.get('intervals', INTERVALS)
+    app_id = data.get('app_id')
+    api_token = data.get('api_token')
+
+    if not symbols or not isinstance(symbols, list) or not intervals or not isinstance(intervals, list) \
+            or not app_id or not api_token:
+        return jsonify({'errors': 'Invalid input'}), 400
+    if len(symbols) > MAX_BATCH_SYMBOLS:
+        return jsonify({'errors': f'At most {MAX_BATCH_SYMBOLS} symbols per request'}), 400
+    symbols = list(dict.fromkeys(symbols))
+
+    api = await initialize_deriv_api(app_id, api_token)
+    if api is None:
+        return jsonify({'errors': 'Failed to connect to DerivAPI'}), 500
+
+    data_frames = await fetch_batch(api, symbols, intervals, START_DATE, END_DATE)
+
+    results = {}
+    for symbol in symbols:
+        # the vectorized path: one talib pass per frame, no per-symbol engine state
+        signals = process_data(data_frames[symbol])
+        trade_signal, entry_price, probability, timeframe_displayed = generate_trade_signals(
+            signals)
+        results[symbol] = {
+            'signal': trade_signal,
+            'entry_price': entry_price,
+            'probability': f'{probability}%',
+            'timeframe_displayed': timeframe_displayed,
+        }
+
+    return jsonify({'status': 'success', 'signals': results})
+
+
+@app.route('/api/screen', methods=['POST'])
+async def screen():
+    logging.info("Received request at /api/screen")
+    data = request.json
+
+    symbols = data.get('symbols')
+    intervals = data.get('intervals', INTERVALS)
+    app_id = data.get('app_id')
+    api_token = data.get('api_token')
+
+    if not symbols or not isinstance(symbols, list) or not intervals or not isinstance(intervals, list) \
+            or not app_id or not api_token:
+        return jsonify({'errors': 'Invalid input'}), 400
+    if len(symbols) > MAX_SCREEN_SYMBOLS:
+        return jsonify({'errors': f'At most {MAX_SCREEN_SYMBOLS} symbols per request'}), 400
+    symbols = list(dict.fromkeys(symbols))
+
+    api = await initialize_deriv_api(app_id, api_token)
+    if api is None:
+        return jsonify({'errors': 'Failed to connect to DerivAPI'}), 500
+
+    data_frames = await fetch_batch(api, symbols, intervals, START_DATE, END_DATE)
+    loop = asyncio.get_running_loop()
+    # the indicators run in the screener's worker processes, not in this one
+    if data.get('history'):
+        # the yfinance bars archived by the candle cache, which the workers
+        # map from disk instead of receiving them in shared memory
+        tickers = {f'{symbol}=X': symbol for symbol in symbols}
+        keys = [(ticker_symbol, interval) for ticker_symbol in tickers for interval in intervals]
+        fired = await loop.run_in_executor(None, screener.scan_history, keys, epoch(START_DATE))
+        fired['symbol'] = fired['symbol'].map(tickers)
+    else:
+        fired = await loop.run_in_executor(None, screener.scan, data_frames)
+    fired['time'] = fired['time'].astype(str)
+
+    return jsonify({'status': 'success', 'signals': fired.to_dict(orient='records')})
+
+
 if __name__ == '__main__':
     socketio.run(app, port=5000, debug=True)
@@ -0,0 +1,167 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# Defaults used by the /api/trade handler
+STOP_LOSS_PERCENT = 1
+TAKE_PROFIT_PERCENT = 2
+
+
+def _trade_bounds(position, short=True):
+    """Return the entry bar, the closing bar, the direction and whether a signal closed it, for every trade.
+
+    A long trade opens where Position is 1 and, with `short`, a short one
+    where it is -1; each is closed by the next opposite Position, or by the
+    last bar.
+    """
+    position = np.nan_to_num(np.asarray(position, dtype=float))
+    events = np.flatnonzero(position != 0)
+    entries = events[position[events] > 0] if not short else events
+    directions = np.sign(position[entries]).astype(np.int64)
+    # each entry is closed by the first opposite Position after it, or by the last bar
+    opposite = np.flatnonzero(position < 0), np.flatnonzero(position > 0)
+    signal_exits = np.full(len(entries), len(position) - 1, dtype=np.int64)
+    closed = np.zeros(len(entries), dtype=bool)
+    for direction, exits in zip((1, -1), opposite):
+        side = directions == direction
+        closing = np.searchsorted(exits, entries[side], side='right')
+        closed[side] = closing < len(exits)
+        if len(exits):
+            signal_exits[side] = np.where(closed[side], exits[np.minimum(closing, len(exits) - 1)], len(position) - 1)
+    return entries, signal_exits, directions, closed
+
+
+def backtest(data, stop_loss_percent=STOP_LOSS_PERCENT, take_profit_percent=TAKE_PROFIT_PERCENT,
+             initial_capital=10000.0, fee_percent=0.0, short=True):
+    """Backtest the trades described by the Signal/Position columns of `data`.
+
+    `data` is a process_data frame with Open, High, Low, Close and Position.
+    Like generate_trade_signals, which quotes a buy while Signal is 1 and a
+    sell otherwise, a long trade is opened at the close of every bar where
+    Position is 1 and a short one where it is -1 (only longs with
+    short=False). The stop-loss and take-profit levels are the ones the
+    /api/trade handler quotes: below and above the entry for a long, above
+    and below for a short. A trade is closed at the stop or target the first
+    time a later bar trades through it (the stop wins when a bar hits both,
+    and a gap fills at the open), or at the close of the next bar with the
+    opposite Position, whichever comes first.
+
+    Returns a dict with the `equity` and `drawdown` Series, a `trades`
+    DataFrame and a `stats` dict. Everything is computed with array
+    operations; there is no per-bar Python loop.
+    """
+    opens = data['Open'].to_numpy(dtype=float) if 'Open' in data else data['Close'].to_numpy(dtype=float)
+    highs = data['High'].to_numpy(dtype=float)
+    lows = data['Low'].to_numpy(dtype=float)
+    closes = data['Close'].to_numpy(dtype=float)
+    n = len(closes)
+
+    entries, signal_exits, directions, closed = _trade_bounds(data['Position'].to_numpy(), short)
+    longs = directions > 0
+    entry_prices = closes[entries]
+    stop_prices = entry_prices * (1 - directions * stop_loss_percent / 100)
+    target_prices = entry_prices * (1 + directions * take_profit_percent / 100)
+
+    # every bar inside a trade, after its entry, tagged with its trade number
+    run = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(run, entries + 1, 1)
+    np.add.at(run, signal_exits + 1, -1)
+    in_trade = np.cumsum(run)[:n] > 0
+    trade_of_bar = np.searchsorted(entries, np.arange(n), side='left') - 1
+
+    bars = np.flatnonzero(in_trade)
+    trades = trade_of_bar[bars]
+    bar_longs = longs[trades]
+    stop_hit = np.where(bar_longs, lows[bars] <= stop_prices[trades], highs[bars] >= stop_prices[trades])
+    target_hit = np.where(bar_longs, highs[bars] >= target_prices[trades], lows[bars] <= target_prices[trades])
+
+    first_stop = np.full(len(entries), n, dtype=np.int64)
+    first_target = np.full(len(entries), n, dtype=np.int64)
+    np.minimum.at(first_stop, trades[stop_hit], bars[stop_hit])
+    np.minimum.at(first_target, trades[target_hit], bars[target_hit])
+
+    exits = np.minimum(np.minimum(first_stop, first_target), signal_exits)
+    stopped = (first_stop == exits) & (first_stop < n)
+    targeted = (first_target == exits) & (first_target < n) & ~stopped
+    exit_prices = closes[exits].copy()
+    # a gap through the level fills at the open, which is worse for a stop and better for a target
+    gap_opens = opens[exits]
+    exit_prices[stopped] = np.where(longs[stopped], np.minimum(gap_opens[stopped], stop_prices[stopped]),
+                                    np.maximum(gap_opens[stopped], stop_prices[stopped]))
+    exit_prices[targeted] = np.where(longs[targeted], np.maximum(gap_opens[targeted], target_prices[targeted]),
+                                     np.minimum(gap_opens[targeted], target_prices[targeted]))
+    reasons = np.where(stopped, 'stop_loss', np.where(targeted, 'take_profit', 'signal'))
+    reasons[~stopped & ~targeted & ~closed] = 'open'
+
+    # mark to market: a trade earns every bar after its entry up to its
+    # exit, valued at price / entry for a long and 2 - price / entry for a
+    # short, so its bar returns compound to its trade return
+    held = np.zeros(n + 1, dtype=np.int64)
+    np.add.at(held, entries + 1, 1)
+    np.add.at(held, exits + 1, -1)
+    held = np.cumsum(held)[:n] > 0
+    marks = closes.copy()
+    marks[exits] = exit_prices
+    bar_returns = np.zeros(n)
+    marked = np.flatnonzero(held)
+    sign = directions[trade_of_bar[marked]]
+    entry = entry_prices[trade_of_bar[marked]]
+    bar_returns[marked] = (1 - sign + sign * marks[marked] / entry) / (1 - sign + sign * closes[marked - 1] / entry) - 1
+
+    growth = 1 + bar_returns
+    fee = fee_percent / 100
+    if fee:
+        np.multiply.at(growth, entries, 1 - fee)
+        np.multiply.at(growth, exits, 1 - fee)
+    equity = initial_capital * np.cumprod(growth)
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+
+    trade_returns = (1 + directions * (exit_prices / entry_prices - 1)) * (1 - fee) ** 2 - 1
+    index = data.index
+    trades_frame = pd.DataFrame({
+        'entry_time': index[entries],
+        'exit_time': index[exits],
+        'side': np.where(longs, 'long', 'short'),
+        'entry_price': entry_prices,
+        'exit_price': exit_prices,
+        'return': trade_returns,
+        'bars': exits - entries,
+        'exit_reason': reasons,
+    })
+
+    wins = trade_returns[trade_returns > 0]
+    losses = trade_returns[trade_returns <= 0]
+    if losses.sum() < 0:
+        profit_factor = float(wins.sum() / -losses.sum())
+    else:
+        profit_factor = float('inf') if len(wins) else 0.0
+    stats = {
+        'trades': int(len(entries)),
+        'long_trades': int(longs.sum()),
+        'short_trades': int((~longs).sum()),
+        'total_return': float(equity[-1] / initial_capital - 1) if n else 0.0,
+        'max_drawdown': float(drawdown.min()) if n else 0.0,
+        'win_rate': float(len(wins) / len(entries)) if len(entries) else 0.0,
+        'average_return': float(trade_returns.mean()) if len(entries) else 0.0,
+        'profit_factor': profit_factor,
+        'exposure': float(held.mean()) if n else 0.0,
+        'stop_losses': int(stopped.sum()),
+        'take_profits': int(targeted.sum()),
+    }
+
+    return {
+        'equity': pd.Series(equity, index=index, name='Equity'),
+        'drawdown': pd.Series(drawdown, index=index, name='Drawdown'),
+        'trades': trades_frame,
+        'stats': stats,
+    }
+
+
+def sweep(data, stop_loss_percents, take_profit_percents, **kwargs):
+    """Return a DataFrame of backtest stats for every (stop loss, take profit) pair."""
+    rows = []
+    for stop_loss_percent, take_profit_percent in itertools.product(stop_loss_percents, take_profit_percents):
+        stats = backtest(data, stop_loss_percent, take_profit_percent, **kwargs)['stats']
+        rows.append({'stop_loss_percent': stop_loss_percent, 'take_profit_percent': take_profit_percent, **stats})
+    return pd.DataFrame(rows)
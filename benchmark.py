@@ -0,0 +1,158 @@
+"""Offline benchmarks for the signal pipeline.
+
+Times combine_data, process_data and generate_trade_signals, plus every talib
+call of the signal feature set, on synthetic OHLCV frames of growing size,
+and records the peak memory of each stage. Results are written as JSON so a
+later run can be compared against a saved baseline:
+
+    python benchmark.py --output benchmark_baseline.json
+    python benchmark.py --sizes 1e3 1e5 --compare benchmark_baseline.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import talib
+
+from signals import combine_data, generate_trade_signals, process_data
+from feature_sets import SIGNAL_FEATURES, resolve_feature_set
+
+DEFAULT_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7]
+
+# Stages slower than the baseline by more than this fraction are reported
+DEFAULT_TOLERANCE = 0.25
+
+
+def synthetic_ohlcv(rows, seed=0, freq='30min', start='2000-01-03'):
+    """Return a random-walk OHLCV frame shaped like a yfinance download."""
+    rng = np.random.default_rng(seed)
+    close = 1.1 * np.exp(np.cumsum(rng.normal(0, 1e-3, rows)))
+    open_ = np.empty(rows)
+    open_[0] = close[0]
+    open_[1:] = close[:-1]
+    spread = np.abs(rng.normal(0, 5e-4, (2, rows)))
+    return pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) * (1 + spread[0]),
+        'Low': np.minimum(open_, close) * (1 - spread[1]),
+        'Close': close,
+        'Volume': rng.integers(1, 10_000, rows).astype(float),
+    }, index=pd.date_range(start, periods=rows, freq=freq, name='timestamp'))
+
+
+def measure(fn, *args, repeat=3):
+    """Return (best seconds, peak traced bytes, result) of calling fn(*args)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak, result
+
+
+def bench_size(rows, repeat):
+    data = synthetic_ohlcv(rows)
+    # two overlapping sources, like yfinance plus a Deriv top-up
+    yf_data = data.iloc[:rows * 3 // 4]
+    deriv_data = data.iloc[rows // 2:]
+    results = []
+
+    def record(stage, seconds, peak):
+        results.append({'rows': rows, 'stage': stage, 'seconds': seconds, 'peak_bytes': peak})
+        print(f"{rows:>10} rows  {stage:<24} {seconds * 1000:>10.2f} ms  {peak / 2 ** 20:>9.1f} MiB")
+
+    seconds, peak, combined = measure(combine_data, yf_data, deriv_data, repeat=repeat)
+    record('combine_data', seconds, peak)
+
+    seconds, peak, signals = measure(process_data, {'30m': combined}, repeat=repeat)
+    record('process_data', seconds, peak)
+
+    seconds, peak, _ = measure(generate_trade_signals, signals, repeat=repeat)
+    record('generate_trade_signals', seconds, peak)
+
+    columns = {column: data[column].to_numpy() for column in data.columns}
+    for name, function_name, params, inputs, _ in resolve_feature_set(SIGNAL_FEATURES):
+        function = getattr(talib, function_name)
+        seconds, peak, _ = measure(lambda: function(*(columns[column] for column in inputs), **params), repeat=repeat)
+        record(f'talib.{function_name}', seconds, peak)
+
+    return results
+
+
+def environment():
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'talib': talib.__version__,
+        'ta_lib_c': talib.__ta_version__.decode() if isinstance(talib.__ta_version__, bytes) else talib.__ta_version__,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Return the (rows, stage, seconds, baseline seconds) entries that regressed."""
+    previous = {(entry['rows'], entry['stage']): entry['seconds'] for entry in baseline['results']}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry['rows'], entry['stage']))
+        if before is not None and entry['seconds'] > before * (1 + tolerance):
+            regressions.append((entry['rows'], entry['stage'], entry['seconds'], before))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=float, default=DEFAULT_SIZES,
+                        help='frame sizes in rows (default: 1e3 to 1e7)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per stage; the best one is kept')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to check the results against')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown against the baseline as a fraction')
+    args = parser.parse_args(argv)
+
+    # the pipeline logs every interval at DEBUG/INFO; keep only the benchmark output
+    logging.getLogger().setLevel(logging.WARNING)
+    results = []
+    for rows in sorted(int(size) for size in args.sizes):
+        # large frames are slow enough that one run is representative
+        results.extend(bench_size(rows, args.repeat if rows <= 10 ** 5 else 1))
+
+    report = {'environment': environment(), 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for rows, stage, seconds, before in regressions:
+            print(f"REGRESSION {stage} at {rows} rows: {seconds * 1000:.2f} ms vs {before * 1000:.2f} ms baseline")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import logging
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# Bar length in seconds for every interval built from ticks
+INTERVAL_SECONDS = {
+    '1m': 60,
+    '5m': 300,
+    '15m': 900,
+    '30m': 1800,
+    '1h': 3600,
+}
+
+# Finalized bars kept per (symbol, interval)
+RING_CAPACITY = 2000
+
+# Finalized bars needed before a ring replaces the history download
+WARM_BARS = 100
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+class CandleRing:
+    """Fixed-capacity OHLCV bar buffer with a forming bar.
+
+    Bars are written once, one after the other, into backing arrays three
+    times the capacity long; when the end is reached the last `capacity`
+    bars are moved back to the front. The most recent bars are therefore
+    always one contiguous slice of the arrays. Reads are views, never copies:
+    each OHLCV column is a C-contiguous float64 row that talib consumes as
+    is, and `frame` wraps the same memory in a DataFrame. A view stays valid
+    for at least `capacity` new bars, since the slots it covers are only
+    written again after the next compaction has filled the free space, but
+    the forming bar in it keeps changing until it is finalized.
+    """
+
+    def __init__(self, capacity=RING_CAPACITY):
+        self.capacity = capacity
+        self.epochs = np.zeros(3 * capacity + 1, dtype=np.int64)
+        self.values = np.zeros((len(OHLCV_COLUMNS), 3 * capacity + 1), dtype=np.float64)
+        self.count = 0
+        # slot of the forming bar, right after the finalized ones
+        self.end = 0
+        self.forming = False
+        # epoch of the last finalized bar; ticks at or before it are late
+        self.last_epoch = None
+
+    def __len__(self):
+        return self.count
+
+    def _compact(self):
+        start = self.end - self.count
+        self.epochs[:self.count] = self.epochs[start:self.end]
+        self.values[:, :self.count] = self.values[:, start:self.end]
+        self.end = self.count
+
+    def start(self, epoch, price):
+        if self.end == len(self.epochs):
+            self._compact()
+        self.epochs[self.end] = epoch
+        self.values[:, self.end] = (price, price, price, price, 1.0)
+        self.forming = True
+
+    def update(self, price):
+        column = self.values[:, self.end]
+        column[1] = max(column[1], price)
+        column[2] = min(column[2], price)
+        column[3] = price
+        column[4] += 1.0
+
+    def finalize(self):
+        self.last_epoch = int(self.epochs[self.end])
+        self.end += 1
+        self.count = min(self.count + 1, self.capacity)
+        self.forming = False
+
+    @property
+    def forming_epoch(self):
+        return int(self.epochs[self.end]) if self.forming else None
+
+    def view(self, include_forming=True):
+        """Return (epochs, values) views over the bars, oldest first."""
+        stop = self.end + (1 if include_forming and self.forming else 0)
+        return self.epochs[self.end - self.count:stop], self.values[:, self.end - self.count:stop]
+
+
+class CandleAggregator:
+    """Builds OHLCV bars for several intervals from a stream of ticks.
+
+    Ticks are bucketed on UTC time boundaries of each interval. A bar is
+    finalized when the first tick of a later bucket arrives, or on read once
+    its bucket has ended. Ticks older than the previous tick of the symbol,
+    repeated ticks and ticks for a bar that is already finalized are dropped.
+    Deriv ticks carry no volume, so `Volume` is the number of ticks in the bar.
+    """
+
+    def __init__(self, intervals=INTERVAL_SECONDS, capacity=RING_CAPACITY, warm_bars=WARM_BARS):
+        self.intervals = dict(intervals)
+        self.capacity = capacity
+        self.warm_bars = warm_bars
+        self._rings = {}
+        self._last_ticks = {}
+        self._lock = threading.Lock()
+
+    def add_tick(self, symbol, price, epoch):
+        if price is None or epoch is None:
+            return
+        price = float(price)
+        epoch = int(epoch)
+        with self._lock:
+            last_tick = self._last_ticks.get(symbol)
+            if last_tick is not None and (epoch < last_tick[0] or (epoch, price) == last_tick):
+                logging.debug(f"Dropping out-of-order or duplicate tick for {symbol} at {epoch}")
+                return
+            self._last_ticks[symbol] = (epoch, price)
+            for interval, seconds in self.intervals.items():
+                ring = self._rings.get((symbol, interval))
+                if ring is None:
+                    ring = self._rings[(symbol, interval)] = CandleRing(self.capacity)
+                bucket = epoch - epoch % seconds
+                forming_epoch = ring.forming_epoch
+                if forming_epoch == bucket:
+                    ring.update(price)
+                    continue
+                # a bar finalized on read has no forming bar left to compare with
+                if (forming_epoch is not None and bucket < forming_epoch) or \
+                        (ring.last_epoch is not None and bucket <= ring.last_epoch):
+                    logging.debug(f"Dropping late tick for {symbol} at {epoch} in interval {interval}")
+                    continue
+                if forming_epoch is not None:
+                    ring.finalize()
+                ring.start(bucket, price)
+
+    def _roll(self, ring, seconds, now):
+        forming_epoch = ring.forming_epoch
+        if forming_epoch is not None and now >= forming_epoch + seconds:
+            ring.finalize()
+
+    def is_warm(self, symbol, interval):
+        with self._lock:
+            ring = self._rings.get((symbol, interval))
+            return ring is not None and len(ring) >= self.warm_bars
+
+    def _view(self, symbol, interval, include_forming, now):
+        with self._lock:
+            ring = self._rings.get((symbol, interval))
+            if ring is None:
+                return None
+            self._roll(ring, self.intervals[interval], time.time() if now is None else now)
+            epochs, values = ring.view(include_forming)
+        return (epochs, values) if len(epochs) else None
+
+    def arrays(self, symbol, interval, include_forming=True, now=None):
+        """Return (epochs, {column: values}) views for talib, or None if nothing was aggregated."""
+        view = self._view(symbol, interval, include_forming, now)
+        if view is None:
+            return None
+        epochs, values = view
+        return epochs, dict(zip(OHLCV_COLUMNS, values))
+
+    def frame(self, symbol, interval, include_forming=True, now=None):
+        """Return the bars as an OHLCV DataFrame sharing memory with the ring."""
+        view = self._view(symbol, interval, include_forming, now)
+        if view is None:
+            return None
+        epochs, values = view
+        # values.T is a view, and a single float64 block is not copied by pandas
+        data = pd.DataFrame(values.T, columns=OHLCV_COLUMNS, index=pd.to_datetime(epochs, unit='s'), copy=False)
+        data.index.name = 'timestamp'
+        # bars built from ticks have no missing or zero prices
+        data.attrs['source'] = 'ticks'
+        return data
+
+
+candle_aggregator = CandleAggregator()
@@ -0,0 +1,276 @@
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from history_store import history_store
+
+# Parquet needs pyarrow; fall back to pickle files when it is not installed
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+CACHE_DIR = os.environ.get(
+    'CANDLE_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.candle_cache'))
+
+# How much history to keep per interval; intervals not listed are kept forever
+RETENTION = {
+    '1m': timedelta(days=7),
+    '5m': timedelta(days=60),
+    '15m': timedelta(days=60),
+    '30m': timedelta(days=60),
+    '1h': timedelta(days=730),
+}
+
+# Top-ups only rewrite a tail file next to the main one; the main file is
+# rewritten, with the tail folded in, when the tail grows past this many bars
+# or when a backfill changes the bars before it
+TAIL_ROWS = 500
+
+# yf.download keeps its results in module-level state, one call at a time;
+# every module that downloads from yfinance holds this lock
+yf_download_lock = threading.Lock()
+
+
+class CandleStore:
+    """On-disk OHLCV store keyed by (source, symbol, interval).
+
+    Each key is one columnar file, plus a tail file holding the latest
+    top-ups until they are folded into it. `get` only asks the downloader for the
+    bars the file is missing (before its first stored bar, unless that is
+    beyond the retention window, and from its last one onwards), merges them
+    in, applies the retention window and returns the requested range.
+    The downloaded bars are also appended to `history`, a HistoryStore that
+    keeps them past the retention window; the store is its only writer.
+    """
+
+    def __init__(self, root=CACHE_DIR, retention=None, history=None):
+        self.root = root
+        self.retention = RETENTION if retention is None else retention
+        self.history = history
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self, keys):
+        """Hold the thread locks of `keys`; a lock is removed once no thread holds or waits for it."""
+        keys = sorted(set(keys))
+        with self._locks_lock:
+            entries = [self._locks.setdefault(key, [threading.Lock(), 0]) for key in keys]
+            for entry in entries:
+                entry[1] += 1
+        acquired = []
+        try:
+            for entry in entries:
+                entry[0].acquire()
+                acquired.append(entry)
+            yield
+        finally:
+            for entry in acquired:
+                entry[0].release()
+            with self._locks_lock:
+                for key, entry in zip(keys, entries):
+                    entry[1] -= 1
+                    if not entry[1]:
+                        del self._locks[key]
+
+    def path(self, source, symbol, interval):
+        name = f"{symbol}_{interval}".replace('/', '_').replace('=', '_')
+        extension = 'parquet' if CACHE_FORMAT == 'parquet' else 'pkl'
+        return os.path.join(self.root, source, f"{name}.{extension}")
+
+    def tail_path(self, source, symbol, interval):
+        root, extension = os.path.splitext(self.path(source, symbol, interval))
+        return f"{root}.tail{extension}"
+
+    @staticmethod
+    def _read(path):
+        if not os.path.exists(path):
+            return None
+        try:
+            if CACHE_FORMAT == 'parquet':
+                return pd.read_parquet(path)
+            return pd.read_pickle(path)
+        except Exception as e:
+            logging.warning(f"Discarding unreadable candle cache {path}: {e}")
+            return None
+
+    @staticmethod
+    def _write(path, data):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        if CACHE_FORMAT == 'parquet':
+            data.to_parquet(tmp_path)
+        else:
+            data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    def load(self, source, symbol, interval):
+        stored = self._read(self.path(source, symbol, interval))
+        tail = self._read(self.tail_path(source, symbol, interval))
+        if tail is None or stored is None:
+            return stored
+        merged = pd.concat([stored, tail])
+        # the tail holds the later versions of the bars it shares with the main file
+        return merged[~merged.index.duplicated(keep='last')].sort_index()
+
+    def save(self, source, symbol, interval, data, since=None):
+        """Store `data`; `since` is given when only the bars from it onwards changed."""
+        path = self.path(source, symbol, interval)
+        tail_path = self.tail_path(source, symbol, interval)
+        if since is not None and os.path.exists(path):
+            tail = self._read(tail_path)
+            if tail is not None and not tail.empty:
+                since = min(since, tail.index[0])
+            tail = data[data.index >= since]
+            if len(tail) <= TAIL_ROWS:
+                self._write(tail_path, tail)
+                return
+        # the tail goes first: if the main file is not written, its bars
+        # are just downloaded again by the next top-up
+        if os.path.exists(tail_path):
+            os.remove(tail_path)
+        self._write(path, data)
+
+    @staticmethod
+    def _since(stored, new_data):
+        """Return the last stored bar if `new_data` leaves the earlier ones unchanged, None otherwise."""
+        if stored is None or stored.empty:
+            return None
+        last = stored.index[-1]
+        # batch top-ups start at the earliest last bar of their symbols
+        earlier = new_data[new_data.index < last]
+        if not earlier.empty and not earlier.equals(stored.reindex(earlier.index)):
+            return None
+        return last
+
+    def merge(self, stored, new_data, interval):
+        if stored is None or stored.empty:
+            merged = new_data
+        elif new_data is None or new_data.empty:
+            merged = stored
+        else:
+            merged = pd.concat([stored, new_data])
+            # the last stored bar may have been incomplete, so new bars win
+            merged = merged[~merged.index.duplicated(keep='last')]
+            merged.sort_index(inplace=True)
+
+        retention = self.retention.get(interval)
+        if retention is not None and merged is not None and not merged.empty:
+            merged = merged[merged.index >= datetime.now() - retention]
+        return merged
+
+    def _fetch_ranges(self, stored, interval, start, end):
+        """Return the (start, end) ranges `stored` is missing; an end of None means up to the requested end."""
+        if stored is None or stored.empty:
+            return [(start, None)]
+        ranges = []
+        retention = self.retention.get(interval)
+        # a store trimmed by its retention window never reaches further back
+        beyond_retention = retention is not None and start < datetime.now() - retention
+        if stored.index[0] > start and not beyond_retention:
+            ranges.append((start, stored.index[0]))
+        if end is None or stored.index[-1] < end:
+            ranges.append((stored.index[-1], None))
+        return ranges
+
+    def _archive(self, symbol, interval, merged, new_data):
+        """Append the downloaded bars to the history store, seeding it with `merged` if it is empty."""
+        if self.history is None or new_data is None or new_data.empty:
+            return
+        try:
+            if not len(self.history.open(symbol, interval)):
+                new_data = merged
+            self.history.append(symbol, interval, new_data)
+        except OSError as e:
+            # the cache is still served, only the history misses the bars
+            logging.error(f"Error archiving the history of {symbol} at interval {interval}: {e}")
+
+    @staticmethod
+    def _concat(parts):
+        parts = [part for part in parts if part is not None and not part.empty]
+        if not parts:
+            return None
+        return parts[0] if len(parts) == 1 else pd.concat(parts)
+
+    @staticmethod
+    def _slice(merged, start, end):
+        if merged is None or merged.empty:
+            return None
+        data = merged[merged.index >= start]
+        if end is not None:
+            data = data[data.index < end]
+        return data if not data.empty else None
+
+    def get(self, source, symbol, interval, start_date, end_date, downloader):
+        """Return bars in [start_date, end_date), topping up the store via `downloader(start, end)`."""
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) if end_date is not None else None
+
+        with self._locked([(source, symbol, interval)]):
+            stored = self.load(source, symbol, interval)
+            ranges = self._fetch_ranges(stored, interval, start, end)
+            if not ranges:
+                logging.info(f"Serving {symbol} at interval {interval} from candle cache")
+            for fetch_start, fetch_end in ranges:
+                logging.info(f"Topping up candle cache for {symbol} at interval {interval} from {fetch_start}"
+                             + (f" to {fetch_end}" if fetch_end is not None else ""))
+            new_data = self._concat([downloader(fetch_start, end_date if fetch_end is None else fetch_end)
+                                     for fetch_start, fetch_end in ranges])
+
+            merged = self.merge(stored, new_data, interval)
+            if new_data is not None and not new_data.empty:
+                self.save(source, symbol, interval, merged, self._since(stored, new_data))
+            self._archive(symbol, interval, merged, new_data)
+
+        return self._slice(merged, start, end)
+
+    def get_many(self, source, symbols, interval, start_date, end_date, downloader):
+        """Batch version of `get`; `downloader(symbols, start, end)` returns {symbol: bars}.
+
+        The symbols that need a backfill are downloaded in one call spanning
+        all their missing ranges, and so are those that need a top-up.
+        Returns {symbol: bars or None}.
+        """
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date) if end_date is not None else None
+        with self._locked([(source, symbol, interval) for symbol in symbols]):
+            stored = {symbol: self.load(source, symbol, interval) for symbol in symbols}
+            ranges = {symbol: self._fetch_ranges(stored[symbol], interval, start, end) for symbol in symbols}
+
+            # one download for the backfills and one for the top-ups, each
+            # spanning the ranges of all the symbols that need it
+            downloads = {}
+            for backfill in (True, False):
+                needed = {}
+                for symbol, symbol_ranges in ranges.items():
+                    for fetch_start, fetch_end in symbol_ranges:
+                        if (fetch_end is not None) == backfill:
+                            needed[symbol] = (fetch_start, fetch_end)
+                if not needed:
+                    continue
+                fetch_start = min(fetch_start for fetch_start, _ in needed.values())
+                fetch_end = max(fetch_end for _, fetch_end in needed.values()) if backfill else end_date
+                logging.info(f"{'Backfilling' if backfill else 'Topping up'} candle cache for {len(needed)} symbols "
+                             f"at interval {interval} from {fetch_start}")
+                downloaded = downloader(list(needed), fetch_start, fetch_end) or {}
+                for symbol in needed:
+                    downloads.setdefault(symbol, []).append(downloaded.get(symbol))
+
+            results = {}
+            for symbol in symbols:
+                new_data = self._concat(downloads.get(symbol, []))
+                merged = self.merge(stored[symbol], new_data, interval)
+                if new_data is not None and not new_data.empty:
+                    self.save(source, symbol, interval, merged, self._since(stored[symbol], new_data))
+                self._archive(symbol, interval, merged, new_data)
+                results[symbol] = self._slice(merged, start, end)
+        return results
+
+
+candle_store = CandleStore(history=history_store)
@@ -0,0 +1,2 @@
+# Lets the tests under tests/ import the top-level modules of the app: pytest
+# puts the directory of this conftest on sys.path.
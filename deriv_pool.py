@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import threading
+import time
+
+from deriv_api import DerivAPI
+from deriv_api.errors import ResponseError
+from websockets.exceptions import ConnectionClosed
+
+# Seconds between keep-alive pings on every pooled connection
+PING_INTERVAL = 30
+
+# Seconds without a request after which a connection with no live
+# subscription is closed and removed from the pool
+IDLE_TIMEOUT = 600
+
+# Host of the Deriv websocket API; DerivAPI builds the full URL from it
+DERIV_ENDPOINT = 'ws.derivws.com'
+
+# Errors of a broken connection, after which a request is sent again on a new one
+TRANSPORT_ERRORS = (ConnectionClosed, OSError, asyncio.TimeoutError)
+
+# Requests that must not be sent twice: the first one may have been executed
+# before the connection broke
+NON_IDEMPOTENT_REQUESTS = frozenset([
+    'buy', 'sell', 'cancel', 'contract_update', 'proposal', 'topup_virtual', 'transfer_between_accounts',
+])
+
+
+class PooledDerivConnection:
+    """Handle to a pooled DerivAPI connection.
+
+    Flask runs every async view in its own short-lived event loop, while the
+    websocket behind a DerivAPI object is bound to the loop it was opened on.
+    The handle therefore forwards each call to the pool's loop and awaits the
+    result from the caller's loop, so it can be passed anywhere a DerivAPI
+    object was used before (e.g. `fetch_deriv_data`).
+    """
+
+    def __init__(self, pool, key):
+        self._pool = pool
+        self._key = key
+
+    async def send(self, request):
+        return await self._pool.run(self._pool._send(self._key, request))
+
+    async def subscribe(self, request):
+        return await self._pool.run(self._pool._subscribe(self._key, request))
+
+    async def forget(self, subscription_id):
+        return await self._pool.run(self._pool._forget(self._key, subscription_id))
+
+
+class DerivConnectionPool:
+    """Process-wide pool of long-lived, authorized DerivAPI connections.
+
+    Connections are keyed by (app_id, api_token), kept alive with periodic
+    pings and transparently reopened when a ping fails or the connection
+    breaks during a request. Only requests in NON_IDEMPOTENT_REQUESTS are
+    not sent again then. Connections unused for `idle_timeout` seconds, and
+    without subscriptions, are closed by the keep-alive loop.
+    """
+
+    def __init__(self, ping_interval=PING_INTERVAL, idle_timeout=IDLE_TIMEOUT):
+        self.ping_interval = ping_interval
+        self.idle_timeout = idle_timeout
+        self._connections = {}
+        self._last_used = {}
+        self._connect_locks = {}
+        self._loop = None
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop, name='deriv-pool', daemon=True)
+                self._thread.start()
+        return self._loop
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.create_task(self._keepalive())
+        self._loop.run_forever()
+
+    def submit(self, coro):
+        """Schedule `coro` on the pool loop and return a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def call_soon(self, callback, *args):
+        """Run a plain callback on the pool loop, e.g. to dispose a subscription."""
+        self._ensure_loop().call_soon_threadsafe(callback, *args)
+
+    def run(self, coro):
+        """Schedule `coro` on the pool loop and return an awaitable for the caller's loop."""
+        return asyncio.wrap_future(self.submit(coro))
+
+    async def acquire(self, app_id, api_token):
+        """Return a handle to an authorized connection, opening one if needed."""
+        key = (str(app_id), api_token)
+        await self.run(self._use(key))
+        return PooledDerivConnection(self, key)
+
+    async def _use(self, key):
+        # only callers' requests count as use, not the keep-alive reconnects
+        self._last_used[key] = time.monotonic()
+        return await self._get(key)
+
+    async def _get(self, key):
+        api = self._connections.get(key)
+        if api is not None:
+            return api
+        lock = self._connect_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            api = self._connections.get(key)
+            if api is None:
+                api = await self._connect(*key)
+                self._connections[key] = api
+        return api
+
+    async def _connect(self, app_id, api_token):
+        api = DerivAPI(app_id=app_id, endpoint=DERIV_ENDPOINT)
+        await api.api_connect()
+        try:
+            await api.authorize(api_token)
+        except ResponseError as e:
+            await api.disconnect()
+            raise ConnectionError(f"DerivAPI authorization failed: {e}")
+        logging.info(f"Opened pooled DerivAPI connection for app_id {app_id}")
+        return api
+
+    async def _drop(self, key):
+        api = self._connections.pop(key, None)
+        if api is not None:
+            try:
+                await api.disconnect()
+            except Exception as e:
+                logging.debug(f"Error closing DerivAPI connection for app_id {key[0]}: {e}")
+
+    def _idle(self, key, api):
+        if api.subscription_manager.sources:
+            # the subscriptions stream on this connection until they are disposed
+            return False
+        return time.monotonic() - self._last_used.get(key, 0) > self.idle_timeout
+
+    async def _evict(self, key):
+        logging.info(f"Closing idle DerivAPI connection for app_id {key[0]}")
+        await self._drop(key)
+        self._last_used.pop(key, None)
+        self._connect_locks.pop(key, None)
+
+    async def _send(self, key, request):
+        # connection and authorization errors, like API errors, reach the caller unchanged
+        api = await self._use(key)
+        try:
+            return await api.send(dict(request))
+        except TRANSPORT_ERRORS as e:
+            await self._drop(key)
+            if NON_IDEMPOTENT_REQUESTS.intersection(request):
+                logging.warning(f"DerivAPI connection for app_id {key[0]} broke during a "
+                                f"{'/'.join(NON_IDEMPOTENT_REQUESTS.intersection(request))} request: {e}")
+                raise
+            logging.warning(f"DerivAPI connection for app_id {key[0]} broke, reconnecting: {e}")
+            return await (await self._get(key)).send(dict(request))
+
+    async def _subscribe(self, key, request):
+        return await (await self._use(key)).subscribe(dict(request))
+
+    async def _forget(self, key, subscription_id):
+        return await (await self._use(key)).forget(subscription_id)
+
+    async def _keepalive(self):
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            for key, api in list(self._connections.items()):
+                if self._idle(key, api):
+                    await self._evict(key)
+                    continue
+                try:
+                    await api.ping()
+                except Exception as e:
+                    logging.warning(f"Ping failed for app_id {key[0]}, reconnecting: {e}")
+                    await self._drop(key)
+                    try:
+                        await self._get(key)
+                    except Exception as e:
+                        logging.error(f"Failed to reconnect to DerivAPI: {e}")
+
+    async def close(self):
+        for key in list(self._connections):
+            await self.run(self._drop(key))
+
+
+deriv_pool = DerivConnectionPool()
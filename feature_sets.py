@@ -0,0 +1,101 @@
+import logging
+
+import pandas as pd
+import talib
+from talib import abstract
+
+# A feature set maps a feature name to the talib function that computes it:
+#
+#   'function': talib function name
+#   'params':   keyword parameters for the function (defaults to talib's)
+#   'outputs':  column names for the function outputs (defaults to [name])
+#   'inputs':   input column names in positional order; these may be columns
+#               produced by other features in the set (defaults to the OHLCV
+#               columns talib expects, e.g. ['High', 'Low', 'Close'])
+#
+# Only the listed features are computed, in dependency order, and identical
+# (function, params, inputs) nodes are computed once and shared.
+
+# Indicators read by signal_conditions() and generate_trade_signals()
+SIGNAL_FEATURES = {
+    'EMA_50': {'function': 'EMA', 'params': {'timeperiod': 50}},
+    'RSI': {'function': 'RSI', 'params': {'timeperiod': 14}},
+    'MACD': {'function': 'MACD', 'params': {'fastperiod': 12, 'slowperiod': 26, 'signalperiod': 9},
+             'outputs': ['MACD', 'MACD_Signal', 'MACD_Hist']},
+    'BBANDS': {'function': 'BBANDS', 'params': {'timeperiod': 20},
+               'outputs': ['Upper_BB', 'Middle_BB', 'Lower_BB']},
+    'STOCH': {'function': 'STOCH', 'params': {'fastk_period': 14, 'slowk_period': 3, 'slowd_period': 3},
+              'outputs': ['Stoch_K', 'Stoch_D']},
+    'ATR': {'function': 'ATR', 'params': {'timeperiod': 14}},
+    'OBV': {'function': 'OBV'},
+}
+
+
+def _default_inputs(function_name):
+    inputs = []
+    for value in abstract.Function(function_name).input_names.values():
+        inputs.extend(value if isinstance(value, list) else [value])
+    return [name.capitalize() for name in inputs]
+
+
+def resolve_feature_set(feature_set):
+    """Return the features of `feature_set` as (name, function, params, inputs, outputs) in dependency order."""
+    nodes = {}
+    producers = {}
+    for name, spec in feature_set.items():
+        function_name = spec['function'].upper()
+        if function_name not in talib.__TA_FUNCTION_NAMES__:
+            raise ValueError(f"Feature {name} uses unknown talib function {function_name}")
+        inputs = list(spec.get('inputs') or _default_inputs(function_name))
+        outputs = list(spec.get('outputs') or [name])
+        nodes[name] = (name, function_name, dict(spec.get('params', {})), inputs, outputs)
+        for column in outputs:
+            producers[column] = name
+
+    ordered = []
+    state = {}
+
+    def visit(name):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"Feature set has a dependency cycle through {name}")
+        state[name] = 'visiting'
+        for column in nodes[name][3]:
+            if column in producers and producers[column] != name:
+                visit(producers[column])
+        state[name] = 'done'
+        ordered.append(nodes[name])
+
+    for name in nodes:
+        visit(name)
+    return ordered
+
+
+def compute_feature_columns(data, feature_set=SIGNAL_FEATURES):
+    """Return {column: values} for `feature_set`; `data` is a DataFrame or a dict of arrays."""
+    columns = {}
+    computed = {}
+
+    for name, function_name, params, inputs, outputs in resolve_feature_set(feature_set):
+        key = (function_name, tuple(sorted(params.items())), tuple(inputs))
+        if key not in computed:
+            args = [columns[column] if column in columns else data[column] for column in inputs]
+            result = getattr(talib, function_name)(*args, **params)
+            computed[key] = result if isinstance(result, tuple) else (result,)
+        else:
+            logging.debug(f"Reusing {function_name} result for feature {name}")
+
+        results = computed[key]
+        if len(results) != len(outputs):
+            raise ValueError(f"Feature {name} names {len(outputs)} outputs but {function_name} returns {len(results)}")
+        for column, values in zip(outputs, results):
+            columns[column] = values
+    return columns
+
+
+def compute_features(data, feature_set=SIGNAL_FEATURES):
+    """Return a copy of `data` with the columns of `feature_set` added."""
+    columns = compute_feature_columns(data, feature_set)
+    data = data.drop(columns=[column for column in columns if column in data.columns])
+    return pd.concat([data, pd.DataFrame(columns, index=data.index)], axis=1)
@@ -0,0 +1,249 @@
+import logging
+import os
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# Appends are serialized across processes with flock; without fcntl
+# (Windows) they are only serialized within one process
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from candle_aggregator import OHLCV_COLUMNS
+
+HISTORY_DIR = os.environ.get(
+    'HISTORY_STORE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.history'))
+
+# One epoch in this many is kept in the in-memory sparse index
+INDEX_STRIDE = 4096
+
+EPOCH_FILE = 'epoch.i64'
+INDEX_FILE = 'index.i64'
+LOCK_FILE = '.lock'
+
+
+def _field_file(column):
+    return f"{column.lower()}.f64"
+
+
+def epoch(value):
+    """Return a date string, datetime or Timestamp as int64 epoch seconds (UTC)."""
+    timestamp = pd.Timestamp(value)
+    if timestamp.tz is not None:
+        timestamp = timestamp.tz_convert('UTC').tz_localize(None)
+    return int(timestamp.value // 10**9)
+
+
+def _epochs(data):
+    """Return the index of `data` as int64 epoch seconds (UTC)."""
+    index = pd.DatetimeIndex(data.index)
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+    return index.values.astype('datetime64[s]').astype(np.int64)
+
+
+class History:
+    """Read-only memory-mapped view of the bars of one (symbol, interval).
+
+    `epochs` and every OHLCV column are np.memmap arrays over the files of
+    the store, so slicing them reads only the touched pages and never copies.
+    The view covers the bars stored when it was opened; bars appended later
+    need a new view.
+    """
+
+    def __init__(self, directory, length, index):
+        self.length = length
+        self.index = index
+        if length:
+            self.epochs = np.memmap(os.path.join(directory, EPOCH_FILE), dtype=np.int64, mode='r', shape=(length,))
+            self.columns = {column: np.memmap(os.path.join(directory, _field_file(column)), dtype=np.float64,
+                                              mode='r', shape=(length,))
+                            for column in OHLCV_COLUMNS}
+        else:
+            self.epochs = np.empty(0, dtype=np.int64)
+            self.columns = {column: np.empty(0, dtype=np.float64) for column in OHLCV_COLUMNS}
+
+    def __len__(self):
+        return self.length
+
+    def locate(self, epoch, side='left'):
+        """Return the position of `epoch` like np.searchsorted, in O(log n) page reads.
+
+        The sparse index narrows the search to one INDEX_STRIDE block of the
+        epoch file, so only that block is paged in.
+        """
+        block = int(np.searchsorted(self.index, epoch, side))
+        low = max(block - 1, 0) * INDEX_STRIDE
+        high = min(block * INDEX_STRIDE + 1, self.length)
+        return low + int(np.searchsorted(self.epochs[low:high], epoch, side))
+
+    def bounds(self, start=None, end=None):
+        """Return the (first, stop) positions of the bars in [start, end) epoch seconds."""
+        first = 0 if start is None else self.locate(start)
+        stop = self.length if end is None else self.locate(end)
+        return first, max(first, stop)
+
+    def arrays(self, start=None, end=None):
+        """Return (epochs, {column: values}) views over the bars in [start, end) for talib."""
+        first, stop = self.bounds(start, end)
+        return self.epochs[first:stop], {column: values[first:stop] for column, values in self.columns.items()}
+
+    def frame(self, start=None, end=None):
+        """Return the bars in [start, end) as an OHLCV DataFrame; unlike `arrays` this copies."""
+        epochs, columns = self.arrays(start, end)
+        data = pd.DataFrame({column: np.asarray(values) for column, values in columns.items()},
+                            index=pd.to_datetime(np.asarray(epochs), unit='s'))
+        data.index.name = 'timestamp'
+        return data
+
+
+class HistoryStore:
+    """Append-only columnar bar history keyed by (symbol, interval).
+
+    Each key is a directory holding one contiguous float64 file per OHLCV
+    column and an int64 file of bar epochs in seconds, all raw arrays that
+    are memory-mapped on read. A sparse index of every INDEX_STRIDE-th epoch
+    is kept next to them, so a time range is located with two binary
+    searches instead of loading the history. Writers only ever append, or
+    rewrite the last bar while it is still forming, under a file lock that
+    also holds off other processes.
+    """
+
+    def __init__(self, root=HISTORY_DIR):
+        self.root = root
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _lock(self, key):
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    @contextmanager
+    def _locked(self, symbol, interval, directory):
+        """Hold the key's thread lock and, where fcntl exists, an exclusive flock on its directory.
+
+        Several gunicorn or SocketIO worker processes may append to one key,
+        and a reader that finds a longer column truncates it, so both need
+        the file lock and not only the thread lock.
+        """
+        with self._lock((symbol, interval)):
+            if fcntl is None:
+                yield
+                return
+            with open(os.path.join(directory, LOCK_FILE), 'a') as f:
+                fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def path(self, symbol, interval):
+        name = f"{symbol}_{interval}".replace('/', '_').replace('=', '_')
+        return os.path.join(self.root, name)
+
+    @staticmethod
+    def _length(directory):
+        """Return the number of complete bars, dropping columns an interrupted append left longer."""
+        epoch_path = os.path.join(directory, EPOCH_FILE)
+        if not os.path.exists(epoch_path):
+            return 0
+        # the epoch file is written last, so it only counts bars that are complete in every column
+        length = os.path.getsize(epoch_path) // 8
+        if os.path.getsize(epoch_path) != length * 8:
+            os.truncate(epoch_path, length * 8)
+        for column in OHLCV_COLUMNS:
+            path = os.path.join(directory, _field_file(column))
+            if os.path.getsize(path) != length * 8:
+                logging.warning(f"Truncating {path} to {length} bars after an interrupted append")
+                os.truncate(path, length * 8)
+        return length
+
+    @staticmethod
+    def _index(directory, length):
+        """Return the sparse index for `length` bars, rebuilding it if an append was interrupted."""
+        path = os.path.join(directory, INDEX_FILE)
+        entries = -(-length // INDEX_STRIDE)
+        index = np.fromfile(path, dtype=np.int64) if os.path.exists(path) else np.empty(0, dtype=np.int64)
+        if len(index) < entries:
+            epochs = np.memmap(os.path.join(directory, EPOCH_FILE), dtype=np.int64, mode='r', shape=(length,))
+            index = np.array(epochs[::INDEX_STRIDE])
+            index.tofile(path)
+        return index[:entries]
+
+    def open(self, symbol, interval):
+        """Return a History view of the stored bars (empty if there are none)."""
+        directory = self.path(symbol, interval)
+        if not os.path.isdir(directory):
+            return History(directory, 0, np.empty(0, dtype=np.int64))
+        with self._locked(symbol, interval, directory):
+            length = self._length(directory)
+            index = self._index(directory, length) if length else np.empty(0, dtype=np.int64)
+        return History(directory, length, index)
+
+    def arrays(self, symbol, interval, start=None, end=None):
+        """Return (epochs, {column: values}) memory-mapped views of the bars in [start, end)."""
+        return self.open(symbol, interval).arrays(start, end)
+
+    def append(self, symbol, interval, data):
+        """Append the bars of the OHLCV DataFrame `data` that are newer than the stored ones.
+
+        A bar at the last stored epoch replaces it, since it may have been
+        incomplete; older bars are ignored. Returns the number of bars written.
+        """
+        if data is None or data.empty:
+            return 0
+        epochs = _epochs(data)
+        order = np.argsort(epochs, kind='stable')
+        epochs = epochs[order]
+        # the last of several bars with the same epoch wins
+        keep = np.append(epochs[1:] != epochs[:-1], True)
+        epochs = epochs[keep]
+        # a missing column (Deriv candles have no volume) is stored as NaN
+        values = {column: (data[column].to_numpy(dtype=np.float64) if column in data
+                           else np.full(len(data), np.nan))[order][keep]
+                  for column in OHLCV_COLUMNS}
+
+        directory = self.path(symbol, interval)
+        os.makedirs(directory, exist_ok=True)
+        with self._locked(symbol, interval, directory):
+            length = self._length(directory)
+            last = None
+            if length:
+                last = int(np.memmap(os.path.join(directory, EPOCH_FILE), dtype=np.int64, mode='r',
+                                     offset=(length - 1) * 8, shape=(1,))[0])
+                skipped = int(np.count_nonzero(epochs < last))
+                if skipped:
+                    logging.debug(f"Ignoring {skipped} bars older than the stored history of {symbol} {interval}")
+
+            written = 0
+            position = int(np.searchsorted(epochs, last)) if last is not None else 0
+            if last is not None and position < len(epochs) and epochs[position] == last:
+                for column in OHLCV_COLUMNS:
+                    with open(os.path.join(directory, _field_file(column)), 'r+b') as f:
+                        f.seek((length - 1) * 8)
+                        f.write(values[column][position:position + 1].tobytes())
+                written = 1
+
+            first = 0 if last is None else int(np.searchsorted(epochs, last, 'right'))
+            if first < len(epochs):
+                index = self._index(directory, length) if length else np.empty(0, dtype=np.int64)
+                for column in OHLCV_COLUMNS:
+                    with open(os.path.join(directory, _field_file(column)), 'ab') as f:
+                        f.write(values[column][first:].tobytes())
+                with open(os.path.join(directory, EPOCH_FILE), 'ab') as f:
+                    f.write(epochs[first:].tobytes())
+                # new index entries for the stride boundaries the appended bars cross
+                positions = np.arange(len(index) * INDEX_STRIDE, length + len(epochs) - first, INDEX_STRIDE)
+                np.append(index, epochs[first:][positions - length]).tofile(os.path.join(directory, INDEX_FILE))
+                written += len(epochs) - first
+
+        if written:
+            logging.info(f"Appended {written} bars to the history of {symbol} at interval {interval}")
+        return written
+
+
+history_store = HistoryStore()
@@ -0,0 +1,117 @@
+import copy
+import logging
+import threading
+
+import numpy as np
+from talib import stream
+
+from feature_sets import SIGNAL_FEATURES, resolve_feature_set
+
+NaN = float('nan')
+
+BAR_COLUMNS = ['High', 'Low', 'Close', 'Volume']
+
+
+def signal_conditions(values):
+    """Buy conditions used by process_data; `values` is a DataFrame or a dict of scalars."""
+    return [
+        (values['EMA_50'] > values['Close']),
+        (values['RSI'] < 30),
+        (values['MACD_Hist'] > 0),
+        (values['Close'] < values['Lower_BB']),
+        (values['Stoch_K'] < values['Stoch_D']),
+    ]
+
+
+class _IndicatorState:
+    """Recursive state of every indicator process_data reads.
+
+    Each feature of the set is a talib.stream indicator, which steps the
+    TA-Lib recursions one bar at a time and gives the same values as the
+    batch functions compute_features calls.
+    """
+
+    def __init__(self, feature_set=SIGNAL_FEATURES):
+        self.features = []
+        for name, function_name, params, inputs, outputs in resolve_feature_set(feature_set):
+            if function_name not in stream.INDICATORS:
+                raise ValueError(f"Feature {name} uses {function_name}, which has no streaming indicator")
+            self.features.append((getattr(stream, function_name)(**params), inputs, outputs))
+        self.signal = None
+
+    def step(self, high, low, close, volume):
+        values = {'High': high, 'Low': low, 'Close': close, 'Volume': volume}
+        for indicator, inputs, outputs in self.features:
+            result = indicator.update(*[values[column] for column in inputs])
+            values.update(zip(outputs, result if isinstance(result, tuple) else (result,)))
+
+        signal = 1 if all(signal_conditions(values)) else 0
+        values['Signal'] = signal
+        values['Position'] = NaN if self.signal is None else float(signal - self.signal)
+        self.signal = signal
+        return values
+
+
+class IndicatorEngine:
+    """Incremental indicators for one (symbol, interval).
+
+    Every bar except the most recent one is folded into the committed state
+    exactly once. The most recent bar may still be forming, so it is applied
+    to a copy of the state and recomputed on the next call. If the history
+    before the newest bars is rewritten, the engine replays from scratch.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._state = _IndicatorState()
+        self._last_index = None
+        self._last_bar = None
+
+    def update(self, data):
+        """Return the indicator row for the last bar of `data` as a Series."""
+        with self._lock:
+            if data is None or data.empty:
+                return None
+
+            pending = data
+            if self._last_index is not None:
+                if self._history_matches(data):
+                    pending = data[data.index > self._last_index]
+                if pending is data or pending.empty:
+                    logging.info("History changed under the indicator engine, replaying")
+                    self._reset()
+                    pending = data
+
+            bars = pending[BAR_COLUMNS].to_numpy(dtype=float)
+            for bar in bars[:-1]:
+                self._state.step(*bar.tolist())
+            if len(bars) > 1:
+                self._last_index = pending.index[-2]
+                self._last_bar = bars[-2]
+
+            values = copy.deepcopy(self._state).step(*bars[-1].tolist())
+            row = data.iloc[-1].copy()
+            for name, value in values.items():
+                row[name] = value
+            return row
+
+    def _history_matches(self, data):
+        if self._last_index not in data.index:
+            return False
+        committed = data.loc[self._last_index, BAR_COLUMNS].to_numpy(dtype=float)
+        return np.array_equal(committed, self._last_bar)
+
+
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def get_indicator_engine(symbol, interval):
+    with _engines_lock:
+        engine = _engines.get((symbol, interval))
+        if engine is None:
+            engine = _engines[(symbol, interval)] = IndicatorEngine()
+        return engine
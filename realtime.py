@@ -1,16 +1,20 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from flask_socketio import SocketIO
+from flask_socketio import SocketIO, emit
 import yfinance as yf
 import pandas as pd
-import talib
 import numpy as np
-from ta import add_all_ta_features
 from ta.utils import dropna
 import logging
 from datetime import datetime, timedelta
 import asyncio
-from deriv_api import DerivAPI
+from concurrent.futures import ThreadPoolExecutor
+from deriv_pool import deriv_pool
+from candle_cache import candle_store, yf_download_lock
+from candle_aggregator import candle_aggregator
+from indicator_engine import get_indicator_engine, signal_conditions
+from feature_sets import SIGNAL_FEATURES, compute_features
+from tick_stream import TickStreamManager
 
 # Setup logging
 logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -19,19 +23,34 @@ app = Flask(__name__)
 CORS(app)
 socketio = SocketIO(app, cors_allowed_origins="*")
 
+# Maximum number of concurrent fetches per data source
+FETCH_CONCURRENCY = {
+    'yfinance': 6,
+    'deriv': 6,
+}
+yf_executor = ThreadPoolExecutor(max_workers=FETCH_CONCURRENCY['yfinance'], thread_name_prefix='yfinance')
+
+# History window and intervals analysed for every symbol
+START_DATE = '2023-06-30'
+END_DATE = '2024-06-30'
+INTERVALS = ['3mo', '1mo', '1wk', '1d', '1h', '30m']
+
+# Upper bound on the symbols accepted by one /api/signals request
+MAX_BATCH_SYMBOLS = 500
+
 @socketio.on('connect')
 def handle_connect():
     print('Client connected')
 
 @socketio.on('disconnect')
 def handle_disconnect():
+    tick_streams.unsubscribe_all(request.sid)
     print('Client disconnected')
 
 # Deriv Connection
 async def initialize_deriv_api(app_id, api_token):
     try:
-        api = DerivAPI(app_id=app_id, endpoint=f'wss://ws.derivws.com/websockets/v3?app_id={app_id}&auth_token={api_token}')
-        await api.api_connect()
+        api = await deriv_pool.acquire(app_id, api_token)
         logging.info("Successfully connected to DerivAPI")
         return api
     except Exception as e:
@@ -123,14 +142,18 @@ def recommend_lot_size(probability, account_balance):
     lot_size = account_balance * risk_per_trade * lot_size_factor
     return round(lot_size, 2)
 
-def download_data(ticker_symbol, interval, start_date, end_date, retries=3):
+def download_yf_data(ticker_symbol, interval, start_date, end_date, retries=3):
     logging.info(f"Downloading data for {ticker_symbol} from {start_date} to {end_date} with interval {interval}")
     for attempt in range(retries):
         try:
-            data = yf.download(ticker_symbol, start=start_date, end=end_date, interval=interval)
+            # yf.download keeps its results in module-level state, so concurrent
+            # calls for the same ticker clobber each other; Ticker.history does not
+            data = yf.Ticker(ticker_symbol).history(start=start_date, end=end_date, interval=interval, actions=False)
             if data.empty:
                 logging.warning(f"No data available for {ticker_symbol} at interval {interval} on attempt {attempt + 1}")
                 continue
+            if data.index.tz is not None:
+                data.index = data.index.tz_localize(None)
             logging.info(f"Successfully downloaded data for {ticker_symbol} at interval {interval} on attempt {attempt + 1}")
             return data
         except Exception as e:
@@ -138,7 +161,109 @@ def download_data(ticker_symbol, interval, start_date, end_date, retries=3):
     logging.error(f"Failed to download data for {ticker_symbol} after {retries} attempts")
     return None
 
-def process_data(data_frames):
+def download_data(ticker_symbol, interval, start_date, end_date, retries=3):
+    # Only bars newer than the last cached one are downloaded
+    return candle_store.get('yfinance', ticker_symbol, interval, start_date, end_date,
+                            lambda start, end: download_yf_data(ticker_symbol, interval, start, end, retries))
+
+def download_yf_batch(ticker_symbols, interval, start_date, end_date, retries=3):
+    logging.info(f"Downloading data for {len(ticker_symbols)} tickers from {start_date} to {end_date} with interval {interval}")
+    results = {}
+    missing = list(ticker_symbols)
+    for attempt in range(retries):
+        try:
+            with yf_download_lock:
+                data = yf.download(missing, start=start_date, end=end_date, interval=interval, group_by='ticker',
+                                   auto_adjust=True, actions=False, progress=False,
+                                   threads=FETCH_CONCURRENCY['yfinance'], multi_level_index=True)
+            results.update(split_yf_batch(data, missing, interval))
+        except Exception as e:
+            logging.error(f"Error downloading data for {len(missing)} tickers at interval {interval} on attempt {attempt + 1}: {e}")
+        missing = [ticker_symbol for ticker_symbol in missing if ticker_symbol not in results]
+        if not missing:
+            break
+    if missing:
+        logging.error(f"Failed to download data for {len(missing)} tickers after {retries} attempts")
+    return results
+
+def split_yf_batch(data, ticker_symbols, interval):
+    """Split a multi-ticker yf.download frame into one OHLCV frame per ticker."""
+    results = {}
+    if data is None or data.empty:
+        return results
+    if data.index.tz is not None:
+        data.index = data.index.tz_localize(None)
+    tickers = set(data.columns.get_level_values(0))
+    for ticker_symbol in ticker_symbols:
+        frame = data[ticker_symbol].dropna(how='all') if ticker_symbol in tickers else None
+        if frame is None or frame.empty:
+            logging.warning(f"No data available for {ticker_symbol} at interval {interval}")
+            continue
+        frame.columns.name = None
+        results[ticker_symbol] = frame
+    return results
+
+def download_batch(ticker_symbols, interval, start_date, end_date):
+    # Tickers already cached up to end_date are not downloaded again
+    return candle_store.get_many('yfinance', ticker_symbols, interval, start_date, end_date, lambda tickers, start, end: download_yf_batch(tickers, interval, start, end))
+
+async def fetch_interval_data(api, symbol, ticker_symbol, interval, start_date, end_date, deriv_semaphore):
+    if candle_aggregator.is_warm(symbol, interval):
+        # intraday bars built from the live tick stream need no download
+        logging.info(f"Using streamed candles for {symbol} at interval {interval}")
+        return candle_aggregator.frame(symbol, interval)
+    loop = asyncio.get_running_loop()
+    yf_data = await loop.run_in_executor(yf_executor, download_data, ticker_symbol, interval, start_date, end_date)
+    deriv_data = None
+    if yf_data is None or len(yf_data) < 50:
+        async with deriv_semaphore:
+            deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, 'latest')
+    return combine_data(yf_data, deriv_data)
+
+async def fetch_all_intervals(api, symbol, ticker_symbol, intervals, start_date, end_date):
+    deriv_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY['deriv'])
+    results = await asyncio.gather(*(
+        fetch_interval_data(api, symbol, ticker_symbol, interval, start_date, end_date, deriv_semaphore)
+        for interval in intervals))
+
+    data_frames = {}
+    for interval, combined_data in zip(intervals, results):
+        if combined_data is not None and not combined_data.empty:
+            data_frames[interval] = combined_data
+    return data_frames
+
+async def fetch_batch(api, symbols, intervals, start_date, end_date):
+    """Return {symbol: {interval: data}}; yfinance is hit once per interval for all symbols."""
+    loop = asyncio.get_running_loop()
+    ticker_symbols = {symbol: f'{symbol}=X' for symbol in symbols}
+    yf_results = await asyncio.gather(*(
+        loop.run_in_executor(yf_executor, download_batch, list(ticker_symbols.values()), interval, start_date, end_date)
+        for interval in intervals))
+
+    data_frames = {symbol: {} for symbol in symbols}
+    for interval, downloaded in zip(intervals, yf_results):
+        for symbol in symbols:
+            if candle_aggregator.is_warm(symbol, interval):
+                data_frames[symbol][interval] = candle_aggregator.frame(symbol, interval)
+            else:
+                data_frames[symbol][interval] = downloaded.get(ticker_symbols[symbol])
+
+    deriv_semaphore = asyncio.Semaphore(FETCH_CONCURRENCY['deriv'])
+
+    async def top_up(symbol, interval):
+        async with deriv_semaphore:
+            deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, 'latest')
+        data_frames[symbol][interval] = combine_data(data_frames[symbol][interval], deriv_data)
+
+    await asyncio.gather(*(
+        top_up(symbol, interval)
+        for symbol in symbols for interval in intervals
+        if data_frames[symbol][interval] is None or len(data_frames[symbol][interval]) < 50))
+
+    return {symbol: {interval: data for interval, data in frames.items() if data is not None and not data.empty}
+            for symbol, frames in data_frames.items()}
+
+def process_data(data_frames, symbol=None, feature_set=SIGNAL_FEATURES):
     signals = {}
 
     for interval, data in data_frames.items():
@@ -147,30 +272,22 @@ def process_data(data_frames):
             logging.warning(f"No data available for interval {interval}")
             continue
 
-        data = dropna(data)
+        # streamed candles are clean already and dropna would copy the ring buffer
+        if data.attrs.get('source') != 'ticks':
+            data = dropna(data)
         if len(data) < 50:
             logging.warning(f"Not enough data for interval {interval}")
             continue
 
-        # Add the technical indicators and signal logic here...
-        data['EMA_50'] = talib.EMA(data['Close'], timeperiod=50)
-        data['RSI'] = talib.RSI(data['Close'], timeperiod=14)
-        data['MACD'], data['MACD_Signal'], data['MACD_Hist'] = talib.MACD(data['Close'], fastperiod=12, slowperiod=26, signalperiod=9)
-        data['Upper_BB'], data['Middle_BB'], data['Lower_BB'] = talib.BBANDS(data['Close'], timeperiod=20)
-        data['Stoch_K'], data['Stoch_D'] = talib.STOCH(data['High'], data['Low'], data['Close'], fastk_period=14, slowk_period=3, slowd_period=3)
-        data['ATR'] = talib.ATR(data['High'], data['Low'], data['Close'], timeperiod=14)
-        data['OBV'] = talib.OBV(data['Close'], data['Volume'])
-        
-        if len(data) >= 15:
-            data = add_all_ta_features(data, open="Open", high="High", low="Low", close="Close", volume="Volume", fillna=True)
-        
-        conditions = [
-            (data['EMA_50'] > data['Close']),
-            (data['RSI'] < 30),
-            (data['MACD_Hist'] > 0),
-            (data['Close'] < data['Lower_BB']),
-            (data['Stoch_K'] < data['Stoch_D']),
-        ]
+        if symbol is not None:
+            # Only bars added since the previous call are pushed through the indicators
+            signals[interval] = get_indicator_engine(symbol, interval).update(data)
+            logging.info(f"Processed data for interval {interval}: {signals[interval]}")
+            continue
+
+        data = compute_features(data, feature_set)
+
+        conditions = signal_conditions(data)
         
         data['Signal'] = np.where(np.all(conditions, axis=0), 1, 0)
         data['Position'] = data['Signal'].diff()
@@ -202,6 +319,31 @@ def generate_trade_signals(signals):
     logging.info("No trade signal generated")
     return 'hold', None, 0, 'No signal'
 
+async def compute_signal(api, symbol):
+    ticker_symbol = f'{symbol}=X'
+    data_frames = await fetch_all_intervals(api, symbol, ticker_symbol, INTERVALS, START_DATE, END_DATE)
+    signals = process_data(data_frames, symbol=symbol)
+    return generate_trade_signals(signals)
+
+# Streaming: one upstream tick subscription per symbol, fanned out to rooms
+tick_streams = TickStreamManager(socketio, signal_fn=compute_signal)
+
+@socketio.on('subscribe_ticks')
+def handle_subscribe_ticks(data):
+    symbol = data.get('symbol')
+    app_id = data.get('app_id')
+    api_token = data.get('api_token')
+    if not symbol or not app_id or not api_token:
+        emit('tick_error', {'errors': 'Invalid input'})
+        return
+    tick_streams.subscribe(request.sid, symbol, app_id, api_token)
+
+@socketio.on('unsubscribe_ticks')
+def handle_unsubscribe_ticks(data):
+    symbol = data.get('symbol')
+    if symbol:
+        tick_streams.unsubscribe(request.sid, symbol)
+
 @app.route('/api/trade', methods=['POST'])
 async def trade():
     logging.info("Received request at /api/trade")
@@ -218,26 +360,11 @@ async def trade():
     if not symbol or not amount or not contract_type or not app_id or not api_token:
         return jsonify({'errors': 'Invalid input'}), 400
 
-    ticker_symbol = f'{symbol}=X'
-    start_date = '2023-06-30'
-    end_date = '2024-06-30'
-
-    intervals = ['3mo', '1mo', '1wk', '1d', '1h', '30m']
-    data_frames = {}
-
     api = await initialize_deriv_api(app_id, api_token)
     if api is None:
         return jsonify({'errors': 'Failed to connect to DerivAPI'}), 500
 
-    for interval in intervals:
-        yf_data = download_data(ticker_symbol, interval, start_date, end_date)
-        deriv_data = await fetch_deriv_data(api, symbol, interval, start_date, 'latest') if yf_data is None or len(yf_data) < 50 else None
-        combined_data = combine_data(yf_data, deriv_data)
-        if combined_data is not None and not combined_data.empty:
-            data_frames[interval] = combined_data
-
-    signals = process_data(data_frames)
-    trade_signal, entry_price, probability, timeframe_displayed = generate_trade_signals(signals)
+    trade_signal, entry_price, probability, timeframe_displayed = await compute_signal(api, symbol)
 
     if trade_signal != 'hold':
         stop_loss = entry_price * (1 - stop_loss_percent / 100) if trade_signal == 'buy' else entry_price * (1 + stop_loss_percent / 100)
@@ -261,5 +388,42 @@ async def trade():
 
     return jsonify(result)
 
+@app.route('/api/signals', methods=['POST'])
+async def batch_signals():
+    logging.info("Received request at /api/signals")
+    data = request.json
+
+    symbols = data.get('symbols')
+    intervals = data.get('intervals', INTERVALS)
+    app_id = data.get('app_id')
+    api_token = data.get('api_token')
+
+    if not symbols or not isinstance(symbols, list) or not intervals or not isinstance(intervals, list) \
+            or not app_id or not api_token:
+        return jsonify({'errors': 'Invalid input'}), 400
+    if len(symbols) > MAX_BATCH_SYMBOLS:
+        return jsonify({'errors': f'At most {MAX_BATCH_SYMBOLS} symbols per request'}), 400
+    symbols = list(dict.fromkeys(symbols))
+
+    api = await initialize_deriv_api(app_id, api_token)
+    if api is None:
+        return jsonify({'errors': 'Failed to connect to DerivAPI'}), 500
+
+    data_frames = await fetch_batch(api, symbols, intervals, START_DATE, END_DATE)
+
+    results = {}
+    for symbol in symbols:
+        # the vectorized path: one talib pass per frame, no per-symbol engine state
+        signals = process_data(data_frames[symbol])
+        trade_signal, entry_price, probability, timeframe_displayed = generate_trade_signals(signals)
+        results[symbol] = {
+            'signal': trade_signal,
+            'entry_price': entry_price,
+            'probability': f'{probability}%',
+            'timeframe_displayed': timeframe_displayed,
+        }
+
+    return jsonify({'status': 'success', 'signals': results})
+
 if __name__ == '__main__':
     socketio.run(app, port=5000, debug=True)
@@ -0,0 +1,234 @@
+import logging
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pandas as pd
+from ta.utils import dropna
+
+from feature_sets import SIGNAL_FEATURES, compute_feature_columns
+from history_store import HistoryStore, history_store
+from indicator_engine import signal_conditions
+
+# Candle fields copied into shared memory, one contiguous row per field
+SCREEN_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+# Frames shorter than this are skipped, like in process_data
+MIN_BARS = 50
+# Tasks per worker; more, smaller tasks even out symbols of different lengths
+CHUNKS_PER_WORKER = 4
+# Columns of the table returned by Screener.scan
+RESULT_COLUMNS = ['symbol', 'interval', 'time', 'Close', 'ATR', 'Position']
+
+
+def _clean(data):
+    """Return `data` after ta's dropna, skipping its copy when no row would be dropped."""
+    values = data.to_numpy()
+    if values.dtype.kind == 'f' and np.all((values < math.exp(709)) & (values != 0.0)):
+        return data
+    return dropna(data)
+
+
+def _attach(name):
+    """Attach to an existing block without tracking it a second time."""
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # before Python 3.13 the block is registered again, but spawned
+        # workers share the resource tracker of the process that created it
+        return SharedMemory(name=name)
+
+
+def _screen(data, feature_set):
+    """Return the (Close, ATR, Position) of the last bar of `data` if its Signal fired, else None."""
+    columns = compute_feature_columns(data, feature_set)
+    # Signal and Position only need the last two bars
+    last = {column: values[-2:] for column, values in {**data, **columns}.items()}
+    signal = np.all(signal_conditions(last), axis=0)
+    if not signal[-1]:
+        return None
+    atr = last['ATR'][-1] if 'ATR' in last else np.nan
+    return float(last['Close'][-1]), float(atr), int(signal[-1]) - int(signal[-2])
+
+
+def _screen_chunk(name, total, entries, feature_set):
+    """Run the signal pipeline over `entries` of the block `name`; return the fired rows.
+
+    `entries` are (index, start, stop) bar ranges. The inputs are views on the
+    shared block, so nothing but the ranges and the fired rows crosses the
+    process boundary.
+    """
+    block = _attach(name)
+    try:
+        candles = np.ndarray((len(SCREEN_COLUMNS), total), dtype=np.float64, buffer=block.buf)
+        fired = []
+        for index, start, stop in entries:
+            data = {column: candles[row, start:stop] for row, column in enumerate(SCREEN_COLUMNS)}
+            result = _screen(data, feature_set)
+            if result is not None:
+                fired.append((index, *result))
+            del data
+        del candles
+        return fired
+    finally:
+        block.close()
+
+
+def _screen_history_chunk(root, entries, feature_set):
+    """Run the signal pipeline over `entries` of the history store at `root`; return the fired rows.
+
+    `entries` are (index, start, stop, symbol, interval) bar ranges. The
+    inputs are slices of the memory-mapped store files, so only the pages of
+    the ranges are read, and they are copied only when ta's dropna would drop
+    a row. The rows carry the epoch of the last bar.
+    """
+    store = HistoryStore(root)
+    fired = []
+    for index, start, stop, symbol, interval in entries:
+        history = store.open(symbol, interval)
+        epochs = history.epochs[start:stop]
+        data = {column: history.columns[column][start:stop] for column in SCREEN_COLUMNS}
+        # the dropna of _clean, on arrays
+        keep = np.logical_and.reduce([(values < math.exp(709)) & (values != 0.0) for values in data.values()])
+        if not keep.all():
+            epochs = epochs[keep]
+            data = {column: values[keep] for column, values in data.items()}
+        if len(epochs) < MIN_BARS:
+            continue
+        result = _screen(data, feature_set)
+        if result is not None:
+            fired.append((index, int(epochs[-1]), *result))
+        del history, epochs, data
+    return fired
+
+
+class Screener:
+    """Screens many symbols with the process_data conditions on a process pool.
+
+    The candles of every frame are packed once into a single shared memory
+    block, one contiguous float64 row per field of SCREEN_COLUMNS. Workers
+    attach to the block by name and compute the indicators on views of it, so
+    no DataFrame is pickled and memory does not grow with the worker count.
+    Only the symbols whose Signal is 1 on their last bar are sent back.
+    `scan_history` screens the bars of the history store instead, which the
+    workers map from disk themselves.
+    """
+
+    def __init__(self, workers=None, feature_set=SIGNAL_FEATURES):
+        self.workers = workers or os.cpu_count() or 1
+        self.feature_set = feature_set
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                # spawned workers do not inherit the Flask, SocketIO and Deriv threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+    def _chunks(self, ranges):
+        """Split the (index, start, stop, ...) ranges into tasks of roughly equal bar counts."""
+        count = min(len(ranges), self.workers * CHUNKS_PER_WORKER)
+        chunks = [[] for _ in range(count)]
+        sizes = [0] * count
+        for entry in sorted(ranges, key=lambda entry: entry[1] - entry[2]):  # longest first
+            smallest = sizes.index(min(sizes))
+            chunks[smallest].append(entry)
+            sizes[smallest] += entry[2] - entry[1]
+        return chunks
+
+    def scan(self, data_frames):
+        """Return the fired signals of `data_frames` ({symbol: {interval: data}}) as a DataFrame.
+
+        The table has one row per fired (symbol, interval) with the time,
+        Close and ATR of the last bar; Position is 1 when the signal fired on
+        that bar and 0 when it was already on.
+        """
+        frames = []
+        for symbol, intervals in data_frames.items():
+            for interval, data in intervals.items():
+                if data is None:
+                    continue
+                if data.attrs.get('source') != 'ticks':
+                    data = _clean(data)
+                if len(data) < MIN_BARS:
+                    logging.debug(f"Not enough data to screen {symbol} {interval}")
+                    continue
+                frames.append((symbol, interval, data))
+        if not frames:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        total = sum(len(data) for _, _, data in frames)
+        block = SharedMemory(create=True, size=len(SCREEN_COLUMNS) * total * 8)
+        try:
+            candles = np.ndarray((len(SCREEN_COLUMNS), total), dtype=np.float64, buffer=block.buf)
+            ranges = []
+            start = 0
+            for index, (_, _, data) in enumerate(frames):
+                stop = start + len(data)
+                for row, column in enumerate(SCREEN_COLUMNS):
+                    candles[row, start:stop] = data[column].to_numpy() if column in data else np.nan
+                ranges.append((index, start, stop))
+                start = stop
+            del candles
+
+            logging.info(f"Screening {len(frames)} frames ({total} bars) on {self.workers} workers")
+            pool = self._pool()
+            futures = [pool.submit(_screen_chunk, block.name, total, chunk, self.feature_set)
+                       for chunk in self._chunks(ranges)]
+            fired = [row for future in futures for row in future.result()]
+        finally:
+            block.close()
+            block.unlink()
+
+        rows = []
+        for index, close, atr, position in sorted(fired):
+            symbol, interval, data = frames[index]
+            rows.append((symbol, interval, data.index[-1], close, atr, position))
+        logging.info(f"Screener found {len(rows)} signals in {len(frames)} frames")
+        return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+    def scan_history(self, keys, start=None, end=None, store=history_store):
+        """Return the fired signals of the stored bars in [start, end) of `keys` ((symbol, interval) pairs).
+
+        The table is the one of `scan`. The workers map the files of `store`
+        themselves, so the candles are neither copied into shared memory nor
+        loaded here; `start` and `end` are epoch seconds.
+        """
+        entries = []
+        for symbol, interval in keys:
+            first, stop = store.open(symbol, interval).bounds(start, end)
+            if stop - first < MIN_BARS:
+                logging.debug(f"Not enough data to screen {symbol} {interval}")
+                continue
+            entries.append((len(entries), first, stop, symbol, interval))
+        if not entries:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+
+        total = sum(stop - first for _, first, stop, _, _ in entries)
+        logging.info(f"Screening {len(entries)} stored histories ({total} bars) on {self.workers} workers")
+        pool = self._pool()
+        futures = [pool.submit(_screen_history_chunk, store.root, chunk, self.feature_set)
+                   for chunk in self._chunks(entries)]
+        fired = [row for future in futures for row in future.result()]
+
+        rows = []
+        for index, epoch, close, atr, position in sorted(fired):
+            _, _, _, symbol, interval = entries[index]
+            rows.append((symbol, interval, pd.to_datetime(epoch, unit='s'), close, atr, position))
+        logging.info(f"Screener found {len(rows)} signals in {len(entries)} stored histories")
+        return pd.DataFrame(rows, columns=RESULT_COLUMNS)
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+screener = Screener()
@@ -0,0 +1,82 @@
+import logging
+
+import numpy as np
+import pandas as pd
+from ta.utils import dropna
+
+from feature_sets import SIGNAL_FEATURES, compute_features
+from indicator_engine import get_indicator_engine, signal_conditions
+
+
+def combine_data(yf_data, deriv_data):
+    combined_data = pd.concat([yf_data, deriv_data])
+    combined_data = combined_data[~combined_data.index.duplicated(
+        keep='first')]
+    combined_data.sort_index(inplace=True)
+    return combined_data
+
+
+def calculate_probability(atr, close_price):
+    max_atr = close_price * 0.1
+    probability = (atr / max_atr) * 100
+    return round(probability, 2)
+
+
+def process_data(data_frames, symbol=None, feature_set=SIGNAL_FEATURES):
+    signals = {}
+
+    for interval, data in data_frames.items():
+        logging.info(f"Processing data for interval {interval}")
+        # streamed candles are clean already and dropna would copy the ring buffer
+        if data.attrs.get('source') != 'ticks':
+            data = dropna(data)
+
+        if len(data) < 50:
+            logging.info(f"Not enough data for interval {interval}")
+            continue
+
+        if symbol is not None:
+            # Only bars added since the previous call are pushed through the indicators
+            signals[interval] = get_indicator_engine(symbol, interval).update(data)
+            logging.info(
+                f"Processed data for interval {interval}: {signals[interval]}")
+            continue
+
+        data = compute_features(data, feature_set)
+
+        conditions = signal_conditions(data)
+
+        data['Signal'] = np.where(np.all(conditions, axis=0), 1, 0)
+        data['Position'] = data['Signal'].diff()
+        signals[interval] = data.iloc[-1] if not data.empty else None
+        logging.info(
+            f"Processed data for interval {interval}: {signals[interval]}")
+
+    return signals
+
+
+def generate_trade_signals(signals):
+    logging.info("Generating trade signals")
+
+    for interval in ['30m', '1h']:
+        if signals.get(interval) is not None:
+            recent_signal = signals[interval]
+            trade_signal = 'buy' if recent_signal['Signal'] == 1 else 'sell'
+            entry_price = recent_signal['Close']
+            probability = calculate_probability(
+                recent_signal['ATR'], recent_signal['Close'])
+            logging.info(
+                f"Trade signal: {trade_signal} for interval {interval}")
+            return trade_signal, entry_price, probability, interval
+
+    if signals.get('1d') is not None:
+        recent_signal = signals['1d']
+        trade_signal = 'buy' if recent_signal['Signal'] == 1 else 'sell'
+        entry_price = recent_signal['Close']
+        probability = calculate_probability(
+            recent_signal['ATR'], recent_signal['Close'])
+        logging.info(f"Trade signal: {trade_signal} for daily interval")
+        return trade_signal, entry_price, probability, '1d'
+
+    logging.info("No trade signal generated")
+    return 'hold', None, 0, 'No signal'
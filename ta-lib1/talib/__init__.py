@@ -1,97 +1,315 @@
-
 import atexit
+import sys
 from itertools import chain
 from functools import wraps
 
-# If polars is available, wrap talib functions so that they support
-# polars.Series input
-try:
-    from polars import Series as _pl_Series
-except ImportError:
-    # polars not available, nothing to wrap
-    _pl_Series = None
-
-# If pandas is available, wrap talib functions so that they support
-# pandas.Series input
-try:
-    from pandas import Series as _pd_Series
-except ImportError:
-    # pandas not available, nothing to wrap
-    _pd_Series = None
-
-if _pl_Series is not None or _pd_Series is not None:
-
-    def _wrapper(func):
-        @wraps(func)
-        def wrapper(*args, **kwds):
-
-            if _pl_Series is not None:
-                use_pl = any(isinstance(arg, _pl_Series) for arg in args) or \
-                         any(isinstance(v, _pl_Series) for v in kwds.values())
-            else:
-                use_pl = False
+import numpy as np
 
-            if _pd_Series is not None:
-                use_pd = any(isinstance(arg, _pd_Series) for arg in args) or \
-                         any(isinstance(v, _pd_Series) for v in kwds.values())
-            else:
-                use_pd = False
+# The talib functions support polars and pandas Series and DataFrames, but
+# never import either: their objects can only be passed in once the caller
+# imported them, so the types are looked up on the first such call
+_pl_Series = _pl_DataFrame = None
+_pd_Series = _pd_DataFrame = None
+_pl_types = _pd_types = _frame_types = ()
 
-            if use_pl and use_pd:
-                raise Exception("Cannot mix polars and pandas")
 
-            # Use float64 values if polars or pandas, else use values as passed
-            if use_pl:
-                _args = [arg.to_numpy().astype(float) if isinstance(arg, _pl_Series) else
-                         arg for arg in args]
-                _kwds = {k: v.to_numpy().astype(float) if isinstance(v, _pl_Series) else
-                            v for k, v in kwds.items()}
+def _load_types():
+    global _pl_Series, _pl_DataFrame, _pd_Series, _pd_DataFrame
+    global _pl_types, _pd_types, _frame_types
+    if _pl_Series is None:
+        polars = sys.modules.get('polars')
+        if polars is not None and hasattr(polars, 'DataFrame'):
+            _pl_Series, _pl_DataFrame = polars.Series, polars.DataFrame
+            _pl_types = (_pl_Series, _pl_DataFrame)
+            _frame_types += (_pl_DataFrame,)
+    if _pd_Series is None:
+        pandas = sys.modules.get('pandas')
+        if pandas is not None and hasattr(pandas, 'DataFrame'):
+            _pd_Series, _pd_DataFrame = pandas.Series, pandas.DataFrame
+            _pd_types = (_pd_Series, _pd_DataFrame)
+            _frame_types += (_pd_DataFrame,)
 
-            elif use_pd:
-                index = next(arg.index
-                             for arg in chain(args, kwds.values())
-                             if isinstance(arg, _pd_Series))
 
-                _args = [arg.to_numpy().astype(float) if isinstance(arg, _pd_Series) else
-                         arg for arg in args]
-                _kwds = {k: v.to_numpy().astype(float) if isinstance(v, _pd_Series) else
-                            v for k, v in kwds.items()}
+def _to_numpy(value):
+    # Series become float64 (or float32) arrays, viewing their buffer when it
+    # already holds such data; a DataFrame holds one series per column and becomes a
+    # (n_columns, length) array with one series per row
+    if _frame_types and isinstance(value, _frame_types):
+        return np.ascontiguousarray(_to_float_array(value).T)
+    return _to_float_array(value)
 
-            else:
-                _args = args
-                _kwds = kwds
 
-            result = func(*_args, **_kwds)
+def _is_2d(value):
+    return isinstance(value, np.ndarray) and value.ndim == 2
+
+
+def _call_rows(func, args, kwds):
+    """
+    Calls func once per row of the 2-D input arrays and stacks the results,
+    so each output has the shape (n_series, length). Every row is handled as
+    an independent series with its own leading NaNs and lookback; 1-D arrays
+    and scalars are passed unchanged to every row. A 2-D ``out`` array, or a
+    tuple of them, receives one row per series and is returned as is.
+    """
+    kwds = dict(kwds)
+    out = kwds.pop('out', None)
+    shapes = set(value.shape for value in chain(args, kwds.values()) if _is_2d(value))
+    if len(shapes) != 1:
+        raise Exception("input array shapes are different")
+    (n_series, length), = shapes
+
+    def row(value, i):
+        if not _is_2d(value):
+            return value
+        return value[i] if i is not None else np.full(length, np.nan)
+
+    def call(i):
+        if out is not None:
+            kwds['out'] = tuple(o[i] for o in out) if isinstance(out, (tuple, list)) else out[i]
+        return func(*[row(arg, i) for arg in args],
+                    **dict((k, row(v, i)) for k, v in kwds.items()))
+
+    if out is not None:
+        for i in range(n_series):
+            call(i)
+        return tuple(out) if isinstance(out, list) else out
+
+    if n_series == 0:
+        # one all-NaN call tells the number, shape and type of the outputs
+        sample = call(None)
+        if isinstance(sample, tuple):
+            return tuple(np.empty((0,) + np.shape(out), dtype=np.asarray(out).dtype) for out in sample)
+        return np.empty((0,) + np.shape(sample), dtype=np.asarray(sample).dtype)
+
+    results = [call(i) for i in range(n_series)]
+    if isinstance(results[0], tuple):
+        return tuple(np.stack(outputs) for outputs in zip(*results))
+    return np.stack(results)
 
-            # check to see if we got a streaming result
-            first_result = result[0] if isinstance(result, tuple) else result
-            is_streaming_fn_result = not hasattr(first_result, '__len__')
-            if is_streaming_fn_result:
-                return result
 
-            # Series was passed in, Series gets out
+def _tail(value, n):
+    # the last n values of an array, or of every series of a 2-D array
+    if isinstance(value, tuple):
+        return tuple(_tail(v, n) for v in value)
+    if isinstance(value, np.ndarray) and value.ndim:
+        return value[..., max(value.shape[-1] - n, 0):]
+    return value
+
+
+# Functions whose outputs depend on the whole input history (running totals
+# or a trend state), computed over all of it even with tail
+_TAIL_FULL_HISTORY = frozenset(['AD', 'ADOSC', 'OBV', 'SAR', 'SAREXT'])
+# Functions returning positions in the input
+_TAIL_INDEX_OUTPUTS = frozenset(['MAXINDEX', 'MININDEX', 'MINMAXINDEX'])
+# EMA based functions without an unstable period of their own
+_TAIL_RECURSIVE = frozenset(['DEMA', 'MACD', 'MACDFIX', 'TEMA', 'TRIX'])
+# MA types smoothed recursively: EMA, DEMA, TEMA, KAMA, MAMA and T3
+_RECURSIVE_MA_TYPES = frozenset([1, 3, 4, 6, 7, 8])
+# Warm-up of recursive functions, in periods: the error of their seed has
+# decayed below float precision by then (e.g. (1 - 1/14) ** 420 for RSI)
+TAIL_WARMUP_PERIODS = 30
+
+
+def _offset(value, offset):
+    # positions in the cut inputs, as positions in the whole inputs
+    if isinstance(value, tuple):
+        return tuple(_offset(v, offset) for v in value)
+    return value + value.dtype.type(offset)
+
+
+def _recursive(name, parameters, unstable):
+    # an unstable period, EMA based or with a recursive MA type: every output
+    # depends on all the earlier inputs, not only on the lookback window
+    return unstable or name in _TAIL_RECURSIVE or any(
+        key.endswith('matype') and int(value) in _RECURSIVE_MA_TYPES for key, value in parameters.items())
+
+
+def _tail_inputs(func, tail, args, kwds):
+    """
+    Returns args and kwds with the input arrays cut to the values needed for
+    the last ``tail`` outputs of func, and the position of the first kept
+    value. That is ``tail`` plus the function's lookback for the given
+    parameters, plus for recursive functions (an unstable period, EMA based
+    or with a recursive MA type) a warm-up of TAIL_WARMUP_PERIODS times their
+    longest period, after which their seed no longer shows in the outputs.
+    Functions of the whole history get all of it.
+    """
+    name = func.__name__
+    if name not in _FUNCTION_NAMES:
+        raise TypeError("%s() got an unexpected keyword argument 'tail'" % name)
+    if 'out' in kwds:
+        raise Exception("tail and out can't be combined")
+    if tail < 0:
+        raise Exception("tail must be positive")
+    if name in _TAIL_FULL_HISTORY:
+        return args, kwds, 0
+    n_inputs = 0
+    while n_inputs < len(args) and isinstance(args[n_inputs], np.ndarray):
+        n_inputs += 1
+    options = dict((k, v) for k, v in kwds.items() if not isinstance(v, np.ndarray))
+    lookback = _ta_lookback(name, tuple(args[n_inputs:]), options)
+    parameters, unstable = _ta_parameters(name, tuple(args[n_inputs:]), options)
+    if _recursive(name, parameters, unstable):
+        periods = [value for key, value in parameters.items() if key.endswith('period')]
+        if name == 'MACDFIX':
+            # its EMA periods are fixed at 12 and 26
+            periods.append(26)
+        # the Hilbert transform functions have no period parameter
+        lookback += TAIL_WARMUP_PERIODS * max(periods or [lookback, 1])
+    window = tail + lookback
+    length = max([v.shape[-1] for v in chain(args, kwds.values()) if isinstance(v, np.ndarray) and v.ndim] or [0])
+    return ([_tail(arg, window) for arg in args],
+            dict((k, _tail(v, window)) for k, v in kwds.items()),
+            max(length - window, 0))
+
+
+def _call_segments(func, args, kwds):
+    """
+    Calls func once per run of values without NaN in the input arrays, and
+    stitches the outputs together: every segment after a gap warms up again
+    like a new series, instead of the gap being propagated to the end. The
+    outputs are NaN (or 0 for integer outputs) on the gaps.
+    """
+    if 'out' in kwds:
+        raise Exception("segmented and out can't be combined")
+    arrays = [v for v in chain(args, kwds.values()) if isinstance(v, np.ndarray)]
+    if not arrays or len(set(a.shape for a in arrays)) != 1 or arrays[0].ndim != 1:
+        return func(*args, **kwds)
+    length = arrays[0].shape[0]
+    valid = np.ones(length, dtype=bool)
+    for a in arrays:
+        valid &= a == a
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], valid.view(np.int8), [0]))))
+    segments = list(zip(edges[::2], edges[1::2]))
+    if len(segments) < 2:
+        return func(*args, **kwds)
+
+    def cut(value, start, stop):
+        return value[start:stop] if isinstance(value, np.ndarray) else value
+
+    # the first segment tells the number and types of the outputs, the others
+    # are written directly into them
+    start, stop = segments[0]
+    result = func(*[cut(arg, start, stop) for arg in args],
+                  **dict((k, cut(v, start, stop)) for k, v in kwds.items()))
+    results = result if isinstance(result, tuple) else (result,)
+    outputs = tuple(np.full(length, np.nan) if r.dtype.kind == 'f' else np.zeros(length, dtype=r.dtype)
+                    for r in results)
+    for output, r in zip(outputs, results):
+        output[start:stop] = r
+    for start, stop in segments[1:]:
+        out = tuple(output[start:stop] for output in outputs)
+        func(*[cut(arg, start, stop) for arg in args],
+             out=out if isinstance(result, tuple) else out[0],
+             **dict((k, cut(v, start, stop)) for k, v in kwds.items()))
+    return outputs if isinstance(result, tuple) else outputs[0]
+
+
+def _astype(value, dtype):
+    # the real outputs in the asked precision, integer outputs as they are
+    if isinstance(value, tuple):
+        return tuple(_astype(v, dtype) for v in value)
+    if isinstance(value, np.ndarray) and value.dtype.kind == 'f':
+        return value.astype(dtype, copy=False)
+    return value
+
+
+def _wrapper(func):
+    @wraps(func)
+    def wrapper(*args, **kwds):
+        _load_types()
+        tail = kwds.pop('tail', None)
+        segmented = kwds.pop('segmented', False)
+        dtype = kwds.pop('dtype', None)
+        if dtype is not None and np.dtype(dtype).kind != 'f':
+            raise Exception("dtype must be a float type")
+        values = list(chain(args, kwds.values()))
+        use_pl = bool(_pl_types) and any(isinstance(v, _pl_types) for v in values)
+        use_pd = bool(_pd_types) and any(isinstance(v, _pd_types) for v in values)
+
+        if use_pl and use_pd:
+            raise Exception("Cannot mix polars and pandas")
+
+        # Use float64 values if polars or pandas, else use values as passed
+        if use_pl or use_pd:
+            if use_pd:
+                index = next(v.index for v in values if isinstance(v, _pd_types))
+            frame = next((v for v in values if isinstance(v, _frame_types)), None)
+            _args = [_to_numpy(arg) for arg in args]
+            _kwds = dict((k, _to_numpy(v)) for k, v in kwds.items())
+        else:
+            frame = None
+            _args = args
+            _kwds = kwds
+
+        if tail is not None:
+            _args, _kwds, offset = _tail_inputs(func, tail, _args, _kwds)
+
+        call = func
+        if segmented:
+            def call(*args, **kwds):
+                return _call_segments(func, args, kwds)
+
+        if any(_is_2d(v) for v in chain(_args, _kwds.values())):
+            result = _call_rows(call, _args, _kwds)
+        else:
+            result = call(*_args, **_kwds)
+
+        # check to see if we got a streaming result
+        first_result = result[0] if isinstance(result, tuple) else result
+        is_streaming_fn_result = not hasattr(first_result, '__len__')
+        if is_streaming_fn_result:
+            return result
+
+        if dtype is not None:
+            result = _astype(result, dtype)
+
+        # only the last tail values were asked for
+        if tail is not None:
+            result = _tail(result, tail)
+            if offset and func.__name__ in _TAIL_INDEX_OUTPUTS:
+                result = _offset(result, offset)
+            if use_pd:
+                first_result = result[0] if isinstance(result, tuple) else result
+                index = index[len(index) - first_result.shape[-1]:]
+
+        # DataFrame was passed in, one column per series gets out
+        if frame is not None:
             if use_pl:
-                if isinstance(result, tuple):
-                    return tuple(_pl_Series(arr) for arr in result)
-                else:
-                    return _pl_Series(result)
+                def wrap(arr):
+                    if arr.ndim == 1:
+                        return _pl_Series(arr)
+                    return _pl_DataFrame(arr.T, schema=frame.columns, orient='row')
+            else:
+                def wrap(arr):
+                    if arr.ndim == 1:
+                        return _pd_Series(arr, index=frame.columns)
+                    return _pd_DataFrame(arr.T, index=index, columns=frame.columns, copy=False)
+            if isinstance(result, tuple):
+                return tuple(wrap(arr) for arr in result)
+            return wrap(result)
 
-            elif use_pd:
-                if isinstance(result, tuple):
-                    return tuple(_pd_Series(arr, index=index) for arr in result)
-                else:
-                    return _pd_Series(result, index=index)
+        # Series was passed in, Series gets out
+        if use_pl:
+            if isinstance(result, tuple):
+                return tuple(_pl_Series(arr) for arr in result)
+            else:
+                return _pl_Series(result)
 
+        elif use_pd:
+            if isinstance(result, tuple):
+                return tuple(_pd_Series(arr, index=index, copy=False) for arr in result)
             else:
-                return result
+                return _pd_Series(result, index=index, copy=False)
+
+        else:
+            return result
 
-        return wrapper
-else:
-    _wrapper = lambda x: x
+    return wrapper
 
 
 from ._ta_lib import (
-    _ta_initialize, _ta_shutdown, MA_Type, __ta_version__,
+    _ta_initialize, _ta_shutdown, _to_float_array, _ta_lookback, _ta_parameters, MA_Type, __ta_version__,
     _ta_set_unstable_period as set_unstable_period,
     _ta_get_unstable_period as get_unstable_period,
     _ta_set_compatibility as set_compatibility,
@@ -99,22 +317,12 @@ from ._ta_lib import (
     __TA_FUNCTION_NAMES__
 )
 
-# import all the func and stream functions
-from ._ta_lib import *
-
-# wrap them for polars or pandas support
-func = __import__("_ta_lib", globals(), locals(), __TA_FUNCTION_NAMES__, level=1)
-for func_name in __TA_FUNCTION_NAMES__:
-    wrapped_func = _wrapper(getattr(func, func_name))
-    setattr(func, func_name, wrapped_func)
-    globals()[func_name] = wrapped_func
-
-stream_func_names = ['stream_%s' % fname for fname in __TA_FUNCTION_NAMES__]
-stream = __import__("stream", globals(), locals(), stream_func_names, level=1)
-for func_name, stream_func_name in zip(__TA_FUNCTION_NAMES__, stream_func_names):
-    wrapped_func = _wrapper(getattr(stream, func_name))
-    setattr(stream, func_name, wrapped_func)
-    globals()[stream_func_name] = wrapped_func
+# the func and stream functions are wrapped for 2-D, polars or pandas
+# support on first use, see __getattr__ and the func and stream modules
+from . import func, stream
+from .parallel import batch
+from ._sweep import sweep
+from ._patterns import scan_patterns
 
 __version__ = '0.4.30'
 
@@ -325,4 +533,21 @@ def get_function_groups():
     """
     return __function_groups__.copy()
 
-__all__ = ['get_functions', 'get_function_groups'] + __TA_FUNCTION_NAMES__ + ["stream_%s" % name for name in __TA_FUNCTION_NAMES__]
+_FUNCTION_NAMES = frozenset(__TA_FUNCTION_NAMES__)
+
+
+def __getattr__(name):
+    if name in _FUNCTION_NAMES:
+        value = getattr(func, name)
+    elif name.startswith('stream_') and name[len('stream_'):] in _FUNCTION_NAMES:
+        value = getattr(stream, name[len('stream_'):])
+    else:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+__all__ = ['get_functions', 'get_function_groups', 'batch', 'sweep', 'scan_patterns'] + __TA_FUNCTION_NAMES__ + ["stream_%s" % name for name in __TA_FUNCTION_NAMES__]
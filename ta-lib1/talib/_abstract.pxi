@@ -23,33 +23,64 @@ __INPUT_PRICE_SERIES_DEFAULTS = {'price':   'close',
                                  'periods': 'periods', # only used by MAVP; not a price series!
                                  }
 
-__INPUT_ARRAYS_TYPES = [dict]
-__ARRAY_TYPES = [np.ndarray]
-
-# allow use of pandas.DataFrame for input arrays
-try:
-    import pandas
-    __INPUT_ARRAYS_TYPES.append(pandas.DataFrame)
-    __ARRAY_TYPES.append(pandas.Series)
-    __PANDAS_DATAFRAME = pandas.DataFrame
-    __PANDAS_SERIES = pandas.Series
-except ImportError:
-    __PANDAS_DATAFRAME = None
-    __PANDAS_SERIES = None
-
-# allow use of polars.DataFrame for input arrays
-try:
-    import polars
-    __INPUT_ARRAYS_TYPES.append(polars.DataFrame)
-    __ARRAY_TYPES.append(polars.Series)
-    __POLARS_DATAFRAME = polars.DataFrame
-    __POLARS_SERIES = polars.Series
-except ImportError:
-    __POLARS_DATAFRAME = None
-    __POLARS_SERIES = None
-
-__INPUT_ARRAYS_TYPES = tuple(__INPUT_ARRAYS_TYPES)
-__ARRAY_TYPES = tuple(__ARRAY_TYPES)
+__INPUT_ARRAYS_TYPES = (dict,)
+__ARRAY_TYPES = (np.ndarray,)
+__PANDAS_DATAFRAME = None
+__PANDAS_SERIES = None
+__POLARS_DATAFRAME = None
+__POLARS_SERIES = None
+
+def __load_dataframe_types():
+    """
+    Allows pandas and polars DataFrames (and Series) as input arrays once
+    their module is imported. They are looked up rather than imported, so
+    importing talib doesn't import them: a caller can only pass their
+    objects in after importing them.
+    """
+    global __INPUT_ARRAYS_TYPES, __ARRAY_TYPES
+    global __PANDAS_DATAFRAME, __PANDAS_SERIES, __POLARS_DATAFRAME, __POLARS_SERIES
+    if __PANDAS_DATAFRAME is None and 'pandas' in sys.modules:
+        pandas = sys.modules['pandas']
+        if hasattr(pandas, 'DataFrame'):
+            __INPUT_ARRAYS_TYPES += (pandas.DataFrame,)
+            __ARRAY_TYPES += (pandas.Series,)
+            __PANDAS_DATAFRAME = pandas.DataFrame
+            __PANDAS_SERIES = pandas.Series
+    if __POLARS_DATAFRAME is None and 'polars' in sys.modules:
+        polars = sys.modules['polars']
+        if hasattr(polars, 'DataFrame'):
+            __INPUT_ARRAYS_TYPES += (polars.DataFrame,)
+            __ARRAY_TYPES += (polars.Series,)
+            __POLARS_DATAFRAME = polars.DataFrame
+            __POLARS_SERIES = polars.Series
+
+
+def __float_dtype(dtypes):
+    # float32 data stays float32, for the TA_S_* functions
+    if len(dtypes) and all(str(dtype).lower() == 'float32' for dtype in dtypes):
+        return numpy.float32
+    return numpy.float64
+
+
+def _to_float_array(values):
+    """
+    Returns the values of a pandas or polars Series (or DataFrame) as a
+    float64 ndarray, or a float32 one when they hold float32 data, with
+    missing values as NaN. Data of that type without missing values, whether
+    numpy or Arrow backed, is returned as a read-only view of its buffer
+    instead of a copy; anything else is converted once. Other values are
+    returned unchanged.
+    """
+    __load_dataframe_types()
+    if __POLARS_SERIES is not None and \
+            isinstance(values, (__POLARS_SERIES, __POLARS_DATAFRAME)):
+        dtypes = [values.dtype] if isinstance(values, __POLARS_SERIES) else values.dtypes
+        return numpy.asarray(values.to_numpy(), dtype=__float_dtype(dtypes))
+    elif __PANDAS_SERIES is not None and \
+            isinstance(values, (__PANDAS_SERIES, __PANDAS_DATAFRAME)):
+        dtypes = [values.dtype] if isinstance(values, __PANDAS_SERIES) else list(values.dtypes)
+        return values.to_numpy(dtype=__float_dtype(dtypes), na_value=numpy.nan)
+    return values
 
 
 if sys.version >= '3':
@@ -68,6 +99,50 @@ else:
     def bytes2str(b):
         return b
 
+
+# TA-Lib's info, input names, parameters and output flags of each function,
+# read once per process and shared by every Function instance and thread.
+# The entries are never modified.
+__FUNCTION_METADATA = {}
+__FUNCTION_METADATA_LOCK = threading.Lock()
+
+def __get_function_metadata(function_name):
+    metadata = __FUNCTION_METADATA.get(function_name)
+    if metadata is not None:
+        return metadata
+
+    with __FUNCTION_METADATA_LOCK:
+        metadata = __FUNCTION_METADATA.get(function_name)
+        if metadata is not None:
+            return metadata
+
+        info = _ta_getFuncInfo(function_name)
+
+        # inputs (price series names)
+        input_names = OrderedDict()
+        for i in xrange(info.pop('num_inputs')):
+            input_info = _ta_getInputParameterInfo(function_name, i)
+            price_series = input_info['price_series']
+            if price_series is None:
+                price_series = __INPUT_PRICE_SERIES_DEFAULTS[input_info['name']]
+            input_names[input_info['name']] = price_series
+
+        # optional inputs (function parameters)
+        opt_inputs = OrderedDict()
+        for i in xrange(info.pop('num_opt_inputs')):
+            opt_input_info = _ta_getOptInputParameterInfo(function_name, i)
+            opt_inputs[opt_input_info['name']] = opt_input_info
+
+        # outputs
+        output_flags = OrderedDict()
+        for i in xrange(info.pop('num_outputs')):
+            output_info = _ta_getOutputParameterInfo(function_name, i)
+            output_flags[output_info['name']] = output_info['flags']
+
+        metadata = (info, input_names, opt_inputs, output_flags)
+        __FUNCTION_METADATA[function_name] = metadata
+        return metadata
+
 class Function(object):
     """
     This is a pythonic wrapper around TALIB's abstract interface. It is
@@ -102,54 +177,40 @@ class Function(object):
         self.__name = function_name.upper()
         self.__namestr = self.__name
         self.__name = str2bytes(self.__name)
+        self.__metadata = __get_function_metadata(self.__name)
 
         # thread-local storage
         self.__localdata = threading.local()
+        self.__binding = None
 
-        # finish initializing: query the TALIB abstract interface and set arguments
+        # finish initializing: set arguments, then bind them for every thread
         self.set_function_args(*args, **kwargs)
+        local = self.__local
+        self.__binding = (OrderedDict(local.input_names),
+                          OrderedDict(local.parameters),
+                          local.input_arrays)
         self.func_object = func_object
 
     @property
     def __local(self):
         local = self.__localdata
-        if not hasattr(local, 'info'):
-            local.info = None
-            local.input_arrays = {}
-
-            # dictionaries of function args. keys are input/opt_input/output parameter names
-            local.input_names = OrderedDict()
-            local.opt_inputs = OrderedDict()
-            local.outputs = OrderedDict()
+        if not hasattr(local, 'parameters'):
+            if self.__binding is None:
+                _, input_names, opt_inputs, _ = self.__metadata
+                parameters = OrderedDict(
+                    (name, opt_inputs[name]['default_value']) for name in opt_inputs)
+                input_arrays = {}
+            else:
+                input_names, parameters, input_arrays = self.__binding
+
+            # price series lists are copied as they can be changed in place
+            local.input_names = OrderedDict(
+                (name, list(price_series) if isinstance(price_series, list) else price_series)
+                for name, price_series in input_names.items())
+            local.parameters = OrderedDict(parameters)
+            local.input_arrays = input_arrays
+            local.outputs = None
             local.outputs_valid = False
-
-            # function info
-            local.info = _ta_getFuncInfo(self.__name)
-
-            # inputs (price series names)
-            for i in xrange(local.info.pop('num_inputs')):
-                info = _ta_getInputParameterInfo(self.__name, i)
-                input_name = info['name']
-                if info['price_series'] is None:
-                    info['price_series'] = __INPUT_PRICE_SERIES_DEFAULTS[input_name]
-                local.input_names[input_name] = info
-            local.info['input_names'] = self.input_names
-
-            # optional inputs (function parameters)
-            for i in xrange(local.info.pop('num_opt_inputs')):
-                info = _ta_getOptInputParameterInfo(self.__name, i)
-                param_name = info['name']
-                local.opt_inputs[param_name] = info
-            local.info['parameters'] = self.parameters
-
-            # outputs
-            local.info['output_flags'] = OrderedDict()
-            for i in xrange(local.info.pop('num_outputs')):
-                info = _ta_getOutputParameterInfo(self.__name, i)
-                output_name = info['name']
-                local.info['output_flags'][output_name] = info['flags']
-                local.outputs[output_name] = None
-            local.info['output_names'] = self.output_names
         return local
 
     @property
@@ -157,32 +218,36 @@ class Function(object):
         """
         Returns a copy of the function's info dict.
         """
-        return self.__local.info.copy()
+        info = dict(self.__metadata[0])
+        info['function_flags'] = self.function_flags
+        info['input_names'] = self.input_names
+        info['parameters'] = self.parameters
+        info['output_flags'] = self.output_flags
+        info['output_names'] = self.output_names
+        return info
 
     @property
     def function_flags(self):
         """
         Returns any function flags defined for this indicator function.
         """
-        return self.__local.info['function_flags']
+        flags = self.__metadata[0]['function_flags']
+        return flags if flags is None else list(flags)
 
     @property
     def output_flags(self):
         """
         Returns the flags for each output for this indicator function.
         """
-        return self.__local.info['output_flags'].copy()
+        return OrderedDict((name, flags if flags is None else list(flags))
+                           for name, flags in self.__metadata[3].items())
 
     def get_input_names(self):
         """
         Returns the dict of input price series names that specifies which
         of the ndarrays in input_arrays will be used to calculate the function.
         """
-        local = self.__local
-        ret = OrderedDict()
-        for input_name in local.input_names:
-            ret[input_name] = local.input_names[input_name]['price_series']
-        return ret
+        return OrderedDict(self.__local.input_names)
 
     def set_input_names(self, input_names):
         """
@@ -190,8 +255,9 @@ class Function(object):
         """
         local = self.__local
         for input_name, price_series in input_names.items():
-            local.input_names[input_name]['price_series'] = price_series
-            local.info['input_names'][input_name] = price_series
+            if input_name not in local.input_names:
+                raise KeyError(input_name)
+            local.input_names[input_name] = price_series
         local.outputs_valid = False
 
     input_names = property(get_input_names, set_input_names)
@@ -200,6 +266,7 @@ class Function(object):
         """
         Returns a copy of the dict of input arrays in use.
         """
+        __load_dataframe_types()
         local = self.__local
         if __POLARS_DATAFRAME is not None \
             and isinstance(local.input_arrays, __POLARS_DATAFRAME):
@@ -232,6 +299,7 @@ class Function(object):
                     return True
                 return False
         """
+        __load_dataframe_types()
         local = self.__local
         if isinstance(input_arrays, __INPUT_ARRAYS_TYPES):
             missing_keys = []
@@ -260,11 +328,7 @@ class Function(object):
         """
         Returns the function's optional parameters and their default values.
         """
-        local = self.__local
-        ret = OrderedDict()
-        for opt_input in local.opt_inputs:
-            ret[opt_input] = self.__get_opt_input_value(opt_input)
-        return ret
+        return OrderedDict(self.__local.parameters)
 
     def set_parameters(self, parameters=None, **kwargs):
         """
@@ -275,9 +339,8 @@ class Function(object):
         parameters.update(kwargs)
         for param, value in parameters.items():
             if self.__check_opt_input_value(param, value):
-                local.opt_inputs[param]['value'] = value
+                local.parameters[param] = value
         local.outputs_valid = False
-        local.info['parameters'] = self.parameters
 
     parameters = property(get_parameters, set_parameters)
 
@@ -286,34 +349,25 @@ class Function(object):
         optional args:[input_arrays,] [parameter_args,] [input_price_series_kwargs,] [parameter_kwargs]
         """
         local = self.__local
-        update_info = False
+        opt_inputs = self.__metadata[2]
 
         for key in kwargs:
-            if key in local.opt_inputs:
+            if key in opt_inputs:
                 value = kwargs[key]
                 if self.__check_opt_input_value(key, value):
-                    local.opt_inputs[key]['value'] = kwargs[key]
-                    update_info = True
+                    local.parameters[key] = value
             elif key in local.input_names:
-                local.input_names[key]['price_series'] = kwargs[key]
-                local.info['input_names'][key] = kwargs[key]
+                local.input_names[key] = kwargs[key]
 
         if args:
             skip_first = 0
             if self.set_input_arrays(args[0]):
                 skip_first = 1
-            if len(args) > skip_first:
-                for i, param_name in enumerate(local.opt_inputs):
-                    i += skip_first
-                    if i < len(args):
-                        value = args[i]
-                        if self.__check_opt_input_value(param_name, value):
-                            local.opt_inputs[param_name]['value'] = value
-                            update_info = True
+            for param_name, value in zip(opt_inputs, args[skip_first:]):
+                if self.__check_opt_input_value(param_name, value):
+                    local.parameters[param_name] = value
 
         if args or kwargs:
-            if update_info:
-                local.info['parameters'] = self.parameters
             local.outputs_valid = False
 
     @property
@@ -323,11 +377,11 @@ class Function(object):
         values that are currently set.
         """
         local = self.__local
+        opt_inputs = self.__metadata[2]
         cdef lib.TA_ParamHolder *holder
         holder = __ta_paramHolderAlloc(self.__name)
-        for i, opt_input in enumerate(local.opt_inputs):
-            value = self.__get_opt_input_value(opt_input)
-            type_ = local.opt_inputs[opt_input]['type']
+        for i, (opt_input, value) in enumerate(local.parameters.items()):
+            type_ = opt_inputs[opt_input]['type']
             if type_ == lib.TA_OptInput_RealRange or type_ == lib.TA_OptInput_RealList:
                 __ta_setOptInputParamReal(holder, i, value)
             elif type_ == lib.TA_OptInput_IntegerRange or type_ == lib.TA_OptInput_IntegerList:
@@ -342,10 +396,7 @@ class Function(object):
         """
         Returns a list of the output names returned by this function.
         """
-        ret = self.__local.outputs.keys()
-        if not isinstance(ret, list):
-            ret = list(ret)
-        return ret
+        return list(self.__metadata[3])
 
     @property
     def outputs(self):
@@ -354,15 +405,20 @@ class Function(object):
         parameters. Returned values are a ndarray if there is only one output
         or a list of ndarrays for more than one output.
         """
+        __load_dataframe_types()
         local = self.__local
         if not local.outputs_valid:
             self.__call_function()
-        ret = local.outputs.values()
-        if not isinstance(ret, list):
-            ret = list(ret)
+        return self.__outputs(local.outputs)
+
+    def __outputs(self, results):
+        local = self.__local
+        ret = list(results)
         if __PANDAS_DATAFRAME is not None and \
                 isinstance(local.input_arrays, __PANDAS_DATAFRAME):
             index = local.input_arrays.index
+            # the last values only, when called with tail
+            index = index[len(index) - len(ret[0]):]
             if len(ret) == 1:
                 return __PANDAS_SERIES(ret[0], index=index)
             else:
@@ -393,17 +449,16 @@ class Function(object):
 
     def __call__(self, *args, **kwargs):
         """
-        func_instance([input_arrays,] [parameter_args,] [input_price_series_kwargs,] [parameter_kwargs])
+        func_instance([input_arrays,] [parameter_args,] [input_price_series_kwargs,] [parameter_kwargs] [, tail=None])
 
         This is a shortcut to the outputs property that also allows setting
-        the input_arrays dict and function parameters.
+        the input_arrays dict and function parameters. With tail, only the
+        last tail outputs are computed (from the last tail + lookback input
+        values) and returned, and the outputs property is left as is.
         """
+        __load_dataframe_types()
         local = self.__local
-        # do not cache ta-func parameters passed to __call__
-        opt_input_values = [(param_name, local.opt_inputs[param_name]['value'])
-                            for param_name in local.opt_inputs.keys()]
-        price_series_name_values = [(n, local.input_names[n]['price_series'])
-                                    for n in local.input_names]
+        tail = kwargs.pop('tail', None)
 
         # allow calling with same signature as talib.func module functions
         args = list(args)
@@ -441,27 +496,32 @@ class Function(object):
                 ', '.join(input_price_series_names))
             raise TypeError(msg)
 
-        self.set_function_args(*args, **kwargs)
-        self.__call_function()
-
-        # restore opt_input values to as they were before this call
-        for param_name, value in opt_input_values:
-            local.opt_inputs[param_name]['value'] = value
-        local.info['parameters'] = self.parameters
-
-        # restore input names values to as they were before this call
-        for input_name, value in price_series_name_values:
-            local.input_names[input_name]['price_series'] = value
-            local.info['input_names'][input_name] = value
-
+        if not args and not kwargs:
+            if tail is not None:
+                return self.__outputs(self.__call_function(tail))
+            self.__call_function()
+            return self.outputs
+
+        # do not cache ta-func parameters passed to __call__: they are set on
+        # copies that are swapped out again after this call
+        parameters = local.parameters
+        input_names = local.input_names
+        local.parameters = OrderedDict(parameters)
+        local.input_names = OrderedDict(input_names)
+        try:
+            self.set_function_args(*args, **kwargs)
+            if tail is not None:
+                return self.__outputs(self.__call_function(tail))
+            self.__call_function()
+        finally:
+            local.parameters = parameters
+            local.input_names = input_names
         return self.outputs
 
     # figure out which price series names we're using for inputs
     def __input_price_series_names(self):
-        local = self.__local
         input_price_series_names = []
-        for input_name in local.input_names:
-            price_series = local.input_names[input_name]['price_series']
+        for price_series in self.__local.input_names.values():
             if isinstance(price_series, list): # TALIB-supplied input names
                 for name in price_series:
                     input_price_series_names.append(name)
@@ -469,7 +529,7 @@ class Function(object):
                 input_price_series_names.append(price_series)
         return input_price_series_names
 
-    def __call_function(self):
+    def __call_function(self, tail=None):
         local = self.__local
         input_price_series_names = self.__input_price_series_names()
 
@@ -477,31 +537,22 @@ class Function(object):
         args = []
         for price_series in input_price_series_names:
             series = local.input_arrays[price_series]
-            if __PANDAS_SERIES is not None and \
-                    isinstance(series, __PANDAS_SERIES):
-                series = series.values.astype(float)
-            elif __POLARS_SERIES is not None and \
-                    isinstance(series, __POLARS_SERIES):
-                series = series.to_numpy().astype(float)
-            args.append(series)
-        for opt_input in local.opt_inputs:
-            value = self.__get_opt_input_value(opt_input)
-            args.append(value)
+            args.append(_to_float_array(series))
+        args.extend(local.parameters.values())
 
         # Use the func module to actually call the function.
+        if tail is not None:
+            # the last outputs aren't cached
+            results = self.func_object(*args, tail=tail)
+            return results if isinstance(results, tuple) else (results,)
         results = self.func_object(*args)
-        if isinstance(results, np.ndarray):
-            keys = local.outputs.keys()
-            if not isinstance(keys, list):
-                keys = list(keys)
-            local.outputs[keys[0]] = results
-        else:
-            for i, output in enumerate(local.outputs):
-                local.outputs[output] = results[i]
+        if not isinstance(results, tuple):
+            results = (results,)
+        local.outputs = results
         local.outputs_valid = True
 
     def __check_opt_input_value(self, input_name, value):
-        type_ = self.__local.opt_inputs[input_name]['type']
+        type_ = self.__metadata[2][input_name]['type']
         if type_ in {lib.TA_OptInput_IntegerList, lib.TA_OptInput_IntegerRange}:
             type_ = int
         elif type_ in {lib.TA_OptInput_RealList, lib.TA_OptInput_RealRange}:
@@ -515,16 +566,6 @@ class Function(object):
                     input_name, type_.__name__, type(value).__name__))
         return False
 
-    def __get_opt_input_value(self, input_name):
-        """
-        Returns the user-set value if there is one, otherwise the default.
-        """
-        local = self.__local
-        value = local.opt_inputs[input_name]['value']
-        if value is None:
-            value = local.opt_inputs[input_name]['default_value']
-        return value
-
     def __repr__(self):
         return '%s' % self.info
 
@@ -694,8 +735,8 @@ def _ta_getOptInputParameterInfo(char *function_name, int idx):
 
 def _ta_getOutputParameterInfo(char *function_name, int idx):
     """
-    Returns the function's output info dict for the given index. It has two
-    keys: name and flags.
+    Returns the function's output info dict for the given index. It has three
+    keys: name, flags and type.
     """
     cdef const lib.TA_OutputParameterInfo *info
     retCode = lib.TA_GetOutputParameterInfo(__ta_getFuncHandle(function_name), idx, &info)
@@ -709,7 +750,8 @@ def _ta_getOutputParameterInfo(char *function_name, int idx):
 
     return {
         'name': name,
-        'flags': __get_flags(info.flags, TA_OUTPUT_FLAGS)
+        'flags': __get_flags(info.flags, TA_OUTPUT_FLAGS),
+        'type': info.type
     }
 
 def _get_defaults_and_docs(func_info):
@@ -756,6 +798,266 @@ def _get_defaults_and_docs(func_info):
     return defaults, documentation
 
 
+def _ta_sweep(function_name, list inputs, list parameters):
+    """
+    Calls the function once per tuple of optional input values in parameters,
+    all over the same inputs, and returns a tuple with one (len(parameters),
+    length) matrix per output. inputs holds one tuple of arrays per input of
+    the function, e.g. (high, low, close) for a price input. The arrays are
+    checked and scanned for leading NaN's once for all the calls.
+    """
+    name = str2bytes(function_name)
+    cdef:
+        const lib.TA_FuncHandle *handle = __ta_getFuncHandle(name)
+        const lib.TA_FuncInfo *info
+        const lib.TA_InputParameterInfo *input_info
+        const lib.TA_OptInputParameterInfo *opt_input_info
+        const lib.TA_OutputParameterInfo *output_info
+        lib.TA_ParamHolder *holder
+        lib.TA_RetCode retCode
+        const double *prices[6]
+        np.npy_intp length = -1
+        np.npy_intp nrows = len(parameters)
+        int begidx, lookback, outbegidx, outnbelement
+        unsigned int i, j, k
+        np.npy_intp row
+        np.ndarray array
+
+    _ta_check_success('TA_GetFuncInfo', lib.TA_GetFuncInfo(handle, &info))
+    if len(inputs) != info.nbInput:
+        raise Exception("wrong number of inputs")
+
+    # check the input arrays once
+    arrays = []
+    for series in inputs:
+        series = [check_array(array) for array in series]
+        for array in series:
+            if length == -1:
+                length = array.shape[0]
+            elif array.shape[0] != length:
+                raise Exception("input array lengths are different")
+        arrays.append(series)
+    if length == -1:
+        raise Exception("wrong number of inputs")
+
+    # skip the leading NaN's of all inputs, like the Function API: the
+    # functions are called on the inputs from begidx on
+    valid = numpy.ones(length, dtype=bool)
+    for series in arrays:
+        for array in series:
+            valid &= array == array
+    begidx = valid.argmax() if valid.any() else length - 1
+
+    opt_input_types = []
+    for j in range(info.nbOptInput):
+        retCode = lib.TA_GetOptInputParameterInfo(handle, j, &opt_input_info)
+        _ta_check_success('TA_GetOptInputParameterInfo', retCode)
+        opt_input_types.append(opt_input_info.type)
+
+    outputs = []
+    output_types = []
+    for j in range(info.nbOutput):
+        retCode = lib.TA_GetOutputParameterInfo(handle, j, &output_info)
+        _ta_check_success('TA_GetOutputParameterInfo', retCode)
+        output_types.append(output_info.type)
+        if output_info.type == lib.TA_Output_Integer:
+            outputs.append(numpy.zeros((nrows, length), dtype=numpy.int32))
+        else:
+            outputs.append(numpy.full((nrows, length), numpy.nan))
+
+    holder = __ta_paramHolderAlloc(name)
+    try:
+        for i in range(info.nbInput):
+            retCode = lib.TA_GetInputParameterInfo(handle, i, &input_info)
+            _ta_check_success('TA_GetInputParameterInfo', retCode)
+            series = arrays[i]
+            if input_info.type == lib.TA_Input_Price:
+                # one array per price flag, in the order open, high, low,
+                # close, volume and open interest
+                prices_iter = iter(series)
+                for k in range(6):
+                    prices[k] = NULL
+                    if input_info.flags & (1 << k):
+                        array = next(prices_iter, None)
+                        if array is None:
+                            raise Exception("wrong number of inputs")
+                        prices[k] = <double*>array.data + begidx
+                if next(prices_iter, None) is not None:
+                    raise Exception("wrong number of inputs")
+                retCode = lib.TA_SetInputParamPricePtr(
+                    holder, i, prices[0], prices[1], prices[2], prices[3],
+                    prices[4], prices[5])
+                _ta_check_success('TA_SetInputParamPricePtr', retCode)
+            elif input_info.type == lib.TA_Input_Real and len(series) == 1:
+                array = series[0]
+                retCode = lib.TA_SetInputParamRealPtr(holder, i, <double*>array.data + begidx)
+                _ta_check_success('TA_SetInputParamRealPtr', retCode)
+            else:
+                raise Exception("wrong number of inputs")
+
+        for row in range(nrows):
+            values = parameters[row]
+            if len(values) != info.nbOptInput:
+                raise Exception("wrong number of parameters")
+            for j, value in enumerate(values):
+                type_ = opt_input_types[j]
+                if type_ == lib.TA_OptInput_RealRange or type_ == lib.TA_OptInput_RealList:
+                    __ta_setOptInputParamReal(holder, j, value)
+                else:
+                    __ta_setOptInputParamInteger(holder, j, value)
+            lookback = begidx + __ta_getLookback(holder)
+            if lookback >= length:
+                continue
+            for j in range(info.nbOutput):
+                array = outputs[j]
+                if output_types[j] == lib.TA_Output_Integer:
+                    retCode = lib.TA_SetOutputParamIntegerPtr(
+                        holder, j, <int*>array.data + row * length + lookback)
+                else:
+                    retCode = lib.TA_SetOutputParamRealPtr(
+                        holder, j, <double*>array.data + row * length + lookback)
+                _ta_check_success('TA_SetOutputParamPtr', retCode)
+            with nogil:
+                retCode = lib.TA_CallFunc(holder, 0, length - begidx - 1, &outbegidx, &outnbelement)
+            _ta_check_success('TA_%s' % function_name, retCode)
+    finally:
+        __ta_paramHolderFree(holder)
+    return tuple(outputs)
+
+
+def _ta_pattern_scan(list function_names, list series):
+    """
+    Calls every candlestick function of function_names, with its default
+    parameters, over every (open, high, low, close) tuple of series, and
+    returns one (2, len(function_names), ceil(length / 8)) uint8 array per
+    series. The first plane has the bits of the bars with a positive
+    (bullish) result set, the second those with a negative (bearish) one, in
+    the bit order of numpy.packbits(..., bitorder='little'). One int buffer
+    is reused for all the calls, so no full output array is ever allocated.
+    """
+    cdef:
+        const lib.TA_FuncHandle *handle
+        const lib.TA_FuncInfo *info
+        const lib.TA_InputParameterInfo *input_info
+        const lib.TA_OutputParameterInfo *output_info
+        lib.TA_ParamHolder *holder
+        lib.TA_RetCode retCode
+        np.npy_intp length, nbytes, begidx, bar, maxlength = 0
+        np.npy_intp npatterns = len(function_names)
+        int outbegidx, outnbelement, i
+        Py_ssize_t p, s
+        np.ndarray open, high, low, close, bits, buffer
+        int *out
+        unsigned char *bullish
+        unsigned char *bearish
+
+    # check the arrays and skip their leading NaN's once for all the calls
+    checked = []
+    results = []
+    for prices in series:
+        if len(prices) != 4:
+            raise Exception("wrong number of inputs")
+        open, high, low, close = [check_array(array) for array in prices]
+        length = check_length4(open, high, low, close)
+        valid = (open == open) & (high == high) & (low == low) & (close == close)
+        begidx = valid.argmax() if valid.any() else length
+        checked.append((open, high, low, close, begidx))
+        results.append(numpy.zeros((2, npatterns, (length + 7) // 8), dtype=numpy.uint8))
+        maxlength = max(maxlength, length)
+    buffer = numpy.empty(max(maxlength, 1), dtype=numpy.int32)
+    out = <int*>buffer.data
+
+    for p in range(npatterns):
+        function_name = function_names[p]
+        name = str2bytes(function_name)
+        handle = __ta_getFuncHandle(name)
+        _ta_check_success('TA_GetFuncInfo', lib.TA_GetFuncInfo(handle, &info))
+        _ta_check_success('TA_GetInputParameterInfo', lib.TA_GetInputParameterInfo(handle, 0, &input_info))
+        _ta_check_success('TA_GetOutputParameterInfo', lib.TA_GetOutputParameterInfo(handle, 0, &output_info))
+        if info.nbInput != 1 or input_info.type != lib.TA_Input_Price or (input_info.flags & 0x3f) != 0xf \
+                or info.nbOutput != 1 or output_info.type != lib.TA_Output_Integer:
+            raise Exception('%s is not a candlestick pattern function' % function_name)
+
+        holder = __ta_paramHolderAlloc(name)
+        try:
+            retCode = lib.TA_SetOutputParamIntegerPtr(holder, 0, out)
+            _ta_check_success('TA_SetOutputParamIntegerPtr', retCode)
+            for s in range(len(checked)):
+                open, high, low, close, begidx = checked[s]
+                length = open.shape[0]
+                if begidx >= length:
+                    continue
+                retCode = lib.TA_SetInputParamPricePtr(
+                    holder, 0, <double*>open.data + begidx, <double*>high.data + begidx,
+                    <double*>low.data + begidx, <double*>close.data + begidx, NULL, NULL)
+                _ta_check_success('TA_SetInputParamPricePtr', retCode)
+                bits = results[s]
+                nbytes = bits.shape[2]
+                bullish = <unsigned char*>bits.data + p * nbytes
+                bearish = bullish + npatterns * nbytes
+                with nogil:
+                    retCode = lib.TA_CallFunc(holder, 0, length - begidx - 1, &outbegidx, &outnbelement)
+                    if retCode == lib.TA_SUCCESS:
+                        for i in range(outnbelement):
+                            if out[i] == 0:
+                                continue
+                            bar = begidx + outbegidx + i
+                            if out[i] > 0:
+                                bullish[bar >> 3] |= 1 << (bar & 7)
+                            else:
+                                bearish[bar >> 3] |= 1 << (bar & 7)
+                _ta_check_success('TA_%s' % function_name, retCode)
+        finally:
+            __ta_paramHolderFree(holder)
+    return results
+
+
+def _ta_lookback(function_name, tuple args, dict kwargs):
+    """
+    Returns the lookback (including the unstable period) of the function for
+    the parameters of a Function API call: args are the positional parameter
+    values following the input arrays, kwargs the keyword arguments. Other
+    parameters keep their default value.
+    """
+    name = str2bytes(function_name)
+    opt_inputs = __get_function_metadata(name)[2]
+    if len(args) > len(opt_inputs):
+        raise TypeError('%s() takes at most %d parameters (%d given)' % (
+            function_name, len(opt_inputs), len(args)))
+    cdef lib.TA_ParamHolder *holder = __ta_paramHolderAlloc(name)
+    try:
+        for i, (opt_input, info) in enumerate(opt_inputs.items()):
+            if i < len(args):
+                value = args[i]
+            elif opt_input in kwargs:
+                value = kwargs[opt_input]
+            else:
+                continue
+            type_ = info['type']
+            if type_ == lib.TA_OptInput_RealRange or type_ == lib.TA_OptInput_RealList:
+                __ta_setOptInputParamReal(holder, i, value)
+            else:
+                __ta_setOptInputParamInteger(holder, i, value)
+        return __ta_getLookback(holder)
+    finally:
+        __ta_paramHolderFree(holder)
+
+def _ta_parameters(function_name, tuple args, dict kwargs):
+    """
+    Returns the parameter values of a Function API call by name, with the
+    defaults filled in, and whether the function has an unstable period.
+    """
+    name = str2bytes(function_name)
+    info, _, opt_inputs, _ = __get_function_metadata(name)
+    parameters = OrderedDict()
+    for i, (opt_input, opt_info) in enumerate(opt_inputs.items()):
+        if i < len(args):
+            parameters[opt_input] = args[i]
+        else:
+            parameters[opt_input] = kwargs.get(opt_input, opt_info['default_value'])
+    unstable = 'Function has an unstable period' in (info['function_flags'] or ())
+    return parameters, unstable
+
 ###############    PRIVATE C-level-only functions    ###########################
 # These map 1-1 with native C TALIB abstract interface calls. Their names are the
 # same except for having the leading 4 characters lowercased.
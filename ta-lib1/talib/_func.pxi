@@ -1,6 +1,7 @@
 cimport numpy as np
 from numpy import nan
 from cython import boundscheck, wraparound
+from cython cimport floating
 
 # _ta_check_success: defined in _common.pxi
 
@@ -17,8 +18,12 @@ np.import_array() # Initialize the NumPy C API
 cimport _ta_lib as lib
 from _ta_lib cimport TA_RetCode
 
-cdef np.ndarray check_array(np.ndarray real):
-    if PyArray_TYPE(real) != np.NPY_DOUBLE:
+cdef np.ndarray check_array(np.ndarray real, bint single=False):
+    # single: float32 inputs, for the TA_S_* functions
+    if single:
+        if PyArray_TYPE(real) != np.NPY_FLOAT:
+            raise Exception("input array type is not float")
+    elif PyArray_TYPE(real) != np.NPY_DOUBLE:
         raise Exception("input array type is not double")
     if real.ndim != 1:
         raise Exception("input array has wrong dimensions")
@@ -56,7 +61,7 @@ cdef np.npy_intp check_length4(np.ndarray a1, np.ndarray a2, np.ndarray a3, np.n
         raise Exception("input array lengths are different")
     return length
 
-cdef np.npy_int check_begidx1(np.npy_intp length, double* a1):
+cdef np.npy_int check_begidx1(np.npy_intp length, floating* a1):
     cdef:
         double val
     for i from 0 <= i < length:
@@ -67,7 +72,7 @@ cdef np.npy_int check_begidx1(np.npy_intp length, double* a1):
     else:
         return length - 1
 
-cdef np.npy_int check_begidx2(np.npy_intp length, double* a1, double* a2):
+cdef np.npy_int check_begidx2(np.npy_intp length, floating* a1, floating* a2):
     cdef:
         double val
     for i from 0 <= i < length:
@@ -81,7 +86,7 @@ cdef np.npy_int check_begidx2(np.npy_intp length, double* a1, double* a2):
     else:
         return length - 1
 
-cdef np.npy_int check_begidx3(np.npy_intp length, double* a1, double* a2, double* a3):
+cdef np.npy_int check_begidx3(np.npy_intp length, floating* a1, floating* a2, floating* a3):
     cdef:
         double val
     for i from 0 <= i < length:
@@ -98,7 +103,7 @@ cdef np.npy_int check_begidx3(np.npy_intp length, double* a1, double* a2, double
     else:
         return length - 1
 
-cdef np.npy_int check_begidx4(np.npy_intp length, double* a1, double* a2, double* a3, double* a4):
+cdef np.npy_int check_begidx4(np.npy_intp length, floating* a1, floating* a2, floating* a3, floating* a4):
     cdef:
         double val
     for i from 0 <= i < length:
@@ -138,11 +143,79 @@ cdef np.ndarray make_int_array(np.npy_intp length, int lookback):
         outinteger_data[i] = 0
     return outinteger
 
+cdef np.ndarray check_one_out_array(object out, np.npy_intp length, int typenum, tuple inputs):
+    cdef:
+        np.ndarray output
+        np.ndarray real
+        char* start
+        char* end
+    if not isinstance(out, np.ndarray):
+        raise Exception("out array is not an ndarray")
+    output = out
+    if PyArray_TYPE(output) != typenum:
+        raise Exception("out array type is not %s" % ("double" if typenum == np.NPY_DOUBLE else "int32"))
+    if output.ndim != 1:
+        raise Exception("out array has wrong dimensions")
+    if output.shape[0] != length:
+        raise Exception("out array length is different from input")
+    if not (PyArray_FLAGS(output) & np.NPY_C_CONTIGUOUS):
+        raise Exception("out array is not contiguous")
+    if not (PyArray_FLAGS(output) & np.NPY_WRITEABLE):
+        raise Exception("out array is not writeable")
+    # TA-Lib reads inputs behind the output it writes, so they must not overlap
+    start = output.data
+    end = start + np.PyArray_NBYTES(output)
+    for real in inputs:
+        if real.data < end and start < real.data + np.PyArray_NBYTES(real):
+            raise Exception("out array overlaps an input array")
+    return output
+
+cdef np.ndarray check_out_array(object out, int index, int count, np.npy_intp length, int typenum, tuple inputs):
+    if isinstance(out, (tuple, list)):
+        if len(out) != count:
+            raise Exception("out must hold %d arrays" % count)
+        if index == 0:
+            # every out array is checked before the first is written to; the
+            # outputs of a function all have the same type
+            for i in range(count):
+                check_one_out_array(out[i], length, typenum, inputs)
+                for j in range(i):
+                    if numpy.shares_memory(out[i], out[j]):
+                        raise Exception("out arrays overlap each other")
+        out = out[index]
+    elif count != 1:
+        raise Exception("out must be a tuple of %d arrays" % count)
+    return check_one_out_array(out, length, typenum, inputs)
+
+cdef np.ndarray make_double_array_out(object out, int index, int count, np.npy_intp length, int lookback, tuple inputs):
+    cdef:
+        np.ndarray outreal
+        double* outreal_data
+    if out is None:
+        return make_double_array(length, lookback)
+    outreal = check_out_array(out, index, count, length, np.NPY_DOUBLE, inputs)
+    outreal_data = <double*>outreal.data
+    for i from 0 <= i < min(lookback, length):
+        outreal_data[i] = NaN
+    return outreal
+
+cdef np.ndarray make_int_array_out(object out, int index, int count, np.npy_intp length, int lookback, tuple inputs):
+    cdef:
+        np.ndarray outinteger
+        int* outinteger_data
+    if out is None:
+        return make_int_array(length, lookback)
+    outinteger = check_out_array(out, index, count, length, np.NPY_INT32, inputs)
+    outinteger_data = <int*>outinteger.data
+    for i from 0 <= i < min(lookback, length):
+        outinteger_data[i] = 0
+    return outinteger
+
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ACOS( np.ndarray real not None ):
-    """ ACOS(real)
+def ACOS( np.ndarray real not None , out=None ):
+    """ ACOS(real[, out=None])
 
     Vector Trigonometric ACos (Math Transform)
 
@@ -153,25 +226,34 @@ def ACOS( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ACOS_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ACOS( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ACOS( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ACOS( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ACOS", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def AD( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None ):
-    """ AD(high, low, close, volume)
+def AD( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None , out=None ):
+    """ AD(high, low, close, volume[, out=None])
 
     Chaikin A/D Line (Volume Indicators)
 
@@ -182,28 +264,37 @@ def AD( np.ndarray high not None , np.ndarray low not None , np.ndarray close no
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
-    volume = check_array(volume)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
-    begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(high.data), <float*>(low.data), <float*>(close.data), <float*>(volume.data))
+    else:
+        begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_AD_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_AD( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close, volume))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AD( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , <float *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_AD( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_AD", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ADD( np.ndarray real0 not None , np.ndarray real1 not None ):
-    """ ADD(real0, real1)
+def ADD( np.ndarray real0 not None , np.ndarray real1 not None , out=None ):
+    """ ADD(real0, real1[, out=None])
 
     Vector Arithmetic Add (Math Operators)
 
@@ -215,26 +306,35 @@ def ADD( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ADD_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ADD( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADD( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ADD( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ADD", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ADOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None , int fastperiod=-2**31 , int slowperiod=-2**31 ):
-    """ ADOSC(high, low, close, volume[, fastperiod=?, slowperiod=?])
+def ADOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None , int fastperiod=-2**31 , int slowperiod=-2**31 , out=None ):
+    """ ADOSC(high, low, close, volume[, fastperiod=?, slowperiod=?, out=None])
 
     Chaikin A/D Oscillator (Volume Indicators)
 
@@ -248,28 +348,37 @@ def ADOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray close
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
-    volume = check_array(volume)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
-    begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(high.data), <float*>(low.data), <float*>(close.data), <float*>(volume.data))
+    else:
+        begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ADOSC_Lookback( fastperiod , slowperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ADOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , fastperiod , slowperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close, volume))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADOSC( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , <float *>(volume.data)+begidx , fastperiod , slowperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ADOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , fastperiod , slowperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ADOSC", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ADX( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ ADX(high, low, close[, timeperiod=?])
+def ADX( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ ADX(high, low, close[, timeperiod=?, out=None])
 
     Average Directional Movement Index (Momentum Indicators)
 
@@ -282,27 +391,36 @@ def ADX( np.ndarray high not None , np.ndarray low not None , np.ndarray close n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ADX_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ADX( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADX( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ADX( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ADX", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ADXR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ ADXR(high, low, close[, timeperiod=?])
+def ADXR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ ADXR(high, low, close[, timeperiod=?, out=None])
 
     Average Directional Movement Index Rating (Momentum Indicators)
 
@@ -315,27 +433,36 @@ def ADXR( np.ndarray high not None , np.ndarray low not None , np.ndarray close
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ADXR_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ADXR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADXR( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ADXR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ADXR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def APO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int matype=0 ):
-    """ APO(real[, fastperiod=?, slowperiod=?, matype=?])
+def APO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int matype=0 , out=None ):
+    """ APO(real[, fastperiod=?, slowperiod=?, matype=?, out=None])
 
     Absolute Price Oscillator (Momentum Indicators)
 
@@ -350,25 +477,34 @@ def APO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**3
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_APO_Lookback( fastperiod , slowperiod , matype )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_APO( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_APO( 0 , endidx , <float *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_APO( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_APO", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def AROON( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 ):
-    """ AROON(high, low[, timeperiod=?])
+def AROON( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 , out=None ):
+    """ AROON(high, low[, timeperiod=?, out=None])
 
     Aroon (Momentum Indicators)
 
@@ -382,28 +518,37 @@ def AROON( np.ndarray high not None , np.ndarray low not None , int timeperiod=-
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outaroondown
         np.ndarray outaroonup
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_AROON_Lookback( timeperiod )
-    outaroondown = make_double_array(length, lookback)
-    outaroonup = make_double_array(length, lookback)
-    retCode = lib.TA_AROON( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outaroondown.data)+lookback , <double *>(outaroonup.data)+lookback )
+    outaroondown = make_double_array_out(out, 0, 2, length, lookback, (high, low))
+    outaroonup = make_double_array_out(out, 1, 2, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AROON( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outaroondown.data)+lookback , <double *>(outaroonup.data)+lookback )
+        else:
+            retCode = lib.TA_AROON( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outaroondown.data)+lookback , <double *>(outaroonup.data)+lookback )
     _ta_check_success("TA_AROON", retCode)
     return outaroondown , outaroonup 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def AROONOSC( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 ):
-    """ AROONOSC(high, low[, timeperiod=?])
+def AROONOSC( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 , out=None ):
+    """ AROONOSC(high, low[, timeperiod=?, out=None])
 
     Aroon Oscillator (Momentum Indicators)
 
@@ -416,26 +561,35 @@ def AROONOSC( np.ndarray high not None , np.ndarray low not None , int timeperio
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_AROONOSC_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_AROONOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AROONOSC( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_AROONOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_AROONOSC", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ASIN( np.ndarray real not None ):
-    """ ASIN(real)
+def ASIN( np.ndarray real not None , out=None ):
+    """ ASIN(real[, out=None])
 
     Vector Trigonometric ASin (Math Transform)
 
@@ -446,25 +600,34 @@ def ASIN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ASIN_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ASIN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ASIN( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ASIN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ASIN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ATAN( np.ndarray real not None ):
-    """ ATAN(real)
+def ATAN( np.ndarray real not None , out=None ):
+    """ ATAN(real[, out=None])
 
     Vector Trigonometric ATan (Math Transform)
 
@@ -475,25 +638,34 @@ def ATAN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ATAN_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ATAN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ATAN( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ATAN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ATAN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ ATR(high, low, close[, timeperiod=?])
+def ATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ ATR(high, low, close[, timeperiod=?, out=None])
 
     Average True Range (Volatility Indicators)
 
@@ -506,27 +678,36 @@ def ATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ATR_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ATR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ATR( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ATR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ATR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def AVGPRICE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ AVGPRICE(open, high, low, close)
+def AVGPRICE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ AVGPRICE(open, high, low, close[, out=None])
 
     Average Price (Price Transform)
 
@@ -537,28 +718,37 @@ def AVGPRICE( np.ndarray open not None , np.ndarray high not None , np.ndarray l
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_AVGPRICE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_AVGPRICE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AVGPRICE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_AVGPRICE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_AVGPRICE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def BBANDS( np.ndarray real not None , int timeperiod=-2**31 , double nbdevup=-4e37 , double nbdevdn=-4e37 , int matype=0 ):
-    """ BBANDS(real[, timeperiod=?, nbdevup=?, nbdevdn=?, matype=?])
+def BBANDS( np.ndarray real not None , int timeperiod=-2**31 , double nbdevup=-4e37 , double nbdevdn=-4e37 , int matype=0 , out=None ):
+    """ BBANDS(real[, timeperiod=?, nbdevup=?, nbdevdn=?, matype=?, out=None])
 
     Bollinger Bands (Overlap Studies)
 
@@ -576,6 +766,7 @@ def BBANDS( np.ndarray real not None , int timeperiod=-2**31 , double nbdevup=-4
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
@@ -583,22 +774,30 @@ def BBANDS( np.ndarray real not None , int timeperiod=-2**31 , double nbdevup=-4
         np.ndarray outrealupperband
         np.ndarray outrealmiddleband
         np.ndarray outreallowerband
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_BBANDS_Lookback( timeperiod , nbdevup , nbdevdn , matype )
-    outrealupperband = make_double_array(length, lookback)
-    outrealmiddleband = make_double_array(length, lookback)
-    outreallowerband = make_double_array(length, lookback)
-    retCode = lib.TA_BBANDS( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , <double *>(outrealupperband.data)+lookback , <double *>(outrealmiddleband.data)+lookback , <double *>(outreallowerband.data)+lookback )
+    outrealupperband = make_double_array_out(out, 0, 3, length, lookback, (real,))
+    outrealmiddleband = make_double_array_out(out, 1, 3, length, lookback, (real,))
+    outreallowerband = make_double_array_out(out, 2, 3, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BBANDS( 0 , endidx , <float *>(real.data)+begidx , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , <double *>(outrealupperband.data)+lookback , <double *>(outrealmiddleband.data)+lookback , <double *>(outreallowerband.data)+lookback )
+        else:
+            retCode = lib.TA_BBANDS( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , <double *>(outrealupperband.data)+lookback , <double *>(outrealmiddleband.data)+lookback , <double *>(outreallowerband.data)+lookback )
     _ta_check_success("TA_BBANDS", retCode)
     return outrealupperband , outrealmiddleband , outreallowerband 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def BETA( np.ndarray real0 not None , np.ndarray real1 not None , int timeperiod=-2**31 ):
-    """ BETA(real0, real1[, timeperiod=?])
+def BETA( np.ndarray real0 not None , np.ndarray real1 not None , int timeperiod=-2**31 , out=None ):
+    """ BETA(real0, real1[, timeperiod=?, out=None])
 
     Beta (Statistic Functions)
 
@@ -612,26 +811,35 @@ def BETA( np.ndarray real0 not None , np.ndarray real1 not None , int timeperiod
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_BETA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_BETA( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BETA( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_BETA( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_BETA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def BOP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ BOP(open, high, low, close)
+def BOP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ BOP(open, high, low, close[, out=None])
 
     Balance Of Power (Momentum Indicators)
 
@@ -642,28 +850,37 @@ def BOP( np.ndarray open not None , np.ndarray high not None , np.ndarray low no
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_BOP_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_BOP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BOP( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_BOP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_BOP", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CCI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ CCI(high, low, close[, timeperiod=?])
+def CCI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ CCI(high, low, close[, timeperiod=?, out=None])
 
     Commodity Channel Index (Momentum Indicators)
 
@@ -676,27 +893,36 @@ def CCI( np.ndarray high not None , np.ndarray low not None , np.ndarray close n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CCI_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_CCI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CCI( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_CCI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_CCI", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL2CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL2CROWS(open, high, low, close)
+def CDL2CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL2CROWS(open, high, low, close[, out=None])
 
     Two Crows (Pattern Recognition)
 
@@ -707,28 +933,37 @@ def CDL2CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL2CROWS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL2CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL2CROWS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL2CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL2CROWS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3BLACKCROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3BLACKCROWS(open, high, low, close)
+def CDL3BLACKCROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3BLACKCROWS(open, high, low, close[, out=None])
 
     Three Black Crows (Pattern Recognition)
 
@@ -739,28 +974,37 @@ def CDL3BLACKCROWS( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3BLACKCROWS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3BLACKCROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3BLACKCROWS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3BLACKCROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3BLACKCROWS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3INSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3INSIDE(open, high, low, close)
+def CDL3INSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3INSIDE(open, high, low, close[, out=None])
 
     Three Inside Up/Down (Pattern Recognition)
 
@@ -771,28 +1015,37 @@ def CDL3INSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3INSIDE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3INSIDE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3INSIDE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3INSIDE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3INSIDE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3LINESTRIKE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3LINESTRIKE(open, high, low, close)
+def CDL3LINESTRIKE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3LINESTRIKE(open, high, low, close[, out=None])
 
     Three-Line Strike  (Pattern Recognition)
 
@@ -803,28 +1056,37 @@ def CDL3LINESTRIKE( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3LINESTRIKE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3LINESTRIKE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3LINESTRIKE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3LINESTRIKE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3LINESTRIKE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3OUTSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3OUTSIDE(open, high, low, close)
+def CDL3OUTSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3OUTSIDE(open, high, low, close[, out=None])
 
     Three Outside Up/Down (Pattern Recognition)
 
@@ -835,28 +1097,37 @@ def CDL3OUTSIDE( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3OUTSIDE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3OUTSIDE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3OUTSIDE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3OUTSIDE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3OUTSIDE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3STARSINSOUTH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3STARSINSOUTH(open, high, low, close)
+def CDL3STARSINSOUTH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3STARSINSOUTH(open, high, low, close[, out=None])
 
     Three Stars In The South (Pattern Recognition)
 
@@ -867,28 +1138,37 @@ def CDL3STARSINSOUTH( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3STARSINSOUTH_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3STARSINSOUTH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3STARSINSOUTH( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3STARSINSOUTH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3STARSINSOUTH", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDL3WHITESOLDIERS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDL3WHITESOLDIERS(open, high, low, close)
+def CDL3WHITESOLDIERS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDL3WHITESOLDIERS(open, high, low, close[, out=None])
 
     Three Advancing White Soldiers (Pattern Recognition)
 
@@ -899,28 +1179,37 @@ def CDL3WHITESOLDIERS( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDL3WHITESOLDIERS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDL3WHITESOLDIERS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3WHITESOLDIERS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDL3WHITESOLDIERS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDL3WHITESOLDIERS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLABANDONEDBABY( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 ):
-    """ CDLABANDONEDBABY(open, high, low, close[, penetration=?])
+def CDLABANDONEDBABY( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 , out=None ):
+    """ CDLABANDONEDBABY(open, high, low, close[, penetration=?, out=None])
 
     Abandoned Baby (Pattern Recognition)
 
@@ -933,28 +1222,37 @@ def CDLABANDONEDBABY( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLABANDONEDBABY_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLABANDONEDBABY( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLABANDONEDBABY( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLABANDONEDBABY( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLABANDONEDBABY", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLADVANCEBLOCK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLADVANCEBLOCK(open, high, low, close)
+def CDLADVANCEBLOCK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLADVANCEBLOCK(open, high, low, close[, out=None])
 
     Advance Block (Pattern Recognition)
 
@@ -965,28 +1263,37 @@ def CDLADVANCEBLOCK( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLADVANCEBLOCK_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLADVANCEBLOCK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLADVANCEBLOCK( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLADVANCEBLOCK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLADVANCEBLOCK", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLBELTHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLBELTHOLD(open, high, low, close)
+def CDLBELTHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLBELTHOLD(open, high, low, close[, out=None])
 
     Belt-hold (Pattern Recognition)
 
@@ -997,28 +1304,37 @@ def CDLBELTHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLBELTHOLD_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLBELTHOLD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLBELTHOLD( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLBELTHOLD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLBELTHOLD", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLBREAKAWAY( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLBREAKAWAY(open, high, low, close)
+def CDLBREAKAWAY( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLBREAKAWAY(open, high, low, close[, out=None])
 
     Breakaway (Pattern Recognition)
 
@@ -1029,28 +1345,37 @@ def CDLBREAKAWAY( np.ndarray open not None , np.ndarray high not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLBREAKAWAY_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLBREAKAWAY( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLBREAKAWAY( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLBREAKAWAY( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLBREAKAWAY", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLCLOSINGMARUBOZU( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLCLOSINGMARUBOZU(open, high, low, close)
+def CDLCLOSINGMARUBOZU( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLCLOSINGMARUBOZU(open, high, low, close[, out=None])
 
     Closing Marubozu (Pattern Recognition)
 
@@ -1061,28 +1386,37 @@ def CDLCLOSINGMARUBOZU( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLCLOSINGMARUBOZU_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLCLOSINGMARUBOZU( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCLOSINGMARUBOZU( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLCLOSINGMARUBOZU( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLCLOSINGMARUBOZU", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLCONCEALBABYSWALL( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLCONCEALBABYSWALL(open, high, low, close)
+def CDLCONCEALBABYSWALL( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLCONCEALBABYSWALL(open, high, low, close[, out=None])
 
     Concealing Baby Swallow (Pattern Recognition)
 
@@ -1093,28 +1427,37 @@ def CDLCONCEALBABYSWALL( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLCONCEALBABYSWALL_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLCONCEALBABYSWALL( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCONCEALBABYSWALL( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLCONCEALBABYSWALL( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLCONCEALBABYSWALL", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLCOUNTERATTACK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLCOUNTERATTACK(open, high, low, close)
+def CDLCOUNTERATTACK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLCOUNTERATTACK(open, high, low, close[, out=None])
 
     Counterattack (Pattern Recognition)
 
@@ -1125,28 +1468,37 @@ def CDLCOUNTERATTACK( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLCOUNTERATTACK_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLCOUNTERATTACK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCOUNTERATTACK( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLCOUNTERATTACK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLCOUNTERATTACK", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLDARKCLOUDCOVER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.5 ):
-    """ CDLDARKCLOUDCOVER(open, high, low, close[, penetration=?])
+def CDLDARKCLOUDCOVER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.5 , out=None ):
+    """ CDLDARKCLOUDCOVER(open, high, low, close[, penetration=?, out=None])
 
     Dark Cloud Cover (Pattern Recognition)
 
@@ -1159,28 +1511,37 @@ def CDLDARKCLOUDCOVER( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLDARKCLOUDCOVER_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLDARKCLOUDCOVER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDARKCLOUDCOVER( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLDARKCLOUDCOVER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLDARKCLOUDCOVER", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLDOJI(open, high, low, close)
+def CDLDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLDOJI(open, high, low, close[, out=None])
 
     Doji (Pattern Recognition)
 
@@ -1191,28 +1552,37 @@ def CDLDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray lo
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLDOJI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDOJI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLDOJI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLDOJISTAR(open, high, low, close)
+def CDLDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLDOJISTAR(open, high, low, close[, out=None])
 
     Doji Star (Pattern Recognition)
 
@@ -1223,28 +1593,37 @@ def CDLDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLDOJISTAR_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDOJISTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLDOJISTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLDRAGONFLYDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLDRAGONFLYDOJI(open, high, low, close)
+def CDLDRAGONFLYDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLDRAGONFLYDOJI(open, high, low, close[, out=None])
 
     Dragonfly Doji (Pattern Recognition)
 
@@ -1255,28 +1634,37 @@ def CDLDRAGONFLYDOJI( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLDRAGONFLYDOJI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLDRAGONFLYDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDRAGONFLYDOJI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLDRAGONFLYDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLDRAGONFLYDOJI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLENGULFING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLENGULFING(open, high, low, close)
+def CDLENGULFING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLENGULFING(open, high, low, close[, out=None])
 
     Engulfing Pattern (Pattern Recognition)
 
@@ -1287,28 +1675,37 @@ def CDLENGULFING( np.ndarray open not None , np.ndarray high not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLENGULFING_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLENGULFING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLENGULFING( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLENGULFING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLENGULFING", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLEVENINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 ):
-    """ CDLEVENINGDOJISTAR(open, high, low, close[, penetration=?])
+def CDLEVENINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 , out=None ):
+    """ CDLEVENINGDOJISTAR(open, high, low, close[, penetration=?, out=None])
 
     Evening Doji Star (Pattern Recognition)
 
@@ -1321,28 +1718,37 @@ def CDLEVENINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLEVENINGDOJISTAR_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLEVENINGDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLEVENINGDOJISTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLEVENINGDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLEVENINGDOJISTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLEVENINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 ):
-    """ CDLEVENINGSTAR(open, high, low, close[, penetration=?])
+def CDLEVENINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 , out=None ):
+    """ CDLEVENINGSTAR(open, high, low, close[, penetration=?, out=None])
 
     Evening Star (Pattern Recognition)
 
@@ -1355,28 +1761,37 @@ def CDLEVENINGSTAR( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLEVENINGSTAR_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLEVENINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLEVENINGSTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLEVENINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLEVENINGSTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLGAPSIDESIDEWHITE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLGAPSIDESIDEWHITE(open, high, low, close)
+def CDLGAPSIDESIDEWHITE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLGAPSIDESIDEWHITE(open, high, low, close[, out=None])
 
     Up/Down-gap side-by-side white lines (Pattern Recognition)
 
@@ -1387,28 +1802,37 @@ def CDLGAPSIDESIDEWHITE( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLGAPSIDESIDEWHITE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLGAPSIDESIDEWHITE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLGAPSIDESIDEWHITE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLGAPSIDESIDEWHITE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLGAPSIDESIDEWHITE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLGRAVESTONEDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLGRAVESTONEDOJI(open, high, low, close)
+def CDLGRAVESTONEDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLGRAVESTONEDOJI(open, high, low, close[, out=None])
 
     Gravestone Doji (Pattern Recognition)
 
@@ -1419,28 +1843,37 @@ def CDLGRAVESTONEDOJI( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLGRAVESTONEDOJI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLGRAVESTONEDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLGRAVESTONEDOJI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLGRAVESTONEDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLGRAVESTONEDOJI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHAMMER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHAMMER(open, high, low, close)
+def CDLHAMMER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHAMMER(open, high, low, close[, out=None])
 
     Hammer (Pattern Recognition)
 
@@ -1451,28 +1884,37 @@ def CDLHAMMER( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHAMMER_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHAMMER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHAMMER( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHAMMER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHAMMER", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHANGINGMAN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHANGINGMAN(open, high, low, close)
+def CDLHANGINGMAN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHANGINGMAN(open, high, low, close[, out=None])
 
     Hanging Man (Pattern Recognition)
 
@@ -1483,28 +1925,37 @@ def CDLHANGINGMAN( np.ndarray open not None , np.ndarray high not None , np.ndar
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHANGINGMAN_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHANGINGMAN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHANGINGMAN( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHANGINGMAN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHANGINGMAN", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHARAMI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHARAMI(open, high, low, close)
+def CDLHARAMI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHARAMI(open, high, low, close[, out=None])
 
     Harami Pattern (Pattern Recognition)
 
@@ -1515,28 +1966,37 @@ def CDLHARAMI( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHARAMI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHARAMI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHARAMI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHARAMI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHARAMI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHARAMICROSS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHARAMICROSS(open, high, low, close)
+def CDLHARAMICROSS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHARAMICROSS(open, high, low, close[, out=None])
 
     Harami Cross Pattern (Pattern Recognition)
 
@@ -1547,28 +2007,37 @@ def CDLHARAMICROSS( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHARAMICROSS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHARAMICROSS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHARAMICROSS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHARAMICROSS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHARAMICROSS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHIGHWAVE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHIGHWAVE(open, high, low, close)
+def CDLHIGHWAVE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHIGHWAVE(open, high, low, close[, out=None])
 
     High-Wave Candle (Pattern Recognition)
 
@@ -1579,28 +2048,37 @@ def CDLHIGHWAVE( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHIGHWAVE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHIGHWAVE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIGHWAVE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHIGHWAVE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHIGHWAVE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHIKKAKE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHIKKAKE(open, high, low, close)
+def CDLHIKKAKE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHIKKAKE(open, high, low, close[, out=None])
 
     Hikkake Pattern (Pattern Recognition)
 
@@ -1611,28 +2089,37 @@ def CDLHIKKAKE( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHIKKAKE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHIKKAKE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIKKAKE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHIKKAKE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHIKKAKE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHIKKAKEMOD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHIKKAKEMOD(open, high, low, close)
+def CDLHIKKAKEMOD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHIKKAKEMOD(open, high, low, close[, out=None])
 
     Modified Hikkake Pattern (Pattern Recognition)
 
@@ -1643,28 +2130,37 @@ def CDLHIKKAKEMOD( np.ndarray open not None , np.ndarray high not None , np.ndar
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHIKKAKEMOD_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHIKKAKEMOD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIKKAKEMOD( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHIKKAKEMOD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHIKKAKEMOD", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLHOMINGPIGEON( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLHOMINGPIGEON(open, high, low, close)
+def CDLHOMINGPIGEON( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLHOMINGPIGEON(open, high, low, close[, out=None])
 
     Homing Pigeon (Pattern Recognition)
 
@@ -1675,28 +2171,37 @@ def CDLHOMINGPIGEON( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLHOMINGPIGEON_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLHOMINGPIGEON( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHOMINGPIGEON( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLHOMINGPIGEON( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLHOMINGPIGEON", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLIDENTICAL3CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLIDENTICAL3CROWS(open, high, low, close)
+def CDLIDENTICAL3CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLIDENTICAL3CROWS(open, high, low, close[, out=None])
 
     Identical Three Crows (Pattern Recognition)
 
@@ -1707,28 +2212,37 @@ def CDLIDENTICAL3CROWS( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLIDENTICAL3CROWS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLIDENTICAL3CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLIDENTICAL3CROWS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLIDENTICAL3CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLIDENTICAL3CROWS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLINNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLINNECK(open, high, low, close)
+def CDLINNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLINNECK(open, high, low, close[, out=None])
 
     In-Neck Pattern (Pattern Recognition)
 
@@ -1739,28 +2253,37 @@ def CDLINNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLINNECK_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLINNECK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLINNECK( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLINNECK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLINNECK", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLINVERTEDHAMMER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLINVERTEDHAMMER(open, high, low, close)
+def CDLINVERTEDHAMMER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLINVERTEDHAMMER(open, high, low, close[, out=None])
 
     Inverted Hammer (Pattern Recognition)
 
@@ -1771,28 +2294,37 @@ def CDLINVERTEDHAMMER( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLINVERTEDHAMMER_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLINVERTEDHAMMER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLINVERTEDHAMMER( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLINVERTEDHAMMER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLINVERTEDHAMMER", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLKICKING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLKICKING(open, high, low, close)
+def CDLKICKING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLKICKING(open, high, low, close[, out=None])
 
     Kicking (Pattern Recognition)
 
@@ -1803,28 +2335,37 @@ def CDLKICKING( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLKICKING_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLKICKING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLKICKING( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLKICKING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLKICKING", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLKICKINGBYLENGTH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLKICKINGBYLENGTH(open, high, low, close)
+def CDLKICKINGBYLENGTH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLKICKINGBYLENGTH(open, high, low, close[, out=None])
 
     Kicking - bull/bear determined by the longer marubozu (Pattern Recognition)
 
@@ -1835,28 +2376,37 @@ def CDLKICKINGBYLENGTH( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLKICKINGBYLENGTH_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLKICKINGBYLENGTH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLKICKINGBYLENGTH( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLKICKINGBYLENGTH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLKICKINGBYLENGTH", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLLADDERBOTTOM( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLLADDERBOTTOM(open, high, low, close)
+def CDLLADDERBOTTOM( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLLADDERBOTTOM(open, high, low, close[, out=None])
 
     Ladder Bottom (Pattern Recognition)
 
@@ -1867,28 +2417,37 @@ def CDLLADDERBOTTOM( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLLADDERBOTTOM_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLLADDERBOTTOM( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLADDERBOTTOM( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLLADDERBOTTOM( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLLADDERBOTTOM", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLLONGLEGGEDDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLLONGLEGGEDDOJI(open, high, low, close)
+def CDLLONGLEGGEDDOJI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLLONGLEGGEDDOJI(open, high, low, close[, out=None])
 
     Long Legged Doji (Pattern Recognition)
 
@@ -1899,28 +2458,37 @@ def CDLLONGLEGGEDDOJI( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLLONGLEGGEDDOJI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLLONGLEGGEDDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLONGLEGGEDDOJI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLLONGLEGGEDDOJI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLLONGLEGGEDDOJI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLLONGLINE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLLONGLINE(open, high, low, close)
+def CDLLONGLINE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLLONGLINE(open, high, low, close[, out=None])
 
     Long Line Candle (Pattern Recognition)
 
@@ -1931,28 +2499,37 @@ def CDLLONGLINE( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLLONGLINE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLLONGLINE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLONGLINE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLLONGLINE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLLONGLINE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLMARUBOZU( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLMARUBOZU(open, high, low, close)
+def CDLMARUBOZU( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLMARUBOZU(open, high, low, close[, out=None])
 
     Marubozu (Pattern Recognition)
 
@@ -1963,28 +2540,37 @@ def CDLMARUBOZU( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLMARUBOZU_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLMARUBOZU( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMARUBOZU( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLMARUBOZU( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLMARUBOZU", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLMATCHINGLOW( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLMATCHINGLOW(open, high, low, close)
+def CDLMATCHINGLOW( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLMATCHINGLOW(open, high, low, close[, out=None])
 
     Matching Low (Pattern Recognition)
 
@@ -1995,28 +2581,37 @@ def CDLMATCHINGLOW( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLMATCHINGLOW_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLMATCHINGLOW( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMATCHINGLOW( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLMATCHINGLOW( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLMATCHINGLOW", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLMATHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.5 ):
-    """ CDLMATHOLD(open, high, low, close[, penetration=?])
+def CDLMATHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.5 , out=None ):
+    """ CDLMATHOLD(open, high, low, close[, penetration=?, out=None])
 
     Mat Hold (Pattern Recognition)
 
@@ -2029,28 +2624,37 @@ def CDLMATHOLD( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLMATHOLD_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLMATHOLD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMATHOLD( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLMATHOLD( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLMATHOLD", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLMORNINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 ):
-    """ CDLMORNINGDOJISTAR(open, high, low, close[, penetration=?])
+def CDLMORNINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 , out=None ):
+    """ CDLMORNINGDOJISTAR(open, high, low, close[, penetration=?, out=None])
 
     Morning Doji Star (Pattern Recognition)
 
@@ -2063,28 +2667,37 @@ def CDLMORNINGDOJISTAR( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLMORNINGDOJISTAR_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLMORNINGDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMORNINGDOJISTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLMORNINGDOJISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLMORNINGDOJISTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLMORNINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 ):
-    """ CDLMORNINGSTAR(open, high, low, close[, penetration=?])
+def CDLMORNINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , double penetration=0.3 , out=None ):
+    """ CDLMORNINGSTAR(open, high, low, close[, penetration=?, out=None])
 
     Morning Star (Pattern Recognition)
 
@@ -2097,28 +2710,37 @@ def CDLMORNINGSTAR( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLMORNINGSTAR_Lookback( penetration )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLMORNINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMORNINGSTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLMORNINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , penetration , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLMORNINGSTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLONNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLONNECK(open, high, low, close)
+def CDLONNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLONNECK(open, high, low, close[, out=None])
 
     On-Neck Pattern (Pattern Recognition)
 
@@ -2129,28 +2751,37 @@ def CDLONNECK( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLONNECK_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLONNECK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLONNECK( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLONNECK( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLONNECK", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLPIERCING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLPIERCING(open, high, low, close)
+def CDLPIERCING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLPIERCING(open, high, low, close[, out=None])
 
     Piercing Pattern (Pattern Recognition)
 
@@ -2161,28 +2792,37 @@ def CDLPIERCING( np.ndarray open not None , np.ndarray high not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLPIERCING_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLPIERCING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLPIERCING( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLPIERCING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLPIERCING", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLRICKSHAWMAN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLRICKSHAWMAN(open, high, low, close)
+def CDLRICKSHAWMAN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLRICKSHAWMAN(open, high, low, close[, out=None])
 
     Rickshaw Man (Pattern Recognition)
 
@@ -2193,28 +2833,37 @@ def CDLRICKSHAWMAN( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLRICKSHAWMAN_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLRICKSHAWMAN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLRICKSHAWMAN( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLRICKSHAWMAN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLRICKSHAWMAN", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLRISEFALL3METHODS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLRISEFALL3METHODS(open, high, low, close)
+def CDLRISEFALL3METHODS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLRISEFALL3METHODS(open, high, low, close[, out=None])
 
     Rising/Falling Three Methods (Pattern Recognition)
 
@@ -2225,28 +2874,37 @@ def CDLRISEFALL3METHODS( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLRISEFALL3METHODS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLRISEFALL3METHODS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLRISEFALL3METHODS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLRISEFALL3METHODS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLRISEFALL3METHODS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSEPARATINGLINES( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSEPARATINGLINES(open, high, low, close)
+def CDLSEPARATINGLINES( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSEPARATINGLINES(open, high, low, close[, out=None])
 
     Separating Lines (Pattern Recognition)
 
@@ -2257,28 +2915,37 @@ def CDLSEPARATINGLINES( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSEPARATINGLINES_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSEPARATINGLINES( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSEPARATINGLINES( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSEPARATINGLINES( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSEPARATINGLINES", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSHOOTINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSHOOTINGSTAR(open, high, low, close)
+def CDLSHOOTINGSTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSHOOTINGSTAR(open, high, low, close[, out=None])
 
     Shooting Star (Pattern Recognition)
 
@@ -2289,28 +2956,37 @@ def CDLSHOOTINGSTAR( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSHOOTINGSTAR_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSHOOTINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSHOOTINGSTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSHOOTINGSTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSHOOTINGSTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSHORTLINE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSHORTLINE(open, high, low, close)
+def CDLSHORTLINE( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSHORTLINE(open, high, low, close[, out=None])
 
     Short Line Candle (Pattern Recognition)
 
@@ -2321,28 +2997,37 @@ def CDLSHORTLINE( np.ndarray open not None , np.ndarray high not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSHORTLINE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSHORTLINE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSHORTLINE( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSHORTLINE( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSHORTLINE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSPINNINGTOP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSPINNINGTOP(open, high, low, close)
+def CDLSPINNINGTOP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSPINNINGTOP(open, high, low, close[, out=None])
 
     Spinning Top (Pattern Recognition)
 
@@ -2353,28 +3038,37 @@ def CDLSPINNINGTOP( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSPINNINGTOP_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSPINNINGTOP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSPINNINGTOP( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSPINNINGTOP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSPINNINGTOP", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSTALLEDPATTERN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSTALLEDPATTERN(open, high, low, close)
+def CDLSTALLEDPATTERN( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSTALLEDPATTERN(open, high, low, close[, out=None])
 
     Stalled Pattern (Pattern Recognition)
 
@@ -2385,28 +3079,37 @@ def CDLSTALLEDPATTERN( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSTALLEDPATTERN_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSTALLEDPATTERN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSTALLEDPATTERN( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSTALLEDPATTERN( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSTALLEDPATTERN", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLSTICKSANDWICH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLSTICKSANDWICH(open, high, low, close)
+def CDLSTICKSANDWICH( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLSTICKSANDWICH(open, high, low, close[, out=None])
 
     Stick Sandwich (Pattern Recognition)
 
@@ -2417,28 +3120,37 @@ def CDLSTICKSANDWICH( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLSTICKSANDWICH_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLSTICKSANDWICH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSTICKSANDWICH( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLSTICKSANDWICH( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLSTICKSANDWICH", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLTAKURI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLTAKURI(open, high, low, close)
+def CDLTAKURI( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLTAKURI(open, high, low, close[, out=None])
 
     Takuri (Dragonfly Doji with very long lower shadow) (Pattern Recognition)
 
@@ -2449,28 +3161,37 @@ def CDLTAKURI( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLTAKURI_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLTAKURI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTAKURI( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLTAKURI( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLTAKURI", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLTASUKIGAP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLTASUKIGAP(open, high, low, close)
+def CDLTASUKIGAP( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLTASUKIGAP(open, high, low, close[, out=None])
 
     Tasuki Gap (Pattern Recognition)
 
@@ -2481,28 +3202,37 @@ def CDLTASUKIGAP( np.ndarray open not None , np.ndarray high not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLTASUKIGAP_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLTASUKIGAP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTASUKIGAP( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLTASUKIGAP( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLTASUKIGAP", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLTHRUSTING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLTHRUSTING(open, high, low, close)
+def CDLTHRUSTING( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLTHRUSTING(open, high, low, close[, out=None])
 
     Thrusting Pattern (Pattern Recognition)
 
@@ -2513,28 +3243,37 @@ def CDLTHRUSTING( np.ndarray open not None , np.ndarray high not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLTHRUSTING_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLTHRUSTING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTHRUSTING( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLTHRUSTING( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLTHRUSTING", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLTRISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLTRISTAR(open, high, low, close)
+def CDLTRISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLTRISTAR(open, high, low, close[, out=None])
 
     Tristar Pattern (Pattern Recognition)
 
@@ -2545,28 +3284,37 @@ def CDLTRISTAR( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLTRISTAR_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLTRISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTRISTAR( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLTRISTAR( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLTRISTAR", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLUNIQUE3RIVER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLUNIQUE3RIVER(open, high, low, close)
+def CDLUNIQUE3RIVER( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLUNIQUE3RIVER(open, high, low, close[, out=None])
 
     Unique 3 River (Pattern Recognition)
 
@@ -2577,28 +3325,37 @@ def CDLUNIQUE3RIVER( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLUNIQUE3RIVER_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLUNIQUE3RIVER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLUNIQUE3RIVER( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLUNIQUE3RIVER( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLUNIQUE3RIVER", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLUPSIDEGAP2CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLUPSIDEGAP2CROWS(open, high, low, close)
+def CDLUPSIDEGAP2CROWS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLUPSIDEGAP2CROWS(open, high, low, close[, out=None])
 
     Upside Gap Two Crows (Pattern Recognition)
 
@@ -2609,28 +3366,37 @@ def CDLUPSIDEGAP2CROWS( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLUPSIDEGAP2CROWS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLUPSIDEGAP2CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLUPSIDEGAP2CROWS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLUPSIDEGAP2CROWS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLUPSIDEGAP2CROWS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CDLXSIDEGAP3METHODS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ CDLXSIDEGAP3METHODS(open, high, low, close)
+def CDLXSIDEGAP3METHODS( np.ndarray open not None , np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ CDLXSIDEGAP3METHODS(open, high, low, close[, out=None])
 
     Upside/Downside Gap Three Methods (Pattern Recognition)
 
@@ -2641,28 +3407,37 @@ def CDLXSIDEGAP3METHODS( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    open = check_array(open)
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
-    begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(open.data), <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx4(length, <double*>(open.data), <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CDLXSIDEGAP3METHODS_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_CDLXSIDEGAP3METHODS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (open, high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLXSIDEGAP3METHODS( 0 , endidx , <float *>(open.data)+begidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_CDLXSIDEGAP3METHODS( 0 , endidx , <double *>(open.data)+begidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_CDLXSIDEGAP3METHODS", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CEIL( np.ndarray real not None ):
-    """ CEIL(real)
+def CEIL( np.ndarray real not None , out=None ):
+    """ CEIL(real[, out=None])
 
     Vector Ceil (Math Transform)
 
@@ -2673,25 +3448,34 @@ def CEIL( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CEIL_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_CEIL( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CEIL( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_CEIL( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_CEIL", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CMO( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ CMO(real[, timeperiod=?])
+def CMO( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ CMO(real[, timeperiod=?, out=None])
 
     Chande Momentum Oscillator (Momentum Indicators)
 
@@ -2704,25 +3488,34 @@ def CMO( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CMO_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_CMO( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CMO( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_CMO( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_CMO", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def CORREL( np.ndarray real0 not None , np.ndarray real1 not None , int timeperiod=-2**31 ):
-    """ CORREL(real0, real1[, timeperiod=?])
+def CORREL( np.ndarray real0 not None , np.ndarray real1 not None , int timeperiod=-2**31 , out=None ):
+    """ CORREL(real0, real1[, timeperiod=?, out=None])
 
     Pearson's Correlation Coefficient (r) (Statistic Functions)
 
@@ -2736,26 +3529,35 @@ def CORREL( np.ndarray real0 not None , np.ndarray real1 not None , int timeperi
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_CORREL_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_CORREL( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CORREL( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_CORREL( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_CORREL", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def COS( np.ndarray real not None ):
-    """ COS(real)
+def COS( np.ndarray real not None , out=None ):
+    """ COS(real[, out=None])
 
     Vector Trigonometric Cos (Math Transform)
 
@@ -2766,25 +3568,34 @@ def COS( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_COS_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_COS( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_COS( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_COS( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_COS", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def COSH( np.ndarray real not None ):
-    """ COSH(real)
+def COSH( np.ndarray real not None , out=None ):
+    """ COSH(real[, out=None])
 
     Vector Trigonometric Cosh (Math Transform)
 
@@ -2795,25 +3606,34 @@ def COSH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_COSH_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_COSH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_COSH( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_COSH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_COSH", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def DEMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ DEMA(real[, timeperiod=?])
+def DEMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ DEMA(real[, timeperiod=?, out=None])
 
     Double Exponential Moving Average (Overlap Studies)
 
@@ -2826,25 +3646,34 @@ def DEMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_DEMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_DEMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DEMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_DEMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_DEMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def DIV( np.ndarray real0 not None , np.ndarray real1 not None ):
-    """ DIV(real0, real1)
+def DIV( np.ndarray real0 not None , np.ndarray real1 not None , out=None ):
+    """ DIV(real0, real1[, out=None])
 
     Vector Arithmetic Div (Math Operators)
 
@@ -2856,26 +3685,35 @@ def DIV( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_DIV_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_DIV( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DIV( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_DIV( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_DIV", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def DX( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ DX(high, low, close[, timeperiod=?])
+def DX( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ DX(high, low, close[, timeperiod=?, out=None])
 
     Directional Movement Index (Momentum Indicators)
 
@@ -2888,27 +3726,36 @@ def DX( np.ndarray high not None , np.ndarray low not None , np.ndarray close no
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_DX_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_DX( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DX( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_DX( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_DX", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def EMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ EMA(real[, timeperiod=?])
+def EMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ EMA(real[, timeperiod=?, out=None])
 
     Exponential Moving Average (Overlap Studies)
 
@@ -2921,25 +3768,34 @@ def EMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_EMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_EMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_EMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_EMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_EMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def EXP( np.ndarray real not None ):
-    """ EXP(real)
+def EXP( np.ndarray real not None , out=None ):
+    """ EXP(real[, out=None])
 
     Vector Arithmetic Exp (Math Transform)
 
@@ -2950,25 +3806,34 @@ def EXP( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_EXP_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_EXP( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_EXP( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_EXP( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_EXP", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def FLOOR( np.ndarray real not None ):
-    """ FLOOR(real)
+def FLOOR( np.ndarray real not None , out=None ):
+    """ FLOOR(real[, out=None])
 
     Vector Floor (Math Transform)
 
@@ -2979,25 +3844,34 @@ def FLOOR( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_FLOOR_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_FLOOR( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_FLOOR( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_FLOOR( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_FLOOR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_DCPERIOD( np.ndarray real not None ):
-    """ HT_DCPERIOD(real)
+def HT_DCPERIOD( np.ndarray real not None , out=None ):
+    """ HT_DCPERIOD(real[, out=None])
 
     Hilbert Transform - Dominant Cycle Period (Cycle Indicators)
 
@@ -3008,25 +3882,34 @@ def HT_DCPERIOD( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_DCPERIOD_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_HT_DCPERIOD( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_DCPERIOD( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_HT_DCPERIOD( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_HT_DCPERIOD", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_DCPHASE( np.ndarray real not None ):
-    """ HT_DCPHASE(real)
+def HT_DCPHASE( np.ndarray real not None , out=None ):
+    """ HT_DCPHASE(real[, out=None])
 
     Hilbert Transform - Dominant Cycle Phase (Cycle Indicators)
 
@@ -3037,25 +3920,34 @@ def HT_DCPHASE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_DCPHASE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_HT_DCPHASE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_DCPHASE( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_HT_DCPHASE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_HT_DCPHASE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_PHASOR( np.ndarray real not None ):
-    """ HT_PHASOR(real)
+def HT_PHASOR( np.ndarray real not None , out=None ):
+    """ HT_PHASOR(real[, out=None])
 
     Hilbert Transform - Phasor Components (Cycle Indicators)
 
@@ -3067,27 +3959,36 @@ def HT_PHASOR( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinphase
         np.ndarray outquadrature
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_PHASOR_Lookback( )
-    outinphase = make_double_array(length, lookback)
-    outquadrature = make_double_array(length, lookback)
-    retCode = lib.TA_HT_PHASOR( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outinphase.data)+lookback , <double *>(outquadrature.data)+lookback )
+    outinphase = make_double_array_out(out, 0, 2, length, lookback, (real,))
+    outquadrature = make_double_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_PHASOR( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outinphase.data)+lookback , <double *>(outquadrature.data)+lookback )
+        else:
+            retCode = lib.TA_HT_PHASOR( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outinphase.data)+lookback , <double *>(outquadrature.data)+lookback )
     _ta_check_success("TA_HT_PHASOR", retCode)
     return outinphase , outquadrature 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_SINE( np.ndarray real not None ):
-    """ HT_SINE(real)
+def HT_SINE( np.ndarray real not None , out=None ):
+    """ HT_SINE(real[, out=None])
 
     Hilbert Transform - SineWave (Cycle Indicators)
 
@@ -3099,27 +4000,36 @@ def HT_SINE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outsine
         np.ndarray outleadsine
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_SINE_Lookback( )
-    outsine = make_double_array(length, lookback)
-    outleadsine = make_double_array(length, lookback)
-    retCode = lib.TA_HT_SINE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outsine.data)+lookback , <double *>(outleadsine.data)+lookback )
+    outsine = make_double_array_out(out, 0, 2, length, lookback, (real,))
+    outleadsine = make_double_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_SINE( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outsine.data)+lookback , <double *>(outleadsine.data)+lookback )
+        else:
+            retCode = lib.TA_HT_SINE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outsine.data)+lookback , <double *>(outleadsine.data)+lookback )
     _ta_check_success("TA_HT_SINE", retCode)
     return outsine , outleadsine 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_TRENDLINE( np.ndarray real not None ):
-    """ HT_TRENDLINE(real)
+def HT_TRENDLINE( np.ndarray real not None , out=None ):
+    """ HT_TRENDLINE(real[, out=None])
 
     Hilbert Transform - Instantaneous Trendline (Overlap Studies)
 
@@ -3130,25 +4040,34 @@ def HT_TRENDLINE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_TRENDLINE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_HT_TRENDLINE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_TRENDLINE( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_HT_TRENDLINE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_HT_TRENDLINE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def HT_TRENDMODE( np.ndarray real not None ):
-    """ HT_TRENDMODE(real)
+def HT_TRENDMODE( np.ndarray real not None , out=None ):
+    """ HT_TRENDMODE(real[, out=None])
 
     Hilbert Transform - Trend vs Cycle Mode (Cycle Indicators)
 
@@ -3159,25 +4078,34 @@ def HT_TRENDMODE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_HT_TRENDMODE_Lookback( )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_HT_TRENDMODE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_TRENDMODE( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_HT_TRENDMODE( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_HT_TRENDMODE", retCode)
     return outinteger 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def KAMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ KAMA(real[, timeperiod=?])
+def KAMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ KAMA(real[, timeperiod=?, out=None])
 
     Kaufman Adaptive Moving Average (Overlap Studies)
 
@@ -3190,25 +4118,34 @@ def KAMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_KAMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_KAMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_KAMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_KAMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_KAMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LINEARREG( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ LINEARREG(real[, timeperiod=?])
+def LINEARREG( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ LINEARREG(real[, timeperiod=?, out=None])
 
     Linear Regression (Statistic Functions)
 
@@ -3221,25 +4158,34 @@ def LINEARREG( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LINEARREG_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LINEARREG( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LINEARREG( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LINEARREG", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LINEARREG_ANGLE( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ LINEARREG_ANGLE(real[, timeperiod=?])
+def LINEARREG_ANGLE( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ LINEARREG_ANGLE(real[, timeperiod=?, out=None])
 
     Linear Regression Angle (Statistic Functions)
 
@@ -3252,25 +4198,34 @@ def LINEARREG_ANGLE( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LINEARREG_ANGLE_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LINEARREG_ANGLE( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_ANGLE( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LINEARREG_ANGLE( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LINEARREG_ANGLE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LINEARREG_INTERCEPT( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ LINEARREG_INTERCEPT(real[, timeperiod=?])
+def LINEARREG_INTERCEPT( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ LINEARREG_INTERCEPT(real[, timeperiod=?, out=None])
 
     Linear Regression Intercept (Statistic Functions)
 
@@ -3283,25 +4238,34 @@ def LINEARREG_INTERCEPT( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LINEARREG_INTERCEPT_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LINEARREG_INTERCEPT( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_INTERCEPT( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LINEARREG_INTERCEPT( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LINEARREG_INTERCEPT", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LINEARREG_SLOPE( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ LINEARREG_SLOPE(real[, timeperiod=?])
+def LINEARREG_SLOPE( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ LINEARREG_SLOPE(real[, timeperiod=?, out=None])
 
     Linear Regression Slope (Statistic Functions)
 
@@ -3314,25 +4278,34 @@ def LINEARREG_SLOPE( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LINEARREG_SLOPE_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LINEARREG_SLOPE( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_SLOPE( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LINEARREG_SLOPE( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LINEARREG_SLOPE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LN( np.ndarray real not None ):
-    """ LN(real)
+def LN( np.ndarray real not None , out=None ):
+    """ LN(real[, out=None])
 
     Vector Log Natural (Math Transform)
 
@@ -3343,25 +4316,34 @@ def LN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LN_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LN( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def LOG10( np.ndarray real not None ):
-    """ LOG10(real)
+def LOG10( np.ndarray real not None , out=None ):
+    """ LOG10(real[, out=None])
 
     Vector Log10 (Math Transform)
 
@@ -3372,25 +4354,34 @@ def LOG10( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_LOG10_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_LOG10( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LOG10( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_LOG10( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_LOG10", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MA( np.ndarray real not None , int timeperiod=-2**31 , int matype=0 ):
-    """ MA(real[, timeperiod=?, matype=?])
+def MA( np.ndarray real not None , int timeperiod=-2**31 , int matype=0 , out=None ):
+    """ MA(real[, timeperiod=?, matype=?, out=None])
 
     Moving average (Overlap Studies)
 
@@ -3404,25 +4395,34 @@ def MA( np.ndarray real not None , int timeperiod=-2**31 , int matype=0 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MA_Lookback( timeperiod , matype )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MACD( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int signalperiod=-2**31 ):
-    """ MACD(real[, fastperiod=?, slowperiod=?, signalperiod=?])
+def MACD( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int signalperiod=-2**31 , out=None ):
+    """ MACD(real[, fastperiod=?, slowperiod=?, signalperiod=?, out=None])
 
     Moving Average Convergence/Divergence (Momentum Indicators)
 
@@ -3439,6 +4439,7 @@ def MACD( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
@@ -3446,22 +4447,30 @@ def MACD( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**
         np.ndarray outmacd
         np.ndarray outmacdsignal
         np.ndarray outmacdhist
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MACD_Lookback( fastperiod , slowperiod , signalperiod )
-    outmacd = make_double_array(length, lookback)
-    outmacdsignal = make_double_array(length, lookback)
-    outmacdhist = make_double_array(length, lookback)
-    retCode = lib.TA_MACD( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+    outmacd = make_double_array_out(out, 0, 3, length, lookback, (real,))
+    outmacdsignal = make_double_array_out(out, 1, 3, length, lookback, (real,))
+    outmacdhist = make_double_array_out(out, 2, 3, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACD( 0 , endidx , <float *>(real.data)+begidx , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+        else:
+            retCode = lib.TA_MACD( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
     _ta_check_success("TA_MACD", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MACDEXT( np.ndarray real not None , int fastperiod=-2**31 , int fastmatype=0 , int slowperiod=-2**31 , int slowmatype=0 , int signalperiod=-2**31 , int signalmatype=0 ):
-    """ MACDEXT(real[, fastperiod=?, fastmatype=?, slowperiod=?, slowmatype=?, signalperiod=?, signalmatype=?])
+def MACDEXT( np.ndarray real not None , int fastperiod=-2**31 , int fastmatype=0 , int slowperiod=-2**31 , int slowmatype=0 , int signalperiod=-2**31 , int signalmatype=0 , out=None ):
+    """ MACDEXT(real[, fastperiod=?, fastmatype=?, slowperiod=?, slowmatype=?, signalperiod=?, signalmatype=?, out=None])
 
     MACD with controllable MA type (Momentum Indicators)
 
@@ -3481,6 +4490,7 @@ def MACDEXT( np.ndarray real not None , int fastperiod=-2**31 , int fastmatype=0
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
@@ -3488,22 +4498,30 @@ def MACDEXT( np.ndarray real not None , int fastperiod=-2**31 , int fastmatype=0
         np.ndarray outmacd
         np.ndarray outmacdsignal
         np.ndarray outmacdhist
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MACDEXT_Lookback( fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype )
-    outmacd = make_double_array(length, lookback)
-    outmacdsignal = make_double_array(length, lookback)
-    outmacdhist = make_double_array(length, lookback)
-    retCode = lib.TA_MACDEXT( 0 , endidx , <double *>(real.data)+begidx , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+    outmacd = make_double_array_out(out, 0, 3, length, lookback, (real,))
+    outmacdsignal = make_double_array_out(out, 1, 3, length, lookback, (real,))
+    outmacdhist = make_double_array_out(out, 2, 3, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACDEXT( 0 , endidx , <float *>(real.data)+begidx , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+        else:
+            retCode = lib.TA_MACDEXT( 0 , endidx , <double *>(real.data)+begidx , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
     _ta_check_success("TA_MACDEXT", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MACDFIX( np.ndarray real not None , int signalperiod=-2**31 ):
-    """ MACDFIX(real[, signalperiod=?])
+def MACDFIX( np.ndarray real not None , int signalperiod=-2**31 , out=None ):
+    """ MACDFIX(real[, signalperiod=?, out=None])
 
     Moving Average Convergence/Divergence Fix 12/26 (Momentum Indicators)
 
@@ -3518,6 +4536,7 @@ def MACDFIX( np.ndarray real not None , int signalperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
@@ -3525,22 +4544,30 @@ def MACDFIX( np.ndarray real not None , int signalperiod=-2**31 ):
         np.ndarray outmacd
         np.ndarray outmacdsignal
         np.ndarray outmacdhist
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MACDFIX_Lookback( signalperiod )
-    outmacd = make_double_array(length, lookback)
-    outmacdsignal = make_double_array(length, lookback)
-    outmacdhist = make_double_array(length, lookback)
-    retCode = lib.TA_MACDFIX( 0 , endidx , <double *>(real.data)+begidx , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+    outmacd = make_double_array_out(out, 0, 3, length, lookback, (real,))
+    outmacdsignal = make_double_array_out(out, 1, 3, length, lookback, (real,))
+    outmacdhist = make_double_array_out(out, 2, 3, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACDFIX( 0 , endidx , <float *>(real.data)+begidx , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
+        else:
+            retCode = lib.TA_MACDFIX( 0 , endidx , <double *>(real.data)+begidx , signalperiod , &outbegidx , &outnbelement , <double *>(outmacd.data)+lookback , <double *>(outmacdsignal.data)+lookback , <double *>(outmacdhist.data)+lookback )
     _ta_check_success("TA_MACDFIX", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MAMA( np.ndarray real not None , double fastlimit=-4e37 , double slowlimit=-4e37 ):
-    """ MAMA(real[, fastlimit=?, slowlimit=?])
+def MAMA( np.ndarray real not None , double fastlimit=-4e37 , double slowlimit=-4e37 , out=None ):
+    """ MAMA(real[, fastlimit=?, slowlimit=?, out=None])
 
     MESA Adaptive Moving Average (Overlap Studies)
 
@@ -3555,27 +4582,36 @@ def MAMA( np.ndarray real not None , double fastlimit=-4e37 , double slowlimit=-
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outmama
         np.ndarray outfama
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MAMA_Lookback( fastlimit , slowlimit )
-    outmama = make_double_array(length, lookback)
-    outfama = make_double_array(length, lookback)
-    retCode = lib.TA_MAMA( 0 , endidx , <double *>(real.data)+begidx , fastlimit , slowlimit , &outbegidx , &outnbelement , <double *>(outmama.data)+lookback , <double *>(outfama.data)+lookback )
+    outmama = make_double_array_out(out, 0, 2, length, lookback, (real,))
+    outfama = make_double_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAMA( 0 , endidx , <float *>(real.data)+begidx , fastlimit , slowlimit , &outbegidx , &outnbelement , <double *>(outmama.data)+lookback , <double *>(outfama.data)+lookback )
+        else:
+            retCode = lib.TA_MAMA( 0 , endidx , <double *>(real.data)+begidx , fastlimit , slowlimit , &outbegidx , &outnbelement , <double *>(outmama.data)+lookback , <double *>(outfama.data)+lookback )
     _ta_check_success("TA_MAMA", retCode)
     return outmama , outfama 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MAVP( np.ndarray real not None , np.ndarray periods not None , int minperiod=-2**31 , int maxperiod=-2**31 , int matype=0 ):
-    """ MAVP(real, periods[, minperiod=?, maxperiod=?, matype=?])
+def MAVP( np.ndarray real not None , np.ndarray periods not None , int minperiod=-2**31 , int maxperiod=-2**31 , int matype=0 , out=None ):
+    """ MAVP(real, periods[, minperiod=?, maxperiod=?, matype=?, out=None])
 
     Moving average with variable period (Overlap Studies)
 
@@ -3591,26 +4627,35 @@ def MAVP( np.ndarray real not None , np.ndarray periods not None , int minperiod
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
-    periods = check_array(periods)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
+    periods = check_array(periods, single)
     length = check_length2(real, periods)
-    begidx = check_begidx2(length, <double*>(real.data), <double*>(periods.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real.data), <float*>(periods.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real.data), <double*>(periods.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MAVP_Lookback( minperiod , maxperiod , matype )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MAVP( 0 , endidx , <double *>(real.data)+begidx , <double *>(periods.data)+begidx , minperiod , maxperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real, periods))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAVP( 0 , endidx , <float *>(real.data)+begidx , <float *>(periods.data)+begidx , minperiod , maxperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MAVP( 0 , endidx , <double *>(real.data)+begidx , <double *>(periods.data)+begidx , minperiod , maxperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MAVP", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MAX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MAX(real[, timeperiod=?])
+def MAX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MAX(real[, timeperiod=?, out=None])
 
     Highest value over a specified period (Math Operators)
 
@@ -3623,25 +4668,34 @@ def MAX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MAX_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MAX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MAX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MAX", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MAXINDEX(real[, timeperiod=?])
+def MAXINDEX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MAXINDEX(real[, timeperiod=?, out=None])
 
     Index of highest value over a specified period (Math Operators)
 
@@ -3654,18 +4708,27 @@ def MAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MAXINDEX_Lookback( timeperiod )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_MAXINDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAXINDEX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_MAXINDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_MAXINDEX", retCode)
     outinteger_data = <int*>outinteger.data
     for i from lookback <= i < length:
@@ -3674,8 +4737,8 @@ def MAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MEDPRICE( np.ndarray high not None , np.ndarray low not None ):
-    """ MEDPRICE(high, low)
+def MEDPRICE( np.ndarray high not None , np.ndarray low not None , out=None ):
+    """ MEDPRICE(high, low[, out=None])
 
     Median Price (Price Transform)
 
@@ -3686,26 +4749,35 @@ def MEDPRICE( np.ndarray high not None , np.ndarray low not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MEDPRICE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MEDPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MEDPRICE( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MEDPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MEDPRICE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MFI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None , int timeperiod=-2**31 ):
-    """ MFI(high, low, close, volume[, timeperiod=?])
+def MFI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , np.ndarray volume not None , int timeperiod=-2**31 , out=None ):
+    """ MFI(high, low, close, volume[, timeperiod=?, out=None])
 
     Money Flow Index (Momentum Indicators)
 
@@ -3718,28 +4790,37 @@ def MFI( np.ndarray high not None , np.ndarray low not None , np.ndarray close n
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
-    volume = check_array(volume)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
-    begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
+    if single:
+        begidx = check_begidx4(length, <float*>(high.data), <float*>(low.data), <float*>(close.data), <float*>(volume.data))
+    else:
+        begidx = check_begidx4(length, <double*>(high.data), <double*>(low.data), <double*>(close.data), <double*>(volume.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MFI_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MFI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close, volume))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MFI( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , <float *>(volume.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MFI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , <double *>(volume.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MFI", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MIDPOINT( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MIDPOINT(real[, timeperiod=?])
+def MIDPOINT( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MIDPOINT(real[, timeperiod=?, out=None])
 
     MidPoint over period (Overlap Studies)
 
@@ -3752,25 +4833,34 @@ def MIDPOINT( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MIDPOINT_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MIDPOINT( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIDPOINT( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MIDPOINT( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MIDPOINT", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MIDPRICE( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 ):
-    """ MIDPRICE(high, low[, timeperiod=?])
+def MIDPRICE( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 , out=None ):
+    """ MIDPRICE(high, low[, timeperiod=?, out=None])
 
     Midpoint Price over period (Overlap Studies)
 
@@ -3783,26 +4873,35 @@ def MIDPRICE( np.ndarray high not None , np.ndarray low not None , int timeperio
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MIDPRICE_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MIDPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIDPRICE( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MIDPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MIDPRICE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MIN( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MIN(real[, timeperiod=?])
+def MIN( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MIN(real[, timeperiod=?, out=None])
 
     Lowest value over a specified period (Math Operators)
 
@@ -3815,25 +4914,34 @@ def MIN( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MIN_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MIN( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIN( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MIN( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MIN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MININDEX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MININDEX(real[, timeperiod=?])
+def MININDEX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MININDEX(real[, timeperiod=?, out=None])
 
     Index of lowest value over a specified period (Math Operators)
 
@@ -3846,18 +4954,27 @@ def MININDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outinteger
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MININDEX_Lookback( timeperiod )
-    outinteger = make_int_array(length, lookback)
-    retCode = lib.TA_MININDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+    outinteger = make_int_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MININDEX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
+        else:
+            retCode = lib.TA_MININDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outinteger.data)+lookback )
     _ta_check_success("TA_MININDEX", retCode)
     outinteger_data = <int*>outinteger.data
     for i from lookback <= i < length:
@@ -3866,8 +4983,8 @@ def MININDEX( np.ndarray real not None , int timeperiod=-2**31 ):
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MINMAX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MINMAX(real[, timeperiod=?])
+def MINMAX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MINMAX(real[, timeperiod=?, out=None])
 
     Lowest and highest values over a specified period (Math Operators)
 
@@ -3881,27 +4998,36 @@ def MINMAX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outmin
         np.ndarray outmax
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MINMAX_Lookback( timeperiod )
-    outmin = make_double_array(length, lookback)
-    outmax = make_double_array(length, lookback)
-    retCode = lib.TA_MINMAX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outmin.data)+lookback , <double *>(outmax.data)+lookback )
+    outmin = make_double_array_out(out, 0, 2, length, lookback, (real,))
+    outmax = make_double_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINMAX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outmin.data)+lookback , <double *>(outmax.data)+lookback )
+        else:
+            retCode = lib.TA_MINMAX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outmin.data)+lookback , <double *>(outmax.data)+lookback )
     _ta_check_success("TA_MINMAX", retCode)
     return outmin , outmax 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MINMAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MINMAXINDEX(real[, timeperiod=?])
+def MINMAXINDEX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MINMAXINDEX(real[, timeperiod=?, out=None])
 
     Indexes of lowest and highest values over a specified period (Math Operators)
 
@@ -3915,20 +5041,29 @@ def MINMAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outminidx
         np.ndarray outmaxidx
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MINMAXINDEX_Lookback( timeperiod )
-    outminidx = make_int_array(length, lookback)
-    outmaxidx = make_int_array(length, lookback)
-    retCode = lib.TA_MINMAXINDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outminidx.data)+lookback , <int *>(outmaxidx.data)+lookback )
+    outminidx = make_int_array_out(out, 0, 2, length, lookback, (real,))
+    outmaxidx = make_int_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINMAXINDEX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outminidx.data)+lookback , <int *>(outmaxidx.data)+lookback )
+        else:
+            retCode = lib.TA_MINMAXINDEX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <int *>(outminidx.data)+lookback , <int *>(outmaxidx.data)+lookback )
     _ta_check_success("TA_MINMAXINDEX", retCode)
     outminidx_data = <int*>outminidx.data
     for i from lookback <= i < length:
@@ -3940,8 +5075,8 @@ def MINMAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MINUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ MINUS_DI(high, low, close[, timeperiod=?])
+def MINUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ MINUS_DI(high, low, close[, timeperiod=?, out=None])
 
     Minus Directional Indicator (Momentum Indicators)
 
@@ -3954,27 +5089,36 @@ def MINUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray cl
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MINUS_DI_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MINUS_DI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINUS_DI( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MINUS_DI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MINUS_DI", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MINUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 ):
-    """ MINUS_DM(high, low[, timeperiod=?])
+def MINUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 , out=None ):
+    """ MINUS_DM(high, low[, timeperiod=?, out=None])
 
     Minus Directional Movement (Momentum Indicators)
 
@@ -3987,26 +5131,35 @@ def MINUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperio
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MINUS_DM_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MINUS_DM( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINUS_DM( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MINUS_DM( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MINUS_DM", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MOM( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ MOM(real[, timeperiod=?])
+def MOM( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ MOM(real[, timeperiod=?, out=None])
 
     Momentum (Momentum Indicators)
 
@@ -4019,25 +5172,34 @@ def MOM( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MOM_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MOM( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MOM( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MOM( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MOM", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def MULT( np.ndarray real0 not None , np.ndarray real1 not None ):
-    """ MULT(real0, real1)
+def MULT( np.ndarray real0 not None , np.ndarray real1 not None , out=None ):
+    """ MULT(real0, real1[, out=None])
 
     Vector Arithmetic Mult (Math Operators)
 
@@ -4049,26 +5211,35 @@ def MULT( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_MULT_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_MULT( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MULT( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_MULT( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_MULT", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def NATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ NATR(high, low, close[, timeperiod=?])
+def NATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ NATR(high, low, close[, timeperiod=?, out=None])
 
     Normalized Average True Range (Volatility Indicators)
 
@@ -4081,27 +5252,36 @@ def NATR( np.ndarray high not None , np.ndarray low not None , np.ndarray close
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_NATR_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_NATR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_NATR( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_NATR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_NATR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def OBV( np.ndarray real not None , np.ndarray volume not None ):
-    """ OBV(real, volume)
+def OBV( np.ndarray real not None , np.ndarray volume not None , out=None ):
+    """ OBV(real, volume[, out=None])
 
     On Balance Volume (Volume Indicators)
 
@@ -4113,26 +5293,35 @@ def OBV( np.ndarray real not None , np.ndarray volume not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
-    volume = check_array(volume)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
+    volume = check_array(volume, single)
     length = check_length2(real, volume)
-    begidx = check_begidx2(length, <double*>(real.data), <double*>(volume.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real.data), <float*>(volume.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real.data), <double*>(volume.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_OBV_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_OBV( 0 , endidx , <double *>(real.data)+begidx , <double *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real, volume))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_OBV( 0 , endidx , <float *>(real.data)+begidx , <float *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_OBV( 0 , endidx , <double *>(real.data)+begidx , <double *>(volume.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_OBV", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def PLUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ PLUS_DI(high, low, close[, timeperiod=?])
+def PLUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ PLUS_DI(high, low, close[, timeperiod=?, out=None])
 
     Plus Directional Indicator (Momentum Indicators)
 
@@ -4145,27 +5334,36 @@ def PLUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndarray clo
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_PLUS_DI_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_PLUS_DI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PLUS_DI( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_PLUS_DI( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_PLUS_DI", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def PLUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 ):
-    """ PLUS_DM(high, low[, timeperiod=?])
+def PLUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperiod=-2**31 , out=None ):
+    """ PLUS_DM(high, low[, timeperiod=?, out=None])
 
     Plus Directional Movement (Momentum Indicators)
 
@@ -4178,26 +5376,35 @@ def PLUS_DM( np.ndarray high not None , np.ndarray low not None , int timeperiod
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_PLUS_DM_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_PLUS_DM( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PLUS_DM( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_PLUS_DM( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_PLUS_DM", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def PPO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int matype=0 ):
-    """ PPO(real[, fastperiod=?, slowperiod=?, matype=?])
+def PPO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**31 , int matype=0 , out=None ):
+    """ PPO(real[, fastperiod=?, slowperiod=?, matype=?, out=None])
 
     Percentage Price Oscillator (Momentum Indicators)
 
@@ -4212,25 +5419,34 @@ def PPO( np.ndarray real not None , int fastperiod=-2**31 , int slowperiod=-2**3
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_PPO_Lookback( fastperiod , slowperiod , matype )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_PPO( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PPO( 0 , endidx , <float *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_PPO( 0 , endidx , <double *>(real.data)+begidx , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_PPO", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ROC( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ ROC(real[, timeperiod=?])
+def ROC( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ ROC(real[, timeperiod=?, out=None])
 
     Rate of change : ((real/prevPrice)-1)*100 (Momentum Indicators)
 
@@ -4243,25 +5459,34 @@ def ROC( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ROC_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ROC( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROC( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ROC( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ROC", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ROCP( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ ROCP(real[, timeperiod=?])
+def ROCP( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ ROCP(real[, timeperiod=?, out=None])
 
     Rate of change Percentage: (real-prevPrice)/prevPrice (Momentum Indicators)
 
@@ -4274,25 +5499,34 @@ def ROCP( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ROCP_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ROCP( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCP( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ROCP( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ROCP", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ROCR( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ ROCR(real[, timeperiod=?])
+def ROCR( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ ROCR(real[, timeperiod=?, out=None])
 
     Rate of change ratio: (real/prevPrice) (Momentum Indicators)
 
@@ -4305,25 +5539,34 @@ def ROCR( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ROCR_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ROCR( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCR( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ROCR( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ROCR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ROCR100( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ ROCR100(real[, timeperiod=?])
+def ROCR100( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ ROCR100(real[, timeperiod=?, out=None])
 
     Rate of change ratio 100 scale: (real/prevPrice)*100 (Momentum Indicators)
 
@@ -4336,25 +5579,34 @@ def ROCR100( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ROCR100_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ROCR100( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCR100( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ROCR100( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ROCR100", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def RSI( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ RSI(real[, timeperiod=?])
+def RSI( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ RSI(real[, timeperiod=?, out=None])
 
     Relative Strength Index (Momentum Indicators)
 
@@ -4367,25 +5619,34 @@ def RSI( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_RSI_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_RSI( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_RSI( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_RSI( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_RSI", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SAR( np.ndarray high not None , np.ndarray low not None , double acceleration=0.02 , double maximum=0.2 ):
-    """ SAR(high, low[, acceleration=?, maximum=?])
+def SAR( np.ndarray high not None , np.ndarray low not None , double acceleration=0.02 , double maximum=0.2 , out=None ):
+    """ SAR(high, low[, acceleration=?, maximum=?, out=None])
 
     Parabolic SAR (Overlap Studies)
 
@@ -4399,26 +5660,35 @@ def SAR( np.ndarray high not None , np.ndarray low not None , double acceleratio
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SAR_Lookback( acceleration , maximum )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SAR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , acceleration , maximum , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SAR( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , acceleration , maximum , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SAR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , acceleration , maximum , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SAR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SAREXT( np.ndarray high not None , np.ndarray low not None , double startvalue=-4e37 , double offsetonreverse=-4e37 , double accelerationinitlong=-4e37 , double accelerationlong=-4e37 , double accelerationmaxlong=-4e37 , double accelerationinitshort=-4e37 , double accelerationshort=-4e37 , double accelerationmaxshort=-4e37 ):
-    """ SAREXT(high, low[, startvalue=?, offsetonreverse=?, accelerationinitlong=?, accelerationlong=?, accelerationmaxlong=?, accelerationinitshort=?, accelerationshort=?, accelerationmaxshort=?])
+def SAREXT( np.ndarray high not None , np.ndarray low not None , double startvalue=-4e37 , double offsetonreverse=-4e37 , double accelerationinitlong=-4e37 , double accelerationlong=-4e37 , double accelerationmaxlong=-4e37 , double accelerationinitshort=-4e37 , double accelerationshort=-4e37 , double accelerationmaxshort=-4e37 , out=None ):
+    """ SAREXT(high, low[, startvalue=?, offsetonreverse=?, accelerationinitlong=?, accelerationlong=?, accelerationmaxlong=?, accelerationinitshort=?, accelerationshort=?, accelerationmaxshort=?, out=None])
 
     Parabolic SAR - Extended (Overlap Studies)
 
@@ -4438,26 +5708,35 @@ def SAREXT( np.ndarray high not None , np.ndarray low not None , double startval
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
-    begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(high.data), <float*>(low.data))
+    else:
+        begidx = check_begidx2(length, <double*>(high.data), <double*>(low.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SAREXT_Lookback( startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SAREXT( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SAREXT( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SAREXT( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SAREXT", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SIN( np.ndarray real not None ):
-    """ SIN(real)
+def SIN( np.ndarray real not None , out=None ):
+    """ SIN(real[, out=None])
 
     Vector Trigonometric Sin (Math Transform)
 
@@ -4468,25 +5747,34 @@ def SIN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SIN_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SIN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SIN( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SIN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SIN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SINH( np.ndarray real not None ):
-    """ SINH(real)
+def SINH( np.ndarray real not None , out=None ):
+    """ SINH(real[, out=None])
 
     Vector Trigonometric Sinh (Math Transform)
 
@@ -4497,25 +5785,34 @@ def SINH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SINH_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SINH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SINH( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SINH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SINH", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ SMA(real[, timeperiod=?])
+def SMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ SMA(real[, timeperiod=?, out=None])
 
     Simple Moving Average (Overlap Studies)
 
@@ -4528,25 +5825,34 @@ def SMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SQRT( np.ndarray real not None ):
-    """ SQRT(real)
+def SQRT( np.ndarray real not None , out=None ):
+    """ SQRT(real[, out=None])
 
     Vector Square Root (Math Transform)
 
@@ -4557,25 +5863,34 @@ def SQRT( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SQRT_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SQRT( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SQRT( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SQRT( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SQRT", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def STDDEV( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e37 ):
-    """ STDDEV(real[, timeperiod=?, nbdev=?])
+def STDDEV( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e37 , out=None ):
+    """ STDDEV(real[, timeperiod=?, nbdev=?, out=None])
 
     Standard Deviation (Statistic Functions)
 
@@ -4589,25 +5904,34 @@ def STDDEV( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e3
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_STDDEV_Lookback( timeperiod , nbdev )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_STDDEV( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STDDEV( 0 , endidx , <float *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_STDDEV( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_STDDEV", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def STOCH( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int fastk_period=-2**31 , int slowk_period=-2**31 , int slowk_matype=0 , int slowd_period=-2**31 , int slowd_matype=0 ):
-    """ STOCH(high, low, close[, fastk_period=?, slowk_period=?, slowk_matype=?, slowd_period=?, slowd_matype=?])
+def STOCH( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int fastk_period=-2**31 , int slowk_period=-2**31 , int slowk_matype=0 , int slowd_period=-2**31 , int slowd_matype=0 , out=None ):
+    """ STOCH(high, low, close[, fastk_period=?, slowk_period=?, slowk_matype=?, slowd_period=?, slowd_matype=?, out=None])
 
     Stochastic (Momentum Indicators)
 
@@ -4625,29 +5949,38 @@ def STOCH( np.ndarray high not None , np.ndarray low not None , np.ndarray close
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outslowk
         np.ndarray outslowd
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_STOCH_Lookback( fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype )
-    outslowk = make_double_array(length, lookback)
-    outslowd = make_double_array(length, lookback)
-    retCode = lib.TA_STOCH( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , <double *>(outslowk.data)+lookback , <double *>(outslowd.data)+lookback )
+    outslowk = make_double_array_out(out, 0, 2, length, lookback, (high, low, close))
+    outslowd = make_double_array_out(out, 1, 2, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCH( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , <double *>(outslowk.data)+lookback , <double *>(outslowd.data)+lookback )
+        else:
+            retCode = lib.TA_STOCH( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , <double *>(outslowk.data)+lookback , <double *>(outslowd.data)+lookback )
     _ta_check_success("TA_STOCH", retCode)
     return outslowk , outslowd 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def STOCHF( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int fastk_period=-2**31 , int fastd_period=-2**31 , int fastd_matype=0 ):
-    """ STOCHF(high, low, close[, fastk_period=?, fastd_period=?, fastd_matype=?])
+def STOCHF( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int fastk_period=-2**31 , int fastd_period=-2**31 , int fastd_matype=0 , out=None ):
+    """ STOCHF(high, low, close[, fastk_period=?, fastd_period=?, fastd_matype=?, out=None])
 
     Stochastic Fast (Momentum Indicators)
 
@@ -4663,29 +5996,38 @@ def STOCHF( np.ndarray high not None , np.ndarray low not None , np.ndarray clos
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outfastk
         np.ndarray outfastd
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_STOCHF_Lookback( fastk_period , fastd_period , fastd_matype )
-    outfastk = make_double_array(length, lookback)
-    outfastd = make_double_array(length, lookback)
-    retCode = lib.TA_STOCHF( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
+    outfastk = make_double_array_out(out, 0, 2, length, lookback, (high, low, close))
+    outfastd = make_double_array_out(out, 1, 2, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCHF( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
+        else:
+            retCode = lib.TA_STOCHF( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
     _ta_check_success("TA_STOCHF", retCode)
     return outfastk , outfastd 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def STOCHRSI( np.ndarray real not None , int timeperiod=-2**31 , int fastk_period=-2**31 , int fastd_period=-2**31 , int fastd_matype=0 ):
-    """ STOCHRSI(real[, timeperiod=?, fastk_period=?, fastd_period=?, fastd_matype=?])
+def STOCHRSI( np.ndarray real not None , int timeperiod=-2**31 , int fastk_period=-2**31 , int fastd_period=-2**31 , int fastd_matype=0 , out=None ):
+    """ STOCHRSI(real[, timeperiod=?, fastk_period=?, fastd_period=?, fastd_matype=?, out=None])
 
     Stochastic Relative Strength Index (Momentum Indicators)
 
@@ -4702,27 +6044,36 @@ def STOCHRSI( np.ndarray real not None , int timeperiod=-2**31 , int fastk_perio
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outfastk
         np.ndarray outfastd
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_STOCHRSI_Lookback( timeperiod , fastk_period , fastd_period , fastd_matype )
-    outfastk = make_double_array(length, lookback)
-    outfastd = make_double_array(length, lookback)
-    retCode = lib.TA_STOCHRSI( 0 , endidx , <double *>(real.data)+begidx , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
+    outfastk = make_double_array_out(out, 0, 2, length, lookback, (real,))
+    outfastd = make_double_array_out(out, 1, 2, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCHRSI( 0 , endidx , <float *>(real.data)+begidx , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
+        else:
+            retCode = lib.TA_STOCHRSI( 0 , endidx , <double *>(real.data)+begidx , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , <double *>(outfastk.data)+lookback , <double *>(outfastd.data)+lookback )
     _ta_check_success("TA_STOCHRSI", retCode)
     return outfastk , outfastd 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SUB( np.ndarray real0 not None , np.ndarray real1 not None ):
-    """ SUB(real0, real1)
+def SUB( np.ndarray real0 not None , np.ndarray real1 not None , out=None ):
+    """ SUB(real0, real1[, out=None])
 
     Vector Arithmetic Subtraction (Math Operators)
 
@@ -4734,26 +6085,35 @@ def SUB( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real0 = check_array(real0)
-    real1 = check_array(real1)
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
-    begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
+    if single:
+        begidx = check_begidx2(length, <float*>(real0.data), <float*>(real1.data))
+    else:
+        begidx = check_begidx2(length, <double*>(real0.data), <double*>(real1.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SUB_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SUB( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real0, real1))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SUB( 0 , endidx , <float *>(real0.data)+begidx , <float *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SUB( 0 , endidx , <double *>(real0.data)+begidx , <double *>(real1.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SUB", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def SUM( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ SUM(real[, timeperiod=?])
+def SUM( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ SUM(real[, timeperiod=?, out=None])
 
     Summation (Math Operators)
 
@@ -4766,25 +6126,34 @@ def SUM( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_SUM_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_SUM( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SUM( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_SUM( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_SUM", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def T3( np.ndarray real not None , int timeperiod=-2**31 , double vfactor=-4e37 ):
-    """ T3(real[, timeperiod=?, vfactor=?])
+def T3( np.ndarray real not None , int timeperiod=-2**31 , double vfactor=-4e37 , out=None ):
+    """ T3(real[, timeperiod=?, vfactor=?, out=None])
 
     Triple Exponential Moving Average (T3) (Overlap Studies)
 
@@ -4798,25 +6167,34 @@ def T3( np.ndarray real not None , int timeperiod=-2**31 , double vfactor=-4e37
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_T3_Lookback( timeperiod , vfactor )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_T3( 0 , endidx , <double *>(real.data)+begidx , timeperiod , vfactor , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_T3( 0 , endidx , <float *>(real.data)+begidx , timeperiod , vfactor , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_T3( 0 , endidx , <double *>(real.data)+begidx , timeperiod , vfactor , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_T3", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TAN( np.ndarray real not None ):
-    """ TAN(real)
+def TAN( np.ndarray real not None , out=None ):
+    """ TAN(real[, out=None])
 
     Vector Trigonometric Tan (Math Transform)
 
@@ -4827,25 +6205,34 @@ def TAN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TAN_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TAN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TAN( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TAN( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TAN", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TANH( np.ndarray real not None ):
-    """ TANH(real)
+def TANH( np.ndarray real not None , out=None ):
+    """ TANH(real[, out=None])
 
     Vector Trigonometric Tanh (Math Transform)
 
@@ -4856,25 +6243,34 @@ def TANH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TANH_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TANH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TANH( 0 , endidx , <float *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TANH( 0 , endidx , <double *>(real.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TANH", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TEMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ TEMA(real[, timeperiod=?])
+def TEMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ TEMA(real[, timeperiod=?, out=None])
 
     Triple Exponential Moving Average (Overlap Studies)
 
@@ -4887,25 +6283,34 @@ def TEMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TEMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TEMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TEMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TEMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TEMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TRANGE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ TRANGE(high, low, close)
+def TRANGE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ TRANGE(high, low, close[, out=None])
 
     True Range (Volatility Indicators)
 
@@ -4916,27 +6321,36 @@ def TRANGE( np.ndarray high not None , np.ndarray low not None , np.ndarray clos
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TRANGE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TRANGE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRANGE( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TRANGE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TRANGE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TRIMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ TRIMA(real[, timeperiod=?])
+def TRIMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ TRIMA(real[, timeperiod=?, out=None])
 
     Triangular Moving Average (Overlap Studies)
 
@@ -4949,25 +6363,34 @@ def TRIMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TRIMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TRIMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRIMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TRIMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TRIMA", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TRIX( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ TRIX(real[, timeperiod=?])
+def TRIX( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ TRIX(real[, timeperiod=?, out=None])
 
     1-day Rate-Of-Change (ROC) of a Triple Smooth EMA (Momentum Indicators)
 
@@ -4980,25 +6403,34 @@ def TRIX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TRIX_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TRIX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRIX( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TRIX( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TRIX", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TSF( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ TSF(real[, timeperiod=?])
+def TSF( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ TSF(real[, timeperiod=?, out=None])
 
     Time Series Forecast (Statistic Functions)
 
@@ -5011,25 +6443,34 @@ def TSF( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TSF_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TSF( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TSF( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TSF( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TSF", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def TYPPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ TYPPRICE(high, low, close)
+def TYPPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ TYPPRICE(high, low, close[, out=None])
 
     Typical Price (Price Transform)
 
@@ -5040,27 +6481,36 @@ def TYPPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray cl
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_TYPPRICE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_TYPPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TYPPRICE( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_TYPPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_TYPPRICE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def ULTOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod1=-2**31 , int timeperiod2=-2**31 , int timeperiod3=-2**31 ):
-    """ ULTOSC(high, low, close[, timeperiod1=?, timeperiod2=?, timeperiod3=?])
+def ULTOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod1=-2**31 , int timeperiod2=-2**31 , int timeperiod3=-2**31 , out=None ):
+    """ ULTOSC(high, low, close[, timeperiod1=?, timeperiod2=?, timeperiod3=?, out=None])
 
     Ultimate Oscillator (Momentum Indicators)
 
@@ -5075,27 +6525,36 @@ def ULTOSC( np.ndarray high not None , np.ndarray low not None , np.ndarray clos
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_ULTOSC_Lookback( timeperiod1 , timeperiod2 , timeperiod3 )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_ULTOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ULTOSC( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_ULTOSC( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_ULTOSC", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def VAR( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e37 ):
-    """ VAR(real[, timeperiod=?, nbdev=?])
+def VAR( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e37 , out=None ):
+    """ VAR(real[, timeperiod=?, nbdev=?, out=None])
 
     Variance (Statistic Functions)
 
@@ -5109,25 +6568,34 @@ def VAR( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=-4e37 )
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_VAR_Lookback( timeperiod , nbdev )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_VAR( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_VAR( 0 , endidx , <float *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_VAR( 0 , endidx , <double *>(real.data)+begidx , timeperiod , nbdev , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_VAR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def WCLPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None ):
-    """ WCLPRICE(high, low, close)
+def WCLPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , out=None ):
+    """ WCLPRICE(high, low, close[, out=None])
 
     Weighted Close Price (Price Transform)
 
@@ -5138,27 +6606,36 @@ def WCLPRICE( np.ndarray high not None , np.ndarray low not None , np.ndarray cl
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_WCLPRICE_Lookback( )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_WCLPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WCLPRICE( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_WCLPRICE( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_WCLPRICE", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def WILLR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 ):
-    """ WILLR(high, low, close[, timeperiod=?])
+def WILLR( np.ndarray high not None , np.ndarray low not None , np.ndarray close not None , int timeperiod=-2**31 , out=None ):
+    """ WILLR(high, low, close[, timeperiod=?, out=None])
 
     Williams' %R (Momentum Indicators)
 
@@ -5171,27 +6648,36 @@ def WILLR( np.ndarray high not None , np.ndarray low not None , np.ndarray close
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    high = check_array(high)
-    low = check_array(low)
-    close = check_array(close)
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
-    begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
+    if single:
+        begidx = check_begidx3(length, <float*>(high.data), <float*>(low.data), <float*>(close.data))
+    else:
+        begidx = check_begidx3(length, <double*>(high.data), <double*>(low.data), <double*>(close.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_WILLR_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_WILLR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (high, low, close))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WILLR( 0 , endidx , <float *>(high.data)+begidx , <float *>(low.data)+begidx , <float *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_WILLR( 0 , endidx , <double *>(high.data)+begidx , <double *>(low.data)+begidx , <double *>(close.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_WILLR", retCode)
     return outreal 
 
 @wraparound(False)  # turn off relative indexing from end of lists
 @boundscheck(False) # turn off bounds-checking for entire function
-def WMA( np.ndarray real not None , int timeperiod=-2**31 ):
-    """ WMA(real[, timeperiod=?])
+def WMA( np.ndarray real not None , int timeperiod=-2**31 , out=None ):
+    """ WMA(real[, timeperiod=?, out=None])
 
     Weighted Moving Average (Overlap Studies)
 
@@ -5204,18 +6690,27 @@ def WMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         int begidx, endidx, lookback
         TA_RetCode retCode
         int outbegidx
         int outnbelement
         np.ndarray outreal
-    real = check_array(real)
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
-    begidx = check_begidx1(length, <double*>(real.data))
+    if single:
+        begidx = check_begidx1(length, <float*>(real.data))
+    else:
+        begidx = check_begidx1(length, <double*>(real.data))
     endidx = <int>length - begidx - 1
     lookback = begidx + lib.TA_WMA_Lookback( timeperiod )
-    outreal = make_double_array(length, lookback)
-    retCode = lib.TA_WMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+    outreal = make_double_array_out(out, 0, 1, length, lookback, (real,))
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WMA( 0 , endidx , <float *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
+        else:
+            retCode = lib.TA_WMA( 0 , endidx , <double *>(real.data)+begidx , timeperiod , &outbegidx , &outnbelement , <double *>(outreal.data)+lookback )
     _ta_check_success("TA_WMA", retCode)
     return outreal 
 
@@ -0,0 +1,114 @@
+import sys
+
+import numpy as np
+
+from ._ta_lib import _ta_pattern_scan, _to_float_array, __TA_FUNCTION_NAMES__
+
+PATTERN_FUNCTIONS = [name for name in __TA_FUNCTION_NAMES__ if name.startswith('CDL')]
+
+
+def _as_series(values):
+    """Returns the float64 arrays of one OHLC input, as a list with one per series."""
+    pandas = sys.modules.get('pandas')
+    if pandas is not None and isinstance(values, pandas.DataFrame):
+        # wide format: one column per symbol
+        values = [values[column] for column in values.columns]
+    elif isinstance(values, np.ndarray) and values.ndim == 2:
+        values = list(values)
+    elif isinstance(values, (list, tuple)):
+        values = list(values)
+    else:
+        values = [values]
+    return [np.ascontiguousarray(_to_float_array(value), dtype=np.float64) for value in values]
+
+
+def _default_labels(values):
+    """Returns the (symbols, index) a pandas input carries, or (None, None)."""
+    pandas = sys.modules.get('pandas')
+    if pandas is not None and isinstance(values, pandas.DataFrame):
+        return list(values.columns), values.index
+    if pandas is not None and isinstance(values, pandas.Series):
+        return None, values.index
+    return None, None
+
+
+def _hits(planes):
+    """Returns the (bars, pattern rows, directions) of one series' bit planes, in bar order."""
+    bars, rows, directions = [], [], []
+    for plane, direction in zip(planes, (1, -1)):
+        # only the non-zero bytes are unpacked
+        row, column = np.nonzero(plane)
+        bits = np.unpackbits(plane[row, column][:, None], axis=1, bitorder='little')
+        hit, bit = np.nonzero(bits)
+        bars.append(column[hit] * 8 + bit)
+        rows.append(row[hit])
+        directions.append(np.full(len(hit), direction))
+    bars, rows, directions = [np.concatenate(values) for values in (bars, rows, directions)]
+    order = np.lexsort((rows, bars))
+    return bars[order], rows[order], directions[order]
+
+
+def scan_patterns(open, high, low, close, patterns=None, symbols=None, index=None, bitset=False):
+    """
+    scan_patterns(open, high, low, close, patterns=None, symbols=None, index=None, bitset=False)
+
+    Runs every candlestick pattern function (``CDL*``), or the ``patterns``
+    given, over one or many OHLC series in one call. The inputs are one array
+    each for one series, or 2-D arrays (one row per series), lists of arrays
+    or wide pandas DataFrames (one column per symbol) for many. Every input
+    is checked once and the functions write into one reused buffer instead of
+    a full output array per pattern.
+
+    Returns the sparse list of hits as ``(symbol, timestamp, pattern,
+    direction)`` tuples, by symbol then timestamp, with a direction of 1 for
+    bullish and -1 for bearish results. ``symbols`` names the series (default:
+    the DataFrame columns, or the series position) and ``index`` gives the
+    timestamps, one sequence for all the series or one per series (default:
+    the pandas index, or the bar position).
+
+    With ``bitset=True``, returns one (2, len(patterns), ceil(length / 8))
+    uint8 matrix per series instead (a list of them for many series): the
+    bits of the bullish bars of every pattern in the first plane, the bearish
+    ones in the second, in ``numpy.packbits(..., bitorder='little')`` order.
+    """
+    if patterns is None:
+        patterns = PATTERN_FUNCTIONS
+    patterns = [getattr(pattern, '__name__', pattern).upper() for pattern in patterns]
+    for name in patterns:
+        if name not in PATTERN_FUNCTIONS:
+            raise Exception('%s is not a candlestick pattern function' % name)
+
+    many = isinstance(open, (list, tuple)) or getattr(open, 'ndim', 1) == 2
+    inputs = [_as_series(values) for values in (open, high, low, close)]
+    if len(set(len(values) for values in inputs)) != 1:
+        raise Exception("input series counts are different")
+    planes = _ta_pattern_scan(patterns, list(zip(*inputs)))
+    if bitset:
+        return planes if many else planes[0]
+
+    default_symbols, default_index = _default_labels(open)
+    if symbols is None:
+        symbols = default_symbols if default_symbols is not None else range(len(planes))
+    elif not many:
+        symbols = [symbols]
+    if len(symbols) != len(planes):
+        raise Exception("symbols and input series counts are different")
+    if index is None:
+        index = default_index
+    per_series = many and isinstance(index, (list, tuple)) and len(index) == len(planes) \
+        and all(np.ndim(timestamps) == 1 for timestamps in index)
+    if index is not None and not per_series:
+        index = [index] * len(planes)
+
+    names = np.array(patterns, dtype=object)
+    hits = []
+    for position, (symbol, series_planes) in enumerate(zip(symbols, planes)):
+        bars, rows, directions = _hits(series_planes)
+        if index is None:
+            timestamps = bars.tolist()
+        elif hasattr(index[position], 'take'):
+            timestamps = index[position].take(bars).tolist()
+        else:
+            timestamps = [index[position][bar] for bar in bars.tolist()]
+        hits.extend(zip([symbol] * len(bars), timestamps, names[rows].tolist(), directions.tolist()))
+    return hits
@@ -20,16 +20,20 @@ def stream_ACOS( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ACOS( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ACOS( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ACOS( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ACOS", retCode)
     return outreal 
 
@@ -47,25 +51,23 @@ def stream_AD( np.ndarray high not None , np.ndarray low not None , np.ndarray c
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
-        double* volume_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
-    volume = check_array(volume)
-    volume_data = <double*>volume.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
     outreal = NaN
-    retCode = lib.TA_AD( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , volume_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AD( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , <float *>(volume.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_AD( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , <double *>(volume.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_AD", retCode)
     return outreal 
 
@@ -84,19 +86,21 @@ def stream_ADD( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_ADD( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADD( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ADD( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ADD", retCode)
     return outreal 
 
@@ -117,25 +121,23 @@ def stream_ADOSC( np.ndarray high not None , np.ndarray low not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
-        double* volume_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
-    volume = check_array(volume)
-    volume_data = <double*>volume.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
     outreal = NaN
-    retCode = lib.TA_ADOSC( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , volume_data , fastperiod , slowperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADOSC( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , <float *>(volume.data) , fastperiod , slowperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ADOSC( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , <double *>(volume.data) , fastperiod , slowperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ADOSC", retCode)
     return outreal 
 
@@ -155,22 +157,22 @@ def stream_ADX( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_ADX( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADX( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ADX( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ADX", retCode)
     return outreal 
 
@@ -190,22 +192,22 @@ def stream_ADXR( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_ADXR( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ADXR( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ADXR( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ADXR", retCode)
     return outreal 
 
@@ -227,16 +229,20 @@ def stream_APO( np.ndarray real not None , int fastperiod=-2**31 , int slowperio
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_APO( <int>(length) - 1 , <int>(length) - 1 , real_data , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_APO( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_APO( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_APO", retCode)
     return outreal 
 
@@ -257,21 +263,23 @@ def stream_AROON( np.ndarray high not None , np.ndarray low not None , int timep
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outaroondown
         double outaroonup
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outaroondown = NaN
     outaroonup = NaN
-    retCode = lib.TA_AROON( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , timeperiod , &outbegidx , &outnbelement , &outaroondown , &outaroonup )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AROON( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outaroondown , &outaroonup )
+        else:
+            retCode = lib.TA_AROON( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outaroondown , &outaroonup )
     _ta_check_success("TA_AROON", retCode)
     return outaroondown , outaroonup 
 
@@ -291,19 +299,21 @@ def stream_AROONOSC( np.ndarray high not None , np.ndarray low not None , int ti
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_AROONOSC( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AROONOSC( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_AROONOSC( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_AROONOSC", retCode)
     return outreal 
 
@@ -321,16 +331,20 @@ def stream_ASIN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ASIN( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ASIN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ASIN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ASIN", retCode)
     return outreal 
 
@@ -348,16 +362,20 @@ def stream_ATAN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ATAN( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ATAN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ATAN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ATAN", retCode)
     return outreal 
 
@@ -377,22 +395,22 @@ def stream_ATR( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_ATR( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ATR( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ATR( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ATR", retCode)
     return outreal 
 
@@ -410,25 +428,23 @@ def stream_AVGPRICE( np.ndarray open not None , np.ndarray high not None , np.nd
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outreal = NaN
-    retCode = lib.TA_AVGPRICE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_AVGPRICE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_AVGPRICE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_AVGPRICE", retCode)
     return outreal 
 
@@ -453,20 +469,24 @@ def stream_BBANDS( np.ndarray real not None , int timeperiod=-2**31 , double nbd
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outrealupperband
         double outrealmiddleband
         double outreallowerband
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outrealupperband = NaN
     outrealmiddleband = NaN
     outreallowerband = NaN
-    retCode = lib.TA_BBANDS( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , &outrealupperband , &outrealmiddleband , &outreallowerband )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BBANDS( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , &outrealupperband , &outrealmiddleband , &outreallowerband )
+        else:
+            retCode = lib.TA_BBANDS( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , nbdevup , nbdevdn , matype , &outbegidx , &outnbelement , &outrealupperband , &outrealmiddleband , &outreallowerband )
     _ta_check_success("TA_BBANDS", retCode)
     return outrealupperband , outrealmiddleband , outreallowerband 
 
@@ -487,19 +507,21 @@ def stream_BETA( np.ndarray real0 not None , np.ndarray real1 not None , int tim
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_BETA( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BETA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_BETA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_BETA", retCode)
     return outreal 
 
@@ -517,25 +539,23 @@ def stream_BOP( np.ndarray open not None , np.ndarray high not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outreal = NaN
-    retCode = lib.TA_BOP( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_BOP( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_BOP( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_BOP", retCode)
     return outreal 
 
@@ -555,22 +575,22 @@ def stream_CCI( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_CCI( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CCI( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_CCI( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_CCI", retCode)
     return outreal 
 
@@ -588,25 +608,23 @@ def stream_CDL2CROWS( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL2CROWS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL2CROWS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL2CROWS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL2CROWS", retCode)
     return outinteger 
 
@@ -624,25 +642,23 @@ def stream_CDL3BLACKCROWS( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3BLACKCROWS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3BLACKCROWS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3BLACKCROWS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3BLACKCROWS", retCode)
     return outinteger 
 
@@ -660,25 +676,23 @@ def stream_CDL3INSIDE( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3INSIDE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3INSIDE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3INSIDE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3INSIDE", retCode)
     return outinteger 
 
@@ -696,25 +710,23 @@ def stream_CDL3LINESTRIKE( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3LINESTRIKE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3LINESTRIKE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3LINESTRIKE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3LINESTRIKE", retCode)
     return outinteger 
 
@@ -732,25 +744,23 @@ def stream_CDL3OUTSIDE( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3OUTSIDE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3OUTSIDE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3OUTSIDE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3OUTSIDE", retCode)
     return outinteger 
 
@@ -768,25 +778,23 @@ def stream_CDL3STARSINSOUTH( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3STARSINSOUTH( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3STARSINSOUTH( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3STARSINSOUTH( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3STARSINSOUTH", retCode)
     return outinteger 
 
@@ -804,25 +812,23 @@ def stream_CDL3WHITESOLDIERS( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDL3WHITESOLDIERS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDL3WHITESOLDIERS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDL3WHITESOLDIERS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDL3WHITESOLDIERS", retCode)
     return outinteger 
 
@@ -842,25 +848,23 @@ def stream_CDLABANDONEDBABY( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLABANDONEDBABY( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLABANDONEDBABY( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLABANDONEDBABY( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLABANDONEDBABY", retCode)
     return outinteger 
 
@@ -878,25 +882,23 @@ def stream_CDLADVANCEBLOCK( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLADVANCEBLOCK( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLADVANCEBLOCK( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLADVANCEBLOCK( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLADVANCEBLOCK", retCode)
     return outinteger 
 
@@ -914,25 +916,23 @@ def stream_CDLBELTHOLD( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLBELTHOLD( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLBELTHOLD( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLBELTHOLD( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLBELTHOLD", retCode)
     return outinteger 
 
@@ -950,25 +950,23 @@ def stream_CDLBREAKAWAY( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLBREAKAWAY( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLBREAKAWAY( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLBREAKAWAY( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLBREAKAWAY", retCode)
     return outinteger 
 
@@ -986,25 +984,23 @@ def stream_CDLCLOSINGMARUBOZU( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLCLOSINGMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCLOSINGMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLCLOSINGMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLCLOSINGMARUBOZU", retCode)
     return outinteger 
 
@@ -1022,25 +1018,23 @@ def stream_CDLCONCEALBABYSWALL( np.ndarray open not None , np.ndarray high not N
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLCONCEALBABYSWALL( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCONCEALBABYSWALL( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLCONCEALBABYSWALL( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLCONCEALBABYSWALL", retCode)
     return outinteger 
 
@@ -1058,25 +1052,23 @@ def stream_CDLCOUNTERATTACK( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLCOUNTERATTACK( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLCOUNTERATTACK( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLCOUNTERATTACK( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLCOUNTERATTACK", retCode)
     return outinteger 
 
@@ -1096,25 +1088,23 @@ def stream_CDLDARKCLOUDCOVER( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLDARKCLOUDCOVER( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDARKCLOUDCOVER( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLDARKCLOUDCOVER( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLDARKCLOUDCOVER", retCode)
     return outinteger 
 
@@ -1132,25 +1122,23 @@ def stream_CDLDOJI( np.ndarray open not None , np.ndarray high not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLDOJI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDOJI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLDOJI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLDOJI", retCode)
     return outinteger 
 
@@ -1168,25 +1156,23 @@ def stream_CDLDOJISTAR( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLDOJISTAR", retCode)
     return outinteger 
 
@@ -1204,25 +1190,23 @@ def stream_CDLDRAGONFLYDOJI( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLDRAGONFLYDOJI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLDRAGONFLYDOJI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLDRAGONFLYDOJI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLDRAGONFLYDOJI", retCode)
     return outinteger 
 
@@ -1240,25 +1224,23 @@ def stream_CDLENGULFING( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLENGULFING( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLENGULFING( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLENGULFING( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLENGULFING", retCode)
     return outinteger 
 
@@ -1278,25 +1260,23 @@ def stream_CDLEVENINGDOJISTAR( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLEVENINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLEVENINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLEVENINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLEVENINGDOJISTAR", retCode)
     return outinteger 
 
@@ -1316,25 +1296,23 @@ def stream_CDLEVENINGSTAR( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLEVENINGSTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLEVENINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLEVENINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLEVENINGSTAR", retCode)
     return outinteger 
 
@@ -1352,25 +1330,23 @@ def stream_CDLGAPSIDESIDEWHITE( np.ndarray open not None , np.ndarray high not N
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLGAPSIDESIDEWHITE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLGAPSIDESIDEWHITE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLGAPSIDESIDEWHITE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLGAPSIDESIDEWHITE", retCode)
     return outinteger 
 
@@ -1388,25 +1364,23 @@ def stream_CDLGRAVESTONEDOJI( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLGRAVESTONEDOJI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLGRAVESTONEDOJI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLGRAVESTONEDOJI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLGRAVESTONEDOJI", retCode)
     return outinteger 
 
@@ -1424,25 +1398,23 @@ def stream_CDLHAMMER( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHAMMER( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHAMMER( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHAMMER( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHAMMER", retCode)
     return outinteger 
 
@@ -1460,25 +1432,23 @@ def stream_CDLHANGINGMAN( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHANGINGMAN( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHANGINGMAN( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHANGINGMAN( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHANGINGMAN", retCode)
     return outinteger 
 
@@ -1496,25 +1466,23 @@ def stream_CDLHARAMI( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHARAMI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHARAMI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHARAMI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHARAMI", retCode)
     return outinteger 
 
@@ -1532,25 +1500,23 @@ def stream_CDLHARAMICROSS( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHARAMICROSS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHARAMICROSS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHARAMICROSS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHARAMICROSS", retCode)
     return outinteger 
 
@@ -1568,25 +1534,23 @@ def stream_CDLHIGHWAVE( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHIGHWAVE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIGHWAVE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHIGHWAVE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHIGHWAVE", retCode)
     return outinteger 
 
@@ -1604,25 +1568,23 @@ def stream_CDLHIKKAKE( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHIKKAKE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIKKAKE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHIKKAKE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHIKKAKE", retCode)
     return outinteger 
 
@@ -1640,25 +1602,23 @@ def stream_CDLHIKKAKEMOD( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHIKKAKEMOD( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHIKKAKEMOD( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHIKKAKEMOD( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHIKKAKEMOD", retCode)
     return outinteger 
 
@@ -1676,25 +1636,23 @@ def stream_CDLHOMINGPIGEON( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLHOMINGPIGEON( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLHOMINGPIGEON( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLHOMINGPIGEON( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLHOMINGPIGEON", retCode)
     return outinteger 
 
@@ -1712,25 +1670,23 @@ def stream_CDLIDENTICAL3CROWS( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLIDENTICAL3CROWS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLIDENTICAL3CROWS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLIDENTICAL3CROWS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLIDENTICAL3CROWS", retCode)
     return outinteger 
 
@@ -1748,25 +1704,23 @@ def stream_CDLINNECK( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLINNECK( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLINNECK( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLINNECK( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLINNECK", retCode)
     return outinteger 
 
@@ -1784,25 +1738,23 @@ def stream_CDLINVERTEDHAMMER( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLINVERTEDHAMMER( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLINVERTEDHAMMER( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLINVERTEDHAMMER( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLINVERTEDHAMMER", retCode)
     return outinteger 
 
@@ -1820,25 +1772,23 @@ def stream_CDLKICKING( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLKICKING( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLKICKING( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLKICKING( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLKICKING", retCode)
     return outinteger 
 
@@ -1856,25 +1806,23 @@ def stream_CDLKICKINGBYLENGTH( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLKICKINGBYLENGTH( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLKICKINGBYLENGTH( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLKICKINGBYLENGTH( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLKICKINGBYLENGTH", retCode)
     return outinteger 
 
@@ -1892,25 +1840,23 @@ def stream_CDLLADDERBOTTOM( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLLADDERBOTTOM( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLADDERBOTTOM( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLLADDERBOTTOM( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLLADDERBOTTOM", retCode)
     return outinteger 
 
@@ -1928,25 +1874,23 @@ def stream_CDLLONGLEGGEDDOJI( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLLONGLEGGEDDOJI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLONGLEGGEDDOJI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLLONGLEGGEDDOJI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLLONGLEGGEDDOJI", retCode)
     return outinteger 
 
@@ -1964,25 +1908,23 @@ def stream_CDLLONGLINE( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLLONGLINE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLLONGLINE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLLONGLINE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLLONGLINE", retCode)
     return outinteger 
 
@@ -2000,25 +1942,23 @@ def stream_CDLMARUBOZU( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLMARUBOZU( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLMARUBOZU", retCode)
     return outinteger 
 
@@ -2036,25 +1976,23 @@ def stream_CDLMATCHINGLOW( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLMATCHINGLOW( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMATCHINGLOW( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLMATCHINGLOW( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLMATCHINGLOW", retCode)
     return outinteger 
 
@@ -2074,25 +2012,23 @@ def stream_CDLMATHOLD( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLMATHOLD( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMATHOLD( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLMATHOLD( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLMATHOLD", retCode)
     return outinteger 
 
@@ -2112,25 +2048,23 @@ def stream_CDLMORNINGDOJISTAR( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLMORNINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMORNINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLMORNINGDOJISTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLMORNINGDOJISTAR", retCode)
     return outinteger 
 
@@ -2150,25 +2084,23 @@ def stream_CDLMORNINGSTAR( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLMORNINGSTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , penetration , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLMORNINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLMORNINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , penetration , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLMORNINGSTAR", retCode)
     return outinteger 
 
@@ -2186,25 +2118,23 @@ def stream_CDLONNECK( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLONNECK( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLONNECK( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLONNECK( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLONNECK", retCode)
     return outinteger 
 
@@ -2222,25 +2152,23 @@ def stream_CDLPIERCING( np.ndarray open not None , np.ndarray high not None , np
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLPIERCING( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLPIERCING( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLPIERCING( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLPIERCING", retCode)
     return outinteger 
 
@@ -2258,25 +2186,23 @@ def stream_CDLRICKSHAWMAN( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLRICKSHAWMAN( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLRICKSHAWMAN( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLRICKSHAWMAN( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLRICKSHAWMAN", retCode)
     return outinteger 
 
@@ -2294,25 +2220,23 @@ def stream_CDLRISEFALL3METHODS( np.ndarray open not None , np.ndarray high not N
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLRISEFALL3METHODS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLRISEFALL3METHODS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLRISEFALL3METHODS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLRISEFALL3METHODS", retCode)
     return outinteger 
 
@@ -2330,25 +2254,23 @@ def stream_CDLSEPARATINGLINES( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSEPARATINGLINES( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSEPARATINGLINES( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSEPARATINGLINES( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSEPARATINGLINES", retCode)
     return outinteger 
 
@@ -2366,25 +2288,23 @@ def stream_CDLSHOOTINGSTAR( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSHOOTINGSTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSHOOTINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSHOOTINGSTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSHOOTINGSTAR", retCode)
     return outinteger 
 
@@ -2402,25 +2322,23 @@ def stream_CDLSHORTLINE( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSHORTLINE( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSHORTLINE( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSHORTLINE( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSHORTLINE", retCode)
     return outinteger 
 
@@ -2438,25 +2356,23 @@ def stream_CDLSPINNINGTOP( np.ndarray open not None , np.ndarray high not None ,
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSPINNINGTOP( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSPINNINGTOP( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSPINNINGTOP( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSPINNINGTOP", retCode)
     return outinteger 
 
@@ -2474,25 +2390,23 @@ def stream_CDLSTALLEDPATTERN( np.ndarray open not None , np.ndarray high not Non
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSTALLEDPATTERN( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSTALLEDPATTERN( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSTALLEDPATTERN( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSTALLEDPATTERN", retCode)
     return outinteger 
 
@@ -2510,25 +2424,23 @@ def stream_CDLSTICKSANDWICH( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLSTICKSANDWICH( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLSTICKSANDWICH( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLSTICKSANDWICH( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLSTICKSANDWICH", retCode)
     return outinteger 
 
@@ -2546,25 +2458,23 @@ def stream_CDLTAKURI( np.ndarray open not None , np.ndarray high not None , np.n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLTAKURI( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTAKURI( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLTAKURI( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLTAKURI", retCode)
     return outinteger 
 
@@ -2582,25 +2492,23 @@ def stream_CDLTASUKIGAP( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLTASUKIGAP( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTASUKIGAP( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLTASUKIGAP( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLTASUKIGAP", retCode)
     return outinteger 
 
@@ -2618,25 +2526,23 @@ def stream_CDLTHRUSTING( np.ndarray open not None , np.ndarray high not None , n
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLTHRUSTING( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTHRUSTING( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLTHRUSTING( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLTHRUSTING", retCode)
     return outinteger 
 
@@ -2654,25 +2560,23 @@ def stream_CDLTRISTAR( np.ndarray open not None , np.ndarray high not None , np.
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLTRISTAR( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLTRISTAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLTRISTAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLTRISTAR", retCode)
     return outinteger 
 
@@ -2690,25 +2594,23 @@ def stream_CDLUNIQUE3RIVER( np.ndarray open not None , np.ndarray high not None
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLUNIQUE3RIVER( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLUNIQUE3RIVER( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLUNIQUE3RIVER( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLUNIQUE3RIVER", retCode)
     return outinteger 
 
@@ -2726,25 +2628,23 @@ def stream_CDLUPSIDEGAP2CROWS( np.ndarray open not None , np.ndarray high not No
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLUPSIDEGAP2CROWS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLUPSIDEGAP2CROWS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLUPSIDEGAP2CROWS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLUPSIDEGAP2CROWS", retCode)
     return outinteger 
 
@@ -2762,25 +2662,23 @@ def stream_CDLXSIDEGAP3METHODS( np.ndarray open not None , np.ndarray high not N
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* open_data
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         int outinteger
-    open = check_array(open)
-    open_data = <double*>open.data
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(open) == np.NPY_FLOAT
+    open = check_array(open, single)
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length4(open, high, low, close)
     outinteger = 0
-    retCode = lib.TA_CDLXSIDEGAP3METHODS( <int>(length) - 1 , <int>(length) - 1 , open_data , high_data , low_data , close_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CDLXSIDEGAP3METHODS( <int>(length) - 1 , <int>(length) - 1 , <float *>(open.data) , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_CDLXSIDEGAP3METHODS( <int>(length) - 1 , <int>(length) - 1 , <double *>(open.data) , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_CDLXSIDEGAP3METHODS", retCode)
     return outinteger 
 
@@ -2798,16 +2696,20 @@ def stream_CEIL( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_CEIL( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CEIL( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_CEIL( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_CEIL", retCode)
     return outreal 
 
@@ -2827,16 +2729,20 @@ def stream_CMO( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_CMO( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CMO( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_CMO( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_CMO", retCode)
     return outreal 
 
@@ -2857,19 +2763,21 @@ def stream_CORREL( np.ndarray real0 not None , np.ndarray real1 not None , int t
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_CORREL( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_CORREL( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_CORREL( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_CORREL", retCode)
     return outreal 
 
@@ -2887,16 +2795,20 @@ def stream_COS( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_COS( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_COS( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_COS( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_COS", retCode)
     return outreal 
 
@@ -2914,16 +2826,20 @@ def stream_COSH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_COSH( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_COSH( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_COSH( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_COSH", retCode)
     return outreal 
 
@@ -2943,16 +2859,20 @@ def stream_DEMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_DEMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DEMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_DEMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_DEMA", retCode)
     return outreal 
 
@@ -2971,19 +2891,21 @@ def stream_DIV( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_DIV( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DIV( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_DIV( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_DIV", retCode)
     return outreal 
 
@@ -3003,22 +2925,22 @@ def stream_DX( np.ndarray high not None , np.ndarray low not None , np.ndarray c
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_DX( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_DX( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_DX( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_DX", retCode)
     return outreal 
 
@@ -3038,16 +2960,20 @@ def stream_EMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_EMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_EMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_EMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_EMA", retCode)
     return outreal 
 
@@ -3065,16 +2991,20 @@ def stream_EXP( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_EXP( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_EXP( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_EXP( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_EXP", retCode)
     return outreal 
 
@@ -3092,16 +3022,20 @@ def stream_FLOOR( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_FLOOR( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_FLOOR( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_FLOOR( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_FLOOR", retCode)
     return outreal 
 
@@ -3119,16 +3053,20 @@ def stream_HT_DCPERIOD( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_HT_DCPERIOD( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_DCPERIOD( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_HT_DCPERIOD( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_HT_DCPERIOD", retCode)
     return outreal 
 
@@ -3146,16 +3084,20 @@ def stream_HT_DCPHASE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_HT_DCPHASE( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_DCPHASE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_HT_DCPHASE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_HT_DCPHASE", retCode)
     return outreal 
 
@@ -3174,18 +3116,22 @@ def stream_HT_PHASOR( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outinphase
         double outquadrature
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outinphase = NaN
     outquadrature = NaN
-    retCode = lib.TA_HT_PHASOR( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outinphase , &outquadrature )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_PHASOR( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outinphase , &outquadrature )
+        else:
+            retCode = lib.TA_HT_PHASOR( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outinphase , &outquadrature )
     _ta_check_success("TA_HT_PHASOR", retCode)
     return outinphase , outquadrature 
 
@@ -3204,18 +3150,22 @@ def stream_HT_SINE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outsine
         double outleadsine
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outsine = NaN
     outleadsine = NaN
-    retCode = lib.TA_HT_SINE( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outsine , &outleadsine )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_SINE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outsine , &outleadsine )
+        else:
+            retCode = lib.TA_HT_SINE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outsine , &outleadsine )
     _ta_check_success("TA_HT_SINE", retCode)
     return outsine , outleadsine 
 
@@ -3233,16 +3183,20 @@ def stream_HT_TRENDLINE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_HT_TRENDLINE( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_TRENDLINE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_HT_TRENDLINE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_HT_TRENDLINE", retCode)
     return outreal 
 
@@ -3260,16 +3214,20 @@ def stream_HT_TRENDMODE( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         int outinteger
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outinteger = 0
-    retCode = lib.TA_HT_TRENDMODE( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_HT_TRENDMODE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_HT_TRENDMODE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_HT_TRENDMODE", retCode)
     return outinteger 
 
@@ -3289,16 +3247,20 @@ def stream_KAMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_KAMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_KAMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_KAMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_KAMA", retCode)
     return outreal 
 
@@ -3318,16 +3280,20 @@ def stream_LINEARREG( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LINEARREG( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LINEARREG( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LINEARREG", retCode)
     return outreal 
 
@@ -3347,16 +3313,20 @@ def stream_LINEARREG_ANGLE( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LINEARREG_ANGLE( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_ANGLE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LINEARREG_ANGLE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LINEARREG_ANGLE", retCode)
     return outreal 
 
@@ -3376,16 +3346,20 @@ def stream_LINEARREG_INTERCEPT( np.ndarray real not None , int timeperiod=-2**31
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LINEARREG_INTERCEPT( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_INTERCEPT( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LINEARREG_INTERCEPT( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LINEARREG_INTERCEPT", retCode)
     return outreal 
 
@@ -3405,16 +3379,20 @@ def stream_LINEARREG_SLOPE( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LINEARREG_SLOPE( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LINEARREG_SLOPE( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LINEARREG_SLOPE( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LINEARREG_SLOPE", retCode)
     return outreal 
 
@@ -3432,16 +3410,20 @@ def stream_LN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LN( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LN", retCode)
     return outreal 
 
@@ -3459,16 +3441,20 @@ def stream_LOG10( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_LOG10( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_LOG10( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_LOG10( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_LOG10", retCode)
     return outreal 
 
@@ -3489,16 +3475,20 @@ def stream_MA( np.ndarray real not None , int timeperiod=-2**31 , int matype=0 )
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_MA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , matype , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , matype , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , matype , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MA", retCode)
     return outreal 
 
@@ -3522,20 +3512,24 @@ def stream_MACD( np.ndarray real not None , int fastperiod=-2**31 , int slowperi
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outmacd
         double outmacdsignal
         double outmacdhist
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outmacd = NaN
     outmacdsignal = NaN
     outmacdhist = NaN
-    retCode = lib.TA_MACD( <int>(length) - 1 , <int>(length) - 1 , real_data , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACD( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+        else:
+            retCode = lib.TA_MACD( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , fastperiod , slowperiod , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
     _ta_check_success("TA_MACD", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
@@ -3562,20 +3556,24 @@ def stream_MACDEXT( np.ndarray real not None , int fastperiod=-2**31 , int fastm
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outmacd
         double outmacdsignal
         double outmacdhist
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outmacd = NaN
     outmacdsignal = NaN
     outmacdhist = NaN
-    retCode = lib.TA_MACDEXT( <int>(length) - 1 , <int>(length) - 1 , real_data , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACDEXT( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+        else:
+            retCode = lib.TA_MACDEXT( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , fastperiod , fastmatype , slowperiod , slowmatype , signalperiod , signalmatype , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
     _ta_check_success("TA_MACDEXT", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
@@ -3597,20 +3595,24 @@ def stream_MACDFIX( np.ndarray real not None , int signalperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outmacd
         double outmacdsignal
         double outmacdhist
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outmacd = NaN
     outmacdsignal = NaN
     outmacdhist = NaN
-    retCode = lib.TA_MACDFIX( <int>(length) - 1 , <int>(length) - 1 , real_data , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MACDFIX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
+        else:
+            retCode = lib.TA_MACDFIX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , signalperiod , &outbegidx , &outnbelement , &outmacd , &outmacdsignal , &outmacdhist )
     _ta_check_success("TA_MACDFIX", retCode)
     return outmacd , outmacdsignal , outmacdhist 
 
@@ -3632,18 +3634,22 @@ def stream_MAMA( np.ndarray real not None , double fastlimit=-4e37 , double slow
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outmama
         double outfama
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outmama = NaN
     outfama = NaN
-    retCode = lib.TA_MAMA( <int>(length) - 1 , <int>(length) - 1 , real_data , fastlimit , slowlimit , &outbegidx , &outnbelement , &outmama , &outfama )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , fastlimit , slowlimit , &outbegidx , &outnbelement , &outmama , &outfama )
+        else:
+            retCode = lib.TA_MAMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , fastlimit , slowlimit , &outbegidx , &outnbelement , &outmama , &outfama )
     _ta_check_success("TA_MAMA", retCode)
     return outmama , outfama 
 
@@ -3666,19 +3672,21 @@ def stream_MAVP( np.ndarray real not None , np.ndarray periods not None , int mi
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
-        double* periods_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
-    periods = check_array(periods)
-    periods_data = <double*>periods.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
+    periods = check_array(periods, single)
     length = check_length2(real, periods)
     outreal = NaN
-    retCode = lib.TA_MAVP( <int>(length) - 1 , <int>(length) - 1 , real_data , periods_data , minperiod , maxperiod , matype , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAVP( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , <float *>(periods.data) , minperiod , maxperiod , matype , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MAVP( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , <double *>(periods.data) , minperiod , maxperiod , matype , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MAVP", retCode)
     return outreal 
 
@@ -3698,16 +3706,20 @@ def stream_MAX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_MAX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MAX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MAX", retCode)
     return outreal 
 
@@ -3727,16 +3739,20 @@ def stream_MAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         int outinteger
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outinteger = 0
-    retCode = lib.TA_MAXINDEX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MAXINDEX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_MAXINDEX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_MAXINDEX", retCode)
     return outinteger 
 
@@ -3754,19 +3770,21 @@ def stream_MEDPRICE( np.ndarray high not None , np.ndarray low not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_MEDPRICE( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MEDPRICE( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MEDPRICE( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MEDPRICE", retCode)
     return outreal 
 
@@ -3786,25 +3804,23 @@ def stream_MFI( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
-        double* volume_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
-    volume = check_array(volume)
-    volume_data = <double*>volume.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
+    volume = check_array(volume, single)
     length = check_length4(high, low, close, volume)
     outreal = NaN
-    retCode = lib.TA_MFI( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , volume_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MFI( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , <float *>(volume.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MFI( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , <double *>(volume.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MFI", retCode)
     return outreal 
 
@@ -3824,16 +3840,20 @@ def stream_MIDPOINT( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_MIDPOINT( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIDPOINT( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MIDPOINT( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MIDPOINT", retCode)
     return outreal 
 
@@ -3853,19 +3873,21 @@ def stream_MIDPRICE( np.ndarray high not None , np.ndarray low not None , int ti
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_MIDPRICE( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIDPRICE( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MIDPRICE( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MIDPRICE", retCode)
     return outreal 
 
@@ -3885,16 +3907,20 @@ def stream_MIN( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_MIN( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MIN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MIN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MIN", retCode)
     return outreal 
 
@@ -3914,16 +3940,20 @@ def stream_MININDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         int outinteger
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outinteger = 0
-    retCode = lib.TA_MININDEX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outinteger )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MININDEX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outinteger )
+        else:
+            retCode = lib.TA_MININDEX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outinteger )
     _ta_check_success("TA_MININDEX", retCode)
     return outinteger 
 
@@ -3944,18 +3974,22 @@ def stream_MINMAX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outmin
         double outmax
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outmin = NaN
     outmax = NaN
-    retCode = lib.TA_MINMAX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outmin , &outmax )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINMAX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outmin , &outmax )
+        else:
+            retCode = lib.TA_MINMAX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outmin , &outmax )
     _ta_check_success("TA_MINMAX", retCode)
     return outmin , outmax 
 
@@ -3976,18 +4010,22 @@ def stream_MINMAXINDEX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         int outminidx
         int outmaxidx
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outminidx = 0
     outmaxidx = 0
-    retCode = lib.TA_MINMAXINDEX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outminidx , &outmaxidx )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINMAXINDEX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outminidx , &outmaxidx )
+        else:
+            retCode = lib.TA_MINMAXINDEX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outminidx , &outmaxidx )
     _ta_check_success("TA_MINMAXINDEX", retCode)
     return outminidx , outmaxidx 
 
@@ -4007,22 +4045,22 @@ def stream_MINUS_DI( np.ndarray high not None , np.ndarray low not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_MINUS_DI( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINUS_DI( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MINUS_DI( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MINUS_DI", retCode)
     return outreal 
 
@@ -4042,19 +4080,21 @@ def stream_MINUS_DM( np.ndarray high not None , np.ndarray low not None , int ti
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_MINUS_DM( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MINUS_DM( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MINUS_DM( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MINUS_DM", retCode)
     return outreal 
 
@@ -4074,16 +4114,20 @@ def stream_MOM( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_MOM( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MOM( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MOM( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MOM", retCode)
     return outreal 
 
@@ -4102,19 +4146,21 @@ def stream_MULT( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_MULT( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_MULT( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_MULT( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_MULT", retCode)
     return outreal 
 
@@ -4134,22 +4180,22 @@ def stream_NATR( np.ndarray high not None , np.ndarray low not None , np.ndarray
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_NATR( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_NATR( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_NATR( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_NATR", retCode)
     return outreal 
 
@@ -4168,19 +4214,21 @@ def stream_OBV( np.ndarray real not None , np.ndarray volume not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
-        double* volume_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
-    volume = check_array(volume)
-    volume_data = <double*>volume.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
+    volume = check_array(volume, single)
     length = check_length2(real, volume)
     outreal = NaN
-    retCode = lib.TA_OBV( <int>(length) - 1 , <int>(length) - 1 , real_data , volume_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_OBV( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , <float *>(volume.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_OBV( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , <double *>(volume.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_OBV", retCode)
     return outreal 
 
@@ -4200,22 +4248,22 @@ def stream_PLUS_DI( np.ndarray high not None , np.ndarray low not None , np.ndar
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_PLUS_DI( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PLUS_DI( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_PLUS_DI( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_PLUS_DI", retCode)
     return outreal 
 
@@ -4235,19 +4283,21 @@ def stream_PLUS_DM( np.ndarray high not None , np.ndarray low not None , int tim
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_PLUS_DM( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PLUS_DM( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_PLUS_DM( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_PLUS_DM", retCode)
     return outreal 
 
@@ -4269,16 +4319,20 @@ def stream_PPO( np.ndarray real not None , int fastperiod=-2**31 , int slowperio
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_PPO( <int>(length) - 1 , <int>(length) - 1 , real_data , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_PPO( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_PPO( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , fastperiod , slowperiod , matype , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_PPO", retCode)
     return outreal 
 
@@ -4298,16 +4352,20 @@ def stream_ROC( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ROC( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROC( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ROC( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ROC", retCode)
     return outreal 
 
@@ -4327,16 +4385,20 @@ def stream_ROCP( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ROCP( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCP( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ROCP( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ROCP", retCode)
     return outreal 
 
@@ -4356,16 +4418,20 @@ def stream_ROCR( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ROCR( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCR( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ROCR( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ROCR", retCode)
     return outreal 
 
@@ -4385,16 +4451,20 @@ def stream_ROCR100( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_ROCR100( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ROCR100( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ROCR100( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ROCR100", retCode)
     return outreal 
 
@@ -4414,16 +4484,20 @@ def stream_RSI( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_RSI( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_RSI( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_RSI( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_RSI", retCode)
     return outreal 
 
@@ -4444,19 +4518,21 @@ def stream_SAR( np.ndarray high not None , np.ndarray low not None , double acce
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_SAR( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , acceleration , maximum , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , acceleration , maximum , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , acceleration , maximum , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SAR", retCode)
     return outreal 
 
@@ -4483,19 +4559,21 @@ def stream_SAREXT( np.ndarray high not None , np.ndarray low not None , double s
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
     length = check_length2(high, low)
     outreal = NaN
-    retCode = lib.TA_SAREXT( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SAREXT( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SAREXT( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , startvalue , offsetonreverse , accelerationinitlong , accelerationlong , accelerationmaxlong , accelerationinitshort , accelerationshort , accelerationmaxshort , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SAREXT", retCode)
     return outreal 
 
@@ -4513,16 +4591,20 @@ def stream_SIN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_SIN( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SIN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SIN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SIN", retCode)
     return outreal 
 
@@ -4540,16 +4622,20 @@ def stream_SINH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_SINH( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SINH( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SINH( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SINH", retCode)
     return outreal 
 
@@ -4569,16 +4655,20 @@ def stream_SMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_SMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SMA", retCode)
     return outreal 
 
@@ -4596,16 +4686,20 @@ def stream_SQRT( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_SQRT( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SQRT( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SQRT( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SQRT", retCode)
     return outreal 
 
@@ -4626,16 +4720,20 @@ def stream_STDDEV( np.ndarray real not None , int timeperiod=-2**31 , double nbd
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_STDDEV( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STDDEV( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_STDDEV( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_STDDEV", retCode)
     return outreal 
 
@@ -4660,24 +4758,24 @@ def stream_STOCH( np.ndarray high not None , np.ndarray low not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outslowk
         double outslowd
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outslowk = NaN
     outslowd = NaN
-    retCode = lib.TA_STOCH( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , &outslowk , &outslowd )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCH( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , &outslowk , &outslowd )
+        else:
+            retCode = lib.TA_STOCH( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , fastk_period , slowk_period , slowk_matype , slowd_period , slowd_matype , &outbegidx , &outnbelement , &outslowk , &outslowd )
     _ta_check_success("TA_STOCH", retCode)
     return outslowk , outslowd 
 
@@ -4700,24 +4798,24 @@ def stream_STOCHF( np.ndarray high not None , np.ndarray low not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outfastk
         double outfastd
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outfastk = NaN
     outfastd = NaN
-    retCode = lib.TA_STOCHF( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCHF( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
+        else:
+            retCode = lib.TA_STOCHF( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
     _ta_check_success("TA_STOCHF", retCode)
     return outfastk , outfastd 
 
@@ -4741,18 +4839,22 @@ def stream_STOCHRSI( np.ndarray real not None , int timeperiod=-2**31 , int fast
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outfastk
         double outfastd
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outfastk = NaN
     outfastd = NaN
-    retCode = lib.TA_STOCHRSI( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_STOCHRSI( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
+        else:
+            retCode = lib.TA_STOCHRSI( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , fastk_period , fastd_period , fastd_matype , &outbegidx , &outnbelement , &outfastk , &outfastd )
     _ta_check_success("TA_STOCHRSI", retCode)
     return outfastk , outfastd 
 
@@ -4771,19 +4873,21 @@ def stream_SUB( np.ndarray real0 not None , np.ndarray real1 not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real0_data
-        double* real1_data
         int outbegidx
         int outnbelement
         double outreal
-    real0 = check_array(real0)
-    real0_data = <double*>real0.data
-    real1 = check_array(real1)
-    real1_data = <double*>real1.data
+    single = PyArray_TYPE(real0) == np.NPY_FLOAT
+    real0 = check_array(real0, single)
+    real1 = check_array(real1, single)
     length = check_length2(real0, real1)
     outreal = NaN
-    retCode = lib.TA_SUB( <int>(length) - 1 , <int>(length) - 1 , real0_data , real1_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SUB( <int>(length) - 1 , <int>(length) - 1 , <float *>(real0.data) , <float *>(real1.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SUB( <int>(length) - 1 , <int>(length) - 1 , <double *>(real0.data) , <double *>(real1.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SUB", retCode)
     return outreal 
 
@@ -4803,16 +4907,20 @@ def stream_SUM( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_SUM( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_SUM( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_SUM( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_SUM", retCode)
     return outreal 
 
@@ -4833,16 +4941,20 @@ def stream_T3( np.ndarray real not None , int timeperiod=-2**31 , double vfactor
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_T3( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , vfactor , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_T3( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , vfactor , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_T3( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , vfactor , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_T3", retCode)
     return outreal 
 
@@ -4860,16 +4972,20 @@ def stream_TAN( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TAN( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TAN( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TAN( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TAN", retCode)
     return outreal 
 
@@ -4887,16 +5003,20 @@ def stream_TANH( np.ndarray real not None ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TANH( <int>(length) - 1 , <int>(length) - 1 , real_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TANH( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TANH( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TANH", retCode)
     return outreal 
 
@@ -4916,16 +5036,20 @@ def stream_TEMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TEMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TEMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TEMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TEMA", retCode)
     return outreal 
 
@@ -4943,22 +5067,22 @@ def stream_TRANGE( np.ndarray high not None , np.ndarray low not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_TRANGE( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRANGE( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TRANGE( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TRANGE", retCode)
     return outreal 
 
@@ -4978,16 +5102,20 @@ def stream_TRIMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TRIMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRIMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TRIMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TRIMA", retCode)
     return outreal 
 
@@ -5007,16 +5135,20 @@ def stream_TRIX( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TRIX( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TRIX( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TRIX( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TRIX", retCode)
     return outreal 
 
@@ -5036,16 +5168,20 @@ def stream_TSF( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_TSF( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TSF( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TSF( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TSF", retCode)
     return outreal 
 
@@ -5063,22 +5199,22 @@ def stream_TYPPRICE( np.ndarray high not None , np.ndarray low not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_TYPPRICE( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_TYPPRICE( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_TYPPRICE( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_TYPPRICE", retCode)
     return outreal 
 
@@ -5100,22 +5236,22 @@ def stream_ULTOSC( np.ndarray high not None , np.ndarray low not None , np.ndarr
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_ULTOSC( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_ULTOSC( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_ULTOSC( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod1 , timeperiod2 , timeperiod3 , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_ULTOSC", retCode)
     return outreal 
 
@@ -5136,16 +5272,20 @@ def stream_VAR( np.ndarray real not None , int timeperiod=-2**31 , double nbdev=
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_VAR( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_VAR( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_VAR( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , nbdev , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_VAR", retCode)
     return outreal 
 
@@ -5163,22 +5303,22 @@ def stream_WCLPRICE( np.ndarray high not None , np.ndarray low not None , np.nda
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_WCLPRICE( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WCLPRICE( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_WCLPRICE( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_WCLPRICE", retCode)
     return outreal 
 
@@ -5198,22 +5338,22 @@ def stream_WILLR( np.ndarray high not None , np.ndarray low not None , np.ndarra
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* high_data
-        double* low_data
-        double* close_data
         int outbegidx
         int outnbelement
         double outreal
-    high = check_array(high)
-    high_data = <double*>high.data
-    low = check_array(low)
-    low_data = <double*>low.data
-    close = check_array(close)
-    close_data = <double*>close.data
+    single = PyArray_TYPE(high) == np.NPY_FLOAT
+    high = check_array(high, single)
+    low = check_array(low, single)
+    close = check_array(close, single)
     length = check_length3(high, low, close)
     outreal = NaN
-    retCode = lib.TA_WILLR( <int>(length) - 1 , <int>(length) - 1 , high_data , low_data , close_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WILLR( <int>(length) - 1 , <int>(length) - 1 , <float *>(high.data) , <float *>(low.data) , <float *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_WILLR( <int>(length) - 1 , <int>(length) - 1 , <double *>(high.data) , <double *>(low.data) , <double *>(close.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_WILLR", retCode)
     return outreal 
 
@@ -5233,16 +5373,20 @@ def stream_WMA( np.ndarray real not None , int timeperiod=-2**31 ):
     """
     cdef:
         np.npy_intp length
+        bint single
         TA_RetCode retCode
-        double* real_data
         int outbegidx
         int outnbelement
         double outreal
-    real = check_array(real)
-    real_data = <double*>real.data
+    single = PyArray_TYPE(real) == np.NPY_FLOAT
+    real = check_array(real, single)
     length = real.shape[0]
     outreal = NaN
-    retCode = lib.TA_WMA( <int>(length) - 1 , <int>(length) - 1 , real_data , timeperiod , &outbegidx , &outnbelement , &outreal )
+    with nogil:
+        if single:
+            retCode = lib.TA_S_WMA( <int>(length) - 1 , <int>(length) - 1 , <float *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
+        else:
+            retCode = lib.TA_WMA( <int>(length) - 1 , <int>(length) - 1 , <double *>(real.data) , timeperiod , &outbegidx , &outnbelement , &outreal )
     _ta_check_success("TA_WMA", retCode)
     return outreal 
 
@@ -0,0 +1,363 @@
+from collections import deque
+from functools import wraps
+from itertools import chain
+import math
+
+import numpy as np
+
+from ._ta_lib import _ta_check_success, _ta_get_compatibility, _ta_get_unstable_period
+
+_BAD_PARAM = 2  # TA_BAD_PARAM
+_METASTOCK = 1  # TA_COMPATIBILITY_METASTOCK
+
+
+def _is_zero(value):
+    # TA_IS_ZERO from ta_utility.h
+    return -0.00000001 < value < 0.00000001
+
+
+class _EMA(object):
+    """
+    The TA_INT_EMA recursion, fed one value at a time. By default the seed is
+    the average of the first ``period`` values; with Metastock compatibility
+    it is the first value.
+    """
+
+    def __init__(self, period, k, metastock):
+        self.period = period
+        self.k = k
+        self.metastock = metastock
+        self.count = 0
+        self.total = 0.0
+        self.value = math.nan
+
+    def update(self, value):
+        self.count += 1
+        if self.metastock:
+            if self.count == 1:
+                self.value = value
+            else:
+                self.value = ((value - self.value) * self.k) + self.value
+        elif self.count <= self.period:
+            self.total += value
+            if self.count == self.period:
+                self.value = self.total / self.period
+        else:
+            self.value = ((value - self.value) * self.k) + self.value
+        return self.value
+
+
+class _SMA(object):
+    """
+    The TA_INT_SMA running total, fed one value at a time.
+    """
+
+    def __init__(self, period):
+        self.period = period
+        self.total = 0.0
+        self.window = deque()
+
+    def update(self, value):
+        self.window.append(value)
+        self.total += value
+        if len(self.window) < self.period:
+            return math.nan
+        result = self.total / self.period
+        self.total -= self.window.popleft()
+        return result
+
+
+def _check_sma(function_name, **matypes):
+    for name, matype in matypes.items():
+        if matype != 0:
+            raise Exception('stream.%s only supports %s=0 (SMA)' % (function_name, name))
+
+
+class StreamingIndicator(object):
+    """
+    Base class of the stateful streaming indicators.
+
+    An indicator is created with the same parameters as its function, primed
+    once with the history and then updated with every new value. Each update
+    takes constant time and memory, and returns the value the batch function
+    would return for the last element of the whole series, so the results
+    match the Function API exactly (including the unstable period and the
+    compatibility mode set when the indicator was created). Leading NaN's are
+    skipped like in the Function API.
+    """
+
+    function_name = None
+    nan_value = math.nan
+
+    def __init__(self, *args, **kwargs):
+        from . import abstract
+        function = abstract.Function(self.function_name, *args, **kwargs)
+        self.parameters = function.parameters
+        self.lookback = function.lookback
+        if self.lookback < 0:
+            # out of range parameters
+            _ta_check_success('TA_%s' % self.function_name, _BAD_PARAM)
+        self.input_names = function.input_names
+        self.output_names = function.output_names
+        self.metastock = _ta_get_compatibility() == _METASTOCK
+        self.index = -1
+        self.value = self.nan_value
+        self._setup(**self.parameters)
+
+    def _setup(self, **parameters):
+        raise NotImplementedError
+
+    def _update(self, *values):
+        raise NotImplementedError
+
+    def update(self, *values):
+        """
+        update(*values)
+
+        Adds the newest value of every input (e.g. ``high, low, close``) and
+        returns the latest output.
+        """
+        values = [float(value) for value in values]
+        if self.index < 0 and any(value != value for value in values):
+            return self.value
+        self.index += 1
+        result = self._update(*values)
+        if self.index >= self.lookback:
+            self.value = result
+        return self.value
+
+    def prime(self, *inputs):
+        """
+        prime(*inputs)
+
+        Feeds the history of every input, oldest first, and returns the
+        latest output.
+        """
+        inputs = [np.asarray(values, dtype=np.float64) for values in inputs]
+        for values in zip(*inputs):
+            self.update(*values)
+        return self.value
+
+    def __repr__(self):
+        return '%s(%s)' % (type(self).__name__, ', '.join(
+            '%s=%r' % item for item in self.parameters.items()))
+
+
+class SMA(StreamingIndicator):
+    function_name = 'SMA'
+
+    def _setup(self, timeperiod):
+        self._sma = _SMA(timeperiod)
+
+    def _update(self, real):
+        return self._sma.update(real)
+
+
+class EMA(StreamingIndicator):
+    function_name = 'EMA'
+
+    def _setup(self, timeperiod):
+        self._ema = _EMA(timeperiod, 2.0 / (timeperiod + 1), self.metastock)
+
+    def _update(self, real):
+        return self._ema.update(real)
+
+
+class RSI(StreamingIndicator):
+    function_name = 'RSI'
+
+    def _setup(self, timeperiod):
+        self.timeperiod = timeperiod
+        self._first_metastock = self.metastock and \
+            _ta_get_unstable_period('RSI') == 0
+        self._prev_value = math.nan
+        self._prev_gain = 0.0
+        self._prev_loss = 0.0
+
+    def _update(self, real):
+        period = self.timeperiod
+        change = real - self._prev_value
+        self._prev_value = real
+        if self.index == 0:
+            return math.nan
+
+        if self.index > period:
+            self._prev_loss *= (period - 1)
+            self._prev_gain *= (period - 1)
+        if change < 0:
+            self._prev_loss -= change
+        else:
+            self._prev_gain += change
+
+        if self.index < period:
+            if self._first_metastock and self.index == period - 1:
+                # Metastock's extra first output
+                loss = self._prev_loss / period
+                gain = self._prev_gain / period
+                total = gain + loss
+                return 100 * (gain / total) if not _is_zero(total) else 0.0
+            return math.nan
+
+        self._prev_loss /= period
+        self._prev_gain /= period
+        total = self._prev_gain + self._prev_loss
+        return 100.0 * (self._prev_gain / total) if not _is_zero(total) else 0.0
+
+
+class MACD(StreamingIndicator):
+    function_name = 'MACD'
+    nan_value = (math.nan, math.nan, math.nan)
+
+    def _setup(self, fastperiod, slowperiod, signalperiod):
+        if slowperiod < fastperiod:
+            fastperiod, slowperiod = slowperiod, fastperiod
+        # the fast EMA is seeded on the bars that seed the slow one, and the
+        # signal EMA on the first MACD values after the EMA unstable period
+        self._fast_start = 0 if self.metastock else slowperiod - fastperiod
+        self._macd_start = slowperiod - 1 + _ta_get_unstable_period('EMA')
+        self._slow = _EMA(slowperiod, 2.0 / (slowperiod + 1), self.metastock)
+        self._fast = _EMA(fastperiod, 2.0 / (fastperiod + 1), self.metastock)
+        self._signal = _EMA(signalperiod, 2.0 / (signalperiod + 1), self.metastock)
+
+    def _update(self, real):
+        self._slow.update(real)
+        if self.index >= self._fast_start:
+            self._fast.update(real)
+        if self.index < self._macd_start:
+            return self.nan_value
+        macd = self._fast.value - self._slow.value
+        signal = self._signal.update(macd)
+        return macd, signal, macd - signal
+
+
+class BBANDS(StreamingIndicator):
+    function_name = 'BBANDS'
+    nan_value = (math.nan, math.nan, math.nan)
+
+    def _setup(self, timeperiod, nbdevup, nbdevdn, matype):
+        _check_sma(self.function_name, matype=matype)
+        self.timeperiod = timeperiod
+        self.nbdevup = nbdevup
+        self.nbdevdn = nbdevdn
+        self._sma = _SMA(timeperiod)
+        self._squares = deque()
+        self._total2 = 0.0
+
+    def _update(self, real):
+        middle = self._sma.update(real)
+        # TA_INT_stddev_using_precalc_ma
+        self._squares.append(real * real)
+        self._total2 += real * real
+        if middle != middle:
+            return self.nan_value
+        mean2 = self._total2 / self.timeperiod
+        self._total2 -= self._squares.popleft()
+        mean2 -= middle * middle
+        stddev = math.sqrt(mean2) if not mean2 < 0.00000001 else 0.0
+        if self.nbdevup == self.nbdevdn:
+            if self.nbdevup != 1.0:
+                stddev = stddev * self.nbdevup
+            return middle + stddev, middle, middle - stddev
+        upper = middle + (stddev if self.nbdevup == 1.0 else stddev * self.nbdevup)
+        lower = middle - (stddev if self.nbdevdn == 1.0 else stddev * self.nbdevdn)
+        return upper, middle, lower
+
+
+class STOCH(StreamingIndicator):
+    function_name = 'STOCH'
+    nan_value = (math.nan, math.nan)
+
+    def _setup(self, fastk_period, slowk_period, slowk_matype, slowd_period, slowd_matype):
+        _check_sma(self.function_name, slowk_matype=slowk_matype, slowd_matype=slowd_matype)
+        self._highs = deque(maxlen=fastk_period)
+        self._lows = deque(maxlen=fastk_period)
+        self._slowk = _SMA(slowk_period)
+        self._slowd = _SMA(slowd_period)
+
+    def _update(self, high, low, close):
+        self._highs.append(high)
+        self._lows.append(low)
+        if len(self._highs) < self._highs.maxlen:
+            return self.nan_value
+        highest = max(self._highs)
+        lowest = min(self._lows)
+        diff = (highest - lowest) / 100.0
+        fastk = (close - lowest) / diff if diff != 0.0 else 0.0
+        slowk = self._slowk.update(fastk)
+        if slowk != slowk:
+            return self.nan_value
+        slowd = self._slowd.update(slowk)
+        if slowd != slowd:
+            return self.nan_value
+        return slowk, slowd
+
+
+class ATR(StreamingIndicator):
+    function_name = 'ATR'
+
+    def _setup(self, timeperiod):
+        self.timeperiod = timeperiod
+        self._prev_close = math.nan
+        self._total = 0.0
+        self._atr = math.nan
+
+    def _update(self, high, low, close):
+        prev_close = self._prev_close
+        self._prev_close = close
+        if self.index == 0:
+            return math.nan
+
+        # TRANGE
+        true_range = high - low
+        value = abs(prev_close - high)
+        if value > true_range:
+            true_range = value
+        value = abs(prev_close - low)
+        if value > true_range:
+            true_range = value
+
+        period = self.timeperiod
+        if period <= 1:
+            return true_range
+        if self.index <= period:
+            self._total += true_range
+            if self.index == period:
+                self._atr = self._total / period
+            return self._atr
+        self._atr *= period - 1
+        self._atr += true_range
+        self._atr /= period
+        return self._atr
+
+
+class OBV(StreamingIndicator):
+    function_name = 'OBV'
+
+    def _setup(self):
+        self._prev_real = math.nan
+        self._obv = math.nan
+
+    def _update(self, real, volume):
+        if self.index == 0:
+            self._obv = volume
+        elif real > self._prev_real:
+            self._obv += volume
+        elif real < self._prev_real:
+            self._obv -= volume
+        self._prev_real = real
+        return self._obv
+
+
+INDICATORS = dict((cls.function_name, cls) for cls in
+                  (SMA, EMA, RSI, MACD, BBANDS, STOCH, ATR, OBV))
+
+
+def _streaming(func, indicator):
+    # called with input arrays, return the last value like before; called
+    # with parameters only, return a stateful indicator to update tick by tick
+    @wraps(func)
+    def stream(*args, **kwargs):
+        if any(hasattr(value, '__len__') for value in chain(args, kwargs.values())):
+            return func(*args, **kwargs)
+        return indicator(*args, **kwargs)
+    return stream
@@ -0,0 +1,61 @@
+from itertools import product
+
+import numpy as np
+
+from ._ta_lib import _ta_sweep, _to_float_array, __TA_FUNCTION_NAMES__
+
+
+def sweep(function, *inputs, **parameters):
+    """
+    sweep(function, *inputs, **parameters)
+
+    Computes one function over a grid of parameters in a single call.
+    ``function`` is a function name (e.g. ``'RSI'``) or a talib function, and
+    ``inputs`` are its input arrays like in the Function API. Every parameter
+    is either one value or a list (or range) of values to sweep, e.g.
+    ``sweep('BBANDS', close, timeperiod=range(5, 50), nbdevup=[1.5, 2.0])``.
+    The inputs are checked and scanned for leading NaN's once, and every
+    combination is computed natively.
+
+    Returns a (n_combinations, length) matrix, or a tuple of them for
+    functions with several outputs. Row ``i`` holds the outputs for the
+    ``i``-th combination of ``itertools.product`` over the values of every
+    parameter, in the function's parameter order (see
+    ``abstract.Function(name).parameters``).
+    """
+    from . import abstract
+    name = getattr(function, '__name__', function).upper()
+    if name not in __TA_FUNCTION_NAMES__:
+        raise Exception('%s not supported by TA-LIB.' % name)
+    info = abstract.Function(name).info
+
+    # the abstract interface only takes float64 inputs
+    inputs = [_to_float_array(value) for value in inputs]
+    inputs = [value.astype(np.float64) if getattr(value, 'dtype', None) == np.float32 else value
+              for value in inputs]
+
+    # one tuple of arrays per input of the function
+    input_arrays = []
+    count = sum(len(names) if isinstance(names, list) else 1
+                for names in info['input_names'].values())
+    if len(inputs) != count:
+        raise TypeError('%s() takes %d input arrays (%d given)' % (
+            name, count, len(inputs)))
+    for names in info['input_names'].values():
+        count = len(names) if isinstance(names, list) else 1
+        input_arrays.append(tuple(inputs[:count]))
+        inputs = inputs[count:]
+
+    defaults = info['parameters']
+    for key in parameters:
+        if key not in defaults:
+            raise TypeError('%s() got an unexpected keyword argument %r' % (name, key))
+    grid = []
+    for key, default in defaults.items():
+        values = parameters.get(key, default)
+        if isinstance(values, (str, bytes)) or not hasattr(values, '__iter__'):
+            values = [values]
+        grid.append(values)
+
+    outputs = _ta_sweep(name, input_arrays, list(product(*grid)))
+    return outputs[0] if len(outputs) == 1 else outputs
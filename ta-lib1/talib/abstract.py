@@ -1,27 +1,33 @@
 import talib._ta_lib as _ta_lib
+from . import func as _func
 from ._ta_lib import Function as _Function, __TA_FUNCTION_NAMES__, _get_defaults_and_docs
 
 # add some backwards compat for backtrader
 from ._ta_lib import TA_FUNC_FLAGS, TA_INPUT_FLAGS, TA_OUTPUT_FLAGS
 
-_func_obj_mapping = {
-    func_name: getattr(_ta_lib, func_name)
-    for func_name in __TA_FUNCTION_NAMES__
-}
+_FUNCTION_NAMES = frozenset(__TA_FUNCTION_NAMES__)
 
 
 def Function(function_name, *args, **kwargs):
     func_name = function_name.upper()
-    if func_name not in _func_obj_mapping:
+    if func_name not in _FUNCTION_NAMES:
         raise Exception('%s not supported by TA-LIB.' % func_name)
 
     return _Function(
-        func_name, _func_obj_mapping[func_name], *args, **kwargs
+        func_name, getattr(_func, func_name), *args, **kwargs
     )
 
 
-for func_name in __TA_FUNCTION_NAMES__:
-    globals()[func_name] = Function(func_name)
+def __getattr__(name):
+    # the Function objects are created on first use
+    if name not in _FUNCTION_NAMES:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = function = Function(name)
+    return function
+
+
+def __dir__():
+    return sorted(set(globals()) | _FUNCTION_NAMES)
 
 
 __all__ = ["Function", "_get_defaults_and_docs"] + __TA_FUNCTION_NAMES__
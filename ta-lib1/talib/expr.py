@@ -0,0 +1,151 @@
+import numpy as np
+import polars as pl
+
+from . import _TAIL_FULL_HISTORY, _TAIL_INDEX_OUTPUTS, _recursive, abstract, func
+from ._ta_lib import (
+    __TA_FUNCTION_NAMES__, _ta_getOutputParameterInfo, _ta_lookback, _ta_parameters, _to_float_array,
+    str2bytes)
+
+_OUTPUT_INTEGER = 1  # TA_Output_Integer
+
+
+@pl.api.register_expr_namespace('ta')
+class TAExpr(object):
+    """
+    The talib functions as polars expressions, one lowercase method per
+    function, registered as the ``ta`` namespace when this module is
+    imported::
+
+        import talib.expr
+
+        df.with_columns(
+            pl.col('close').ta.rsi(14).over('symbol'),
+            pl.col('high').ta.atr('low', 'close', timeperiod=14).over('symbol'),
+        )
+
+    The expression is the first input of the function; the other inputs
+    follow as expressions or column names, then the parameters. Functions
+    with several outputs return a struct with one field per output.
+
+    ``by`` names the column (or expression) of the groups of a long-format
+    table, so every symbol gets its own lookback and leading NaN's::
+
+        df.with_columns(pl.col('close').ta.rsi(14, by='symbol'))
+
+    The whole column then goes through one callback instead of one per
+    group. Functions over a fixed window (SMA, BBANDS, STOCH, ...) are
+    computed in one call over all the rows, with the first lookback values
+    of every group masked; their results match per group calls up to
+    rounding. Recursive functions (EMA, RSI, MACD, ...), running totals and
+    inputs with NaN's still get one call per group, on slices of the column
+    written into one output. The groups need not be contiguous.
+
+    Without ``by`` the function runs once per group in ``group_by`` and
+    ``over`` contexts, one Python callback each, and once over the whole
+    column otherwise.
+    """
+
+    def __init__(self, expr):
+        self._expr = expr
+
+
+def _method(func_name):
+    function = getattr(func, func_name)
+    info = abstract.Function(func_name).info
+    n_inputs = sum(len(names) if isinstance(names, list) else 1
+                   for names in info['input_names'].values())
+    outputs = [_ta_getOutputParameterInfo(str2bytes(func_name), i)
+               for i in range(len(info['output_names']))]
+    dtypes = [pl.Int32 if output['type'] == _OUTPUT_INTEGER else pl.Float64
+              for output in outputs]
+    if len(outputs) == 1:
+        return_dtype = dtypes[0]
+    else:
+        return_dtype = pl.Struct([pl.Field(output['name'], dtype)
+                                  for output, dtype in zip(outputs, dtypes)])
+
+    def call(arrays, parameters, kwargs):
+        return function(*arrays, *parameters, **kwargs)
+
+    def to_polars(results):
+        if len(outputs) == 1:
+            return pl.Series(results, dtype=return_dtype)
+        return pl.DataFrame(dict((output['name'], pl.Series(result, dtype=dtype))
+                                 for output, dtype, result in zip(outputs, dtypes, results))
+                            ).to_struct()
+
+    def call_groups(series, parameters, kwargs):
+        *series, key = series
+        arrays = [np.asarray(_to_float_array(s), dtype=np.float64) for s in series]
+        length = len(key)
+        if not length:
+            return to_polars(call(arrays, parameters, kwargs))
+        groups = key.rle_id().to_numpy()
+        order = None
+        if groups[-1] + 1 != key.n_unique():
+            # the groups are not contiguous: compute on the rows sorted by
+            # group (nulls are a group of their own)
+            groups = key.rank('dense').fill_null(0).to_numpy()
+            order = np.argsort(groups, kind='stable')
+            arrays = [a[order] for a in arrays]
+            groups = groups[order]
+        starts = np.flatnonzero(np.diff(groups, prepend=groups[0] - 1))
+        stops = np.append(starts[1:], length)
+
+        options = dict((k, v) for k, v in kwargs.items() if not isinstance(v, np.ndarray))
+        values, unstable = _ta_parameters(func_name, tuple(parameters), options)
+        if _recursive(func_name, values, unstable) or func_name in _TAIL_FULL_HISTORY \
+                or any(np.isnan(a).any() for a in arrays):
+            # the outputs depend on the rows before the group (or a NaN would
+            # propagate into the next groups): one call per group, on slices
+            results = [np.full(length, np.nan) if dtype == pl.Float64 else np.zeros(length, dtype=np.int32)
+                       for dtype in dtypes]
+            for start, stop in zip(starts, stops):
+                out = tuple(result[start:stop] for result in results)
+                call([a[start:stop] for a in arrays], parameters,
+                     dict(kwargs, out=out if len(outputs) > 1 else out[0]))
+        else:
+            # one call over every group: only the first lookback outputs of a
+            # group see the rows of the one before, so those are masked
+            results = call(arrays, parameters, kwargs)
+            results = list(results) if len(outputs) > 1 else [results]
+            first = np.repeat(starts, stops - starts)
+            masked = np.arange(length) - first < _ta_lookback(func_name, tuple(parameters), options)
+            for result in results:
+                if func_name in _TAIL_INDEX_OUTPUTS:
+                    # positions in the group, as with one call per group
+                    result -= first.astype(result.dtype)
+                result[masked] = np.nan if result.dtype.kind == 'f' else 0
+
+        if order is not None:
+            for i, result in enumerate(results):
+                results[i] = np.empty_like(result)
+                results[i][order] = result
+        return to_polars(results if len(outputs) > 1 else results[0])
+
+    def method(self, *args, **kwargs):
+        by = kwargs.pop('by', None)
+        inputs = [self._expr] + [pl.col(arg) if isinstance(arg, str) else arg
+                                 for arg in args[:n_inputs - 1]]
+        if len(inputs) < n_inputs:
+            raise TypeError('%s() takes %d inputs (%d given)' % (
+                func_name, n_inputs, len(inputs)))
+        parameters = args[n_inputs - 1:]
+
+        if by is not None:
+            inputs.append(pl.col(by) if isinstance(by, str) else by)
+            return pl.map_batches(inputs, lambda series: call_groups(series, parameters, kwargs),
+                                  return_dtype=return_dtype)
+
+        def call_series(series):
+            return to_polars(call([_to_float_array(s) for s in series], parameters, kwargs))
+
+        return pl.map_groups(inputs, call_series, return_dtype=return_dtype)
+
+    method.__name__ = func_name.lower()
+    method.__doc__ = function.__doc__
+    return method
+
+
+for func_name in __TA_FUNCTION_NAMES__:
+    setattr(TAExpr, func_name.lower(), _method(func_name))
@@ -0,0 +1,25 @@
+import talib._ta_lib as _ta_lib
+from ._ta_lib import __TA_FUNCTION_NAMES__
+
+_FUNCTION_NAMES = frozenset(__TA_FUNCTION_NAMES__)
+
+
+def __getattr__(name):
+    # wrap the functions for 2-D, polars or pandas support on first use
+    if name in _FUNCTION_NAMES:
+        from . import _wrapper
+        value = _wrapper(getattr(_ta_lib, name))
+    else:
+        try:
+            value = getattr(_ta_lib, name)
+        except AttributeError:
+            raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _FUNCTION_NAMES)
+
+
+__all__ = list(__TA_FUNCTION_NAMES__)
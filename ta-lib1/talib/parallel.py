@@ -0,0 +1,57 @@
+import os
+import threading
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            # imported on first use, it isn't needed to import talib
+            from concurrent.futures import ThreadPoolExecutor
+            _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                           thread_name_prefix='talib')
+        return _executor
+
+
+def _resolve(function):
+    if callable(function):
+        return function
+    import talib
+    func_name = function.upper()
+    if func_name not in talib.__TA_FUNCTION_NAMES__:
+        raise Exception('%s not supported by TA-LIB.' % func_name)
+    return getattr(talib, func_name)
+
+
+def batch(function, inputs, max_workers=None, **kwargs):
+    """
+    Run one TA-Lib function over many independent inputs on a thread pool.
+
+    The TA-Lib C functions run without holding the GIL, so the calls proceed
+    in parallel on multiple cores. ``function`` is a function name (e.g.
+    ``'RSI'``) or a talib function, and every item of ``inputs`` is either a
+    single array, a tuple of positional arrays (e.g. ``(high, low, close)``)
+    or a dict of keyword arrays. ``kwargs`` are passed to every call.
+
+    Returns a list with one result per input, in input order. By default a
+    shared pool with one thread per CPU is used; ``max_workers`` runs the
+    batch on a dedicated pool of that size instead.
+    """
+    func = _resolve(function)
+
+    def call(item):
+        if isinstance(item, tuple):
+            return func(*item, **kwargs)
+        if isinstance(item, dict):
+            return func(**dict(item, **kwargs))
+        return func(item, **kwargs)
+
+    if max_workers is None:
+        return list(_get_executor().map(call, inputs))
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers,
+                            thread_name_prefix='talib') as executor:
+        return list(executor.map(call, inputs))
@@ -1,6 +1,22 @@
 import talib._ta_lib as _ta_lib
 from ._ta_lib import __TA_FUNCTION_NAMES__
+from ._streaming import INDICATORS, StreamingIndicator, _streaming
 
+_FUNCTION_NAMES = frozenset(__TA_FUNCTION_NAMES__)
 
-for func_name in __TA_FUNCTION_NAMES__:
-    globals()[func_name] = getattr(_ta_lib, "stream_%s" % func_name)
+
+def __getattr__(name):
+    # wrap the functions for 2-D, polars or pandas support on first use
+    if name not in _FUNCTION_NAMES:
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
+    from . import _wrapper
+    function = getattr(_ta_lib, "stream_%s" % name)
+    # stateful indicators, e.g. RSI(timeperiod=14).update(value)
+    if name in INDICATORS:
+        function = _streaming(function, INDICATORS[name])
+    globals()[name] = function = _wrapper(function)
+    return function
+
+
+def __dir__():
+    return sorted(set(globals()) | _FUNCTION_NAMES)
@@ -367,3 +367,59 @@ def test_threading():
     print('%.6f' % ((t1 - t0) / LOOPS))
 
     assert total == THREADS * LOOPS
+
+
+def test_2d_input_arrays():
+    rng = np.random.default_rng(0)
+    close = rng.random((3, 50))
+    close[0, :5] = np.nan
+    output = abstract.Function('sma')({'close': close}, timeperiod=10)
+    assert output.shape == (3, 50)
+    for row, expected in zip(output, close):
+        assert_array_equal(row, func.SMA(expected, timeperiod=10))
+
+    slowk, slowd = abstract.STOCH({'high': close + 1, 'low': close - 1, 'close': close})
+    assert slowk.shape == slowd.shape == (3, 50)
+    assert_array_equal(slowd[2], func.STOCH(close[2] + 1, close[2] - 1, close[2])[1])
+
+
+def test_parameters_bound_for_threads():
+    close = np.random.rand(100)
+    sma = abstract.Function('SMA', timeperiod=5)
+    sma.input_names = {'price': 'open'}
+
+    # arguments given when creating the Function apply in every thread,
+    # later changes only in the thread that made them
+    results = []
+    def worker():
+        results.append((sma.parameters, sma.input_names, sma({'close': close})))
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    parameters, input_names, output = results[0]
+    assert parameters == OrderedDict([('timeperiod', 5)])
+    assert input_names == OrderedDict([('price', 'close')])
+    assert_array_equal(output, func.SMA(close, timeperiod=5))
+
+    # call arguments are not kept
+    assert_array_equal(sma({'open': close}, timeperiod=7), func.SMA(close, 7))
+    assert sma.parameters == OrderedDict([('timeperiod', 5)])
+    assert sma.input_names == OrderedDict([('price', 'open')])
+
+    # the shared metadata can't be changed through a Function
+    sma.info['output_flags']['real'].append('changed')
+    sma.input_names['price'] = 'high'
+    assert abstract.Function('SMA').info['output_flags']['real'] == ['Line']
+    assert abstract.Function('SMA').input_names['price'] == 'close'
+
+
+def test_tail():
+    close = np.random.rand(100)
+    sma = abstract.Function('SMA', timeperiod=5)
+    assert_array_equal(sma({'close': close}, tail=3), func.SMA(close, 5, tail=3))
+    assert_array_equal(sma(close, 10, tail=3), func.SMA(close, 10, tail=3))
+    # the outputs aren't replaced by the tail
+    assert len(sma.outputs) == 100
+
+    macd, signal, hist = abstract.MACD({'close': close}, tail=2)
+    assert len(macd) == len(signal) == len(hist) == 2
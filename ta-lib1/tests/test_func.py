@@ -195,3 +195,294 @@ def test_MAXINDEX():
     d = np.array([1., 2, 3])
     e = func.MAXINDEX(d, 10)
     assert_array_equal(e, [0,0,0])
+
+
+def test_batch():
+    rng = np.random.default_rng(0)
+    closes = [rng.random(50 + 10 * i) for i in range(20)]
+    results = talib.batch('RSI', closes, timeperiod=10)
+    assert len(results) == len(closes)
+    for close, result in zip(closes, results):
+        assert_array_equal(result, func.RSI(close, timeperiod=10))
+
+    bars = [(close + 1, close - 1, close) for close in closes]
+    results = talib.batch(func.STOCH, bars, max_workers=3)
+    for (high, low, close), (slowk, slowd) in zip(bars, results):
+        expected_k, expected_d = func.STOCH(high, low, close)
+        assert_array_equal(slowk, expected_k)
+        assert_array_equal(slowd, expected_d)
+
+    results = talib.batch('SMA', [{'real': close} for close in closes], timeperiod=5)
+    assert_array_equal(results[3], func.SMA(closes[3], timeperiod=5))
+
+    with pytest.raises(Exception):
+        talib.batch('NOT_A_FUNCTION', closes)
+
+
+def test_sweep():
+    rng = np.random.default_rng(0)
+    close = rng.random(200)
+    close[:3] = np.nan
+    high, low = close + 1, close - 1
+
+    result = talib.sweep('RSI', close, timeperiod=range(2, 30))
+    assert result.shape == (28, 200)
+    for row, timeperiod in zip(result, range(2, 30)):
+        assert_array_equal(row, func.RSI(close, timeperiod=timeperiod))
+
+    # rows follow the product of the swept values in parameter order
+    upper, middle, lower = talib.sweep(func.BBANDS, close, nbdevup=[1.5, 2.0], timeperiod=[5, 20])
+    assert upper.shape == (4, 200)
+    assert_array_equal(upper[1], func.BBANDS(close, timeperiod=5, nbdevup=2.0)[0])
+    assert_array_equal(lower[2], func.BBANDS(close, timeperiod=20, nbdevup=1.5)[2])
+
+    result = talib.sweep('ATR', high, low, close, timeperiod=[5, 6])
+    assert_array_equal(result[1], func.ATR(high, low, close, timeperiod=6))
+
+    result = talib.sweep('CDLDOJI', close, high, low, close)
+    assert result.dtype == np.int32
+    assert_array_equal(result[0], func.CDLDOJI(close, high, low, close))
+
+    with pytest.raises(TypeError):
+        talib.sweep('RSI', close, period=[5])
+    with pytest.raises(TypeError):
+        talib.sweep('ATR', close, timeperiod=[5])
+    with pytest.raises(Exception):
+        talib.sweep('RSI', close, timeperiod=[1])
+
+
+def test_scan_patterns():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 500))
+    open = close + rng.normal(0, 1, 500)
+    high = np.maximum(open, close) + rng.random(500)
+    low = np.minimum(open, close) - rng.random(500)
+    open[:4] = np.nan
+    patterns = talib.get_function_groups()['Pattern Recognition']
+    assert len(patterns) == 61
+
+    expected = []
+    results = {name: getattr(func, name)(open, high, low, close) for name in patterns}
+    for bar in range(500):
+        for name in patterns:
+            if results[name][bar]:
+                expected.append((0, bar, name, 1 if results[name][bar] > 0 else -1))
+    assert talib.scan_patterns(open, high, low, close) == expected
+
+    bits = talib.scan_patterns(open, high, low, close, patterns=['CDLDOJI', func.CDLENGULFING], bitset=True)
+    assert bits.shape == (2, 2, 63) and bits.dtype == np.uint8
+    engulfing = func.CDLENGULFING(open, high, low, close)
+    assert_array_equal(np.unpackbits(bits[0, 1], count=500, bitorder='little'), engulfing > 0)
+    assert_array_equal(np.unpackbits(bits[1, 1], count=500, bitorder='little'), engulfing < 0)
+
+    # many series of different lengths, with their symbols and timestamps
+    series = [(open[:n], high[:n], low[:n], close[:n]) for n in (500, 100, 3)]
+    hits = talib.scan_patterns(*zip(*series), patterns=['CDLENGULFING'], symbols=['A', 'B', 'C'],
+                               index=[np.arange(n) * 10 for n in (500, 100, 3)])
+    for symbol, n in (('A', 500), ('B', 100), ('C', 3)):
+        bars = np.flatnonzero(engulfing[:n])
+        assert [hit[1:] for hit in hits if hit[0] == symbol] == [
+            (bar * 10, 'CDLENGULFING', 1 if engulfing[bar] > 0 else -1) for bar in bars]
+
+    with pytest.raises(Exception):
+        talib.scan_patterns(open, high, low, close, patterns=['RSI'])
+    with pytest.raises(Exception):
+        talib.scan_patterns(open, high, low, close[:10])
+
+
+def test_2d_input():
+    rng = np.random.default_rng(0)
+    a = rng.random((4, 40))
+    a[1, :7] = np.nan
+    a[2, :] = np.nan
+    result = func.RSI(a, timeperiod=10)
+    assert result.shape == (4, 40)
+    for row, expected in zip(result, a):
+        assert_array_equal(row, func.RSI(expected, timeperiod=10))
+    assert np.isnan(result[1, :17]).all() and not np.isnan(result[1, 17:]).any()
+
+    macd, signal, hist = func.MACD(a)
+    for i in range(4):
+        assert_array_equal(hist[i], func.MACD(a[i])[2])
+
+    result = func.CDLDOJI(a, a + 1, a - 1, a)
+    assert result.shape == (4, 40)
+    assert result.dtype == np.int32
+
+    # 1-D inputs are shared by every row
+    periods = np.full(40, 3.0)
+    result = func.MAVP(a, periods, minperiod=2, maxperiod=4)
+    assert_array_equal(result[0], func.MAVP(a[0], periods, minperiod=2, maxperiod=4))
+
+    with pytest.raises(Exception):
+        func.ATR(a, a[:3], a)
+
+    result = func.SMA(np.empty((0, 40)))
+    assert result.shape == (0, 40)
+
+
+def test_out():
+    rng = np.random.default_rng(0)
+    a = rng.random(50)
+    a[:3] = np.nan
+
+    out = np.ones(50)
+    result = func.SMA(a, timeperiod=5, out=out)
+    assert result is out
+    assert_array_equal(out, func.SMA(a, timeperiod=5))
+    assert np.isnan(out[:7]).all()
+
+    outs = (np.empty(50), np.empty(50), np.empty(50))
+    result = func.MACD(a, out=outs)
+    assert all(r is o for r, o in zip(result, outs))
+    for r, expected in zip(result, func.MACD(a)):
+        assert_array_equal(r, expected)
+
+    out = np.full(50, 7, dtype=np.int32)
+    result = func.CDLDOJI(a, a + 1, a - 1, a, out=out)
+    assert result is out
+    assert_array_equal(out, func.CDLDOJI(a, a + 1, a - 1, a))
+
+    out = np.empty((3, 50))
+    b = np.tile(a, (3, 1))
+    assert func.RSI(b, out=out) is out
+    assert_array_equal(out[2], func.RSI(a))
+
+    with pytest.raises(Exception):
+        func.SMA(a, out=np.empty(50, dtype=np.float32))
+    with pytest.raises(Exception):
+        func.SMA(a, out=np.empty(49))
+    with pytest.raises(Exception):
+        func.SMA(a, out=np.empty(100)[::2])
+    with pytest.raises(Exception):
+        func.MACD(a, out=np.empty(50))
+    with pytest.raises(Exception):
+        func.MACD(a, out=(np.empty(50), np.empty(50)))
+    with pytest.raises(Exception):
+        func.SMA(a, out=a)
+
+    # out arrays sharing memory are rejected
+    x = np.empty(50)
+    with pytest.raises(Exception):
+        func.MACD(a, out=(x, x, x))
+    buffer = np.empty(120)
+    with pytest.raises(Exception):
+        func.MACD(a, out=(buffer[:50], buffer[40:90], np.empty(50)))
+    # and none is written to when one of them is invalid
+    first = np.full(50, 7.0)
+    with pytest.raises(Exception):
+        func.MACD(a, out=(first, np.empty(50), np.empty(50, dtype=np.float32)))
+    assert (first == 7.0).all()
+
+
+# Modules talib must not import until they are used
+LAZY_MODULES = ['pandas', 'polars', 'talib.abstract', 'talib.expr', 'concurrent.futures']
+
+
+def test_lazy_import():
+    import subprocess
+    import sys
+    code = '\n'.join([
+        'import sys',
+        'import numpy',
+        'import talib',
+        'print(sorted(set(%r) & set(sys.modules)))' % LAZY_MODULES,
+        'talib.SMA',
+        'print(sorted(set(%r) & set(sys.modules)))' % LAZY_MODULES,
+        'import talib.abstract',
+        'print(talib.SMA is talib.func.SMA, talib.abstract.SMA.lookback)',
+    ])
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    imported, used, lazy = output.splitlines()
+    assert imported == '[]'
+    # wrapping a function on first use does not import them either
+    assert used == '[]'
+    assert lazy == 'True 29'
+
+
+def test_tail():
+    rng = np.random.default_rng(0)
+    close = np.cumsum(rng.standard_normal(1000)) + 100
+    high, low = close + 1, close - 1
+
+    result = func.SMA(close, 30, tail=5)
+    assert result.shape == (5,)
+    assert_array_almost_equal(result, func.SMA(close, 30)[-5:])
+    upper, middle, lower = func.BBANDS(close, timeperiod=20, tail=3)
+    assert_array_almost_equal(lower, func.BBANDS(close, timeperiod=20)[2][-3:])
+    assert_array_equal(func.MAX(np.vstack([close, high]), 5, tail=2),
+                       np.vstack([func.MAX(close, 5)[-2:], func.MAX(high, 5)[-2:]]))
+
+    # shorter series, all of them is returned
+    assert_array_equal(func.SMA(close[:10], 5, tail=20), func.SMA(close[:10], 5))
+
+    # recursive functions get a warm-up, with the default (zero) unstable periods
+    for name in ['EMA', 'RSI', 'KAMA', 'MACD', 'MACDFIX', 'TRIX', 'HT_TRENDLINE']:
+        full = getattr(func, name)(close)
+        result = getattr(func, name)(close, tail=5)
+        for a, b in zip(full if isinstance(full, tuple) else [full], result if isinstance(result, tuple) else [result]):
+            assert_array_almost_equal(b, a[-5:], decimal=9)
+    for name in ['ATR', 'ADX', 'PLUS_DI']:
+        assert_array_almost_equal(getattr(func, name)(high, low, close, tail=5),
+                                  getattr(func, name)(high, low, close)[-5:], decimal=9)
+    assert_array_almost_equal(func.MA(close, 10, matype=talib.MA_Type.EMA, tail=3),
+                              func.MA(close, 10, matype=talib.MA_Type.EMA)[-3:], decimal=9)
+    # running totals and trend states are computed over the whole history,
+    # positions are in the whole input
+    volume = rng.random(1000) * 100
+    assert_array_equal(func.SAR(high, low, tail=3), func.SAR(high, low)[-3:])
+    assert_array_equal(func.OBV(close, volume, tail=3), func.OBV(close, volume)[-3:])
+    assert_array_equal(func.MAXINDEX(close, 10, tail=3), func.MAXINDEX(close, 10)[-3:])
+
+    with pytest.raises(Exception):
+        func.SMA(close, tail=2, out=np.empty(2))
+
+
+def test_float32():
+    rng = np.random.default_rng(0)
+    close = (np.cumsum(rng.standard_normal(200)) + 100).astype(np.float32)
+    high, low = close + 1, close - 1
+    close64, high64, low64 = [a.astype(np.float64) for a in (close, high, low)]
+
+    # float32 inputs are computed by the TA_S_* functions, in double precision
+    result = func.ATR(high, low, close)
+    assert result.dtype == np.float64
+    assert_array_equal(result, func.ATR(high64, low64, close64))
+    macd, signal, hist = func.MACD(close)
+    assert_array_equal(signal, func.MACD(close64)[1])
+    assert_array_equal(func.CDLDOJI(close, high, low, close),
+                       func.CDLDOJI(close64, high64, low64, close64))
+
+    # the output precision is selectable
+    assert func.RSI(close, dtype=np.float32).dtype == np.float32
+    assert func.RSI(close64, dtype=np.float32).dtype == np.float32
+    assert func.MAXINDEX(close, dtype=np.float32).dtype == np.int32
+
+    with pytest.raises(Exception):
+        func.ATR(high, low64, close)
+    with pytest.raises(Exception):
+        func.RSI(close, dtype=np.int32)
+
+
+def test_segmented():
+    close = np.arange(1.0, 21.0)
+    close[[0, 7, 8, 15]] = np.nan
+
+    # gaps are propagated to the end by default
+    assert np.isnan(func.SMA(close, 3)[7:]).all()
+
+    # each run of values warms up like a new series
+    result = func.SMA(close, 3, segmented=True)
+    expected = np.full(20, np.nan)
+    for start, stop in ((1, 7), (9, 15), (16, 20)):
+        expected[start:stop] = func.SMA(close[start:stop], 3)
+    assert_array_equal(result, expected)
+
+    macd, signal, hist = func.MACD(close, 2, 3, 2, segmented=True)
+    assert_array_equal(signal[9:15], func.MACD(close[9:15], 2, 3, 2)[1])
+    result = func.CDLDOJI(close, close + 1, close - 1, close, segmented=True)
+    assert result.dtype == np.int32
+    assert_array_equal(func.SMA(np.vstack([close, close]), 3, segmented=True)[1], expected)
+
+    # no gaps, same as usual
+    assert_array_equal(func.SMA(close[1:7], 3, segmented=True), func.SMA(close[1:7], 3))
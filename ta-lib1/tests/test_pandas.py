@@ -1,6 +1,7 @@
 import numpy as np
 from numpy.testing import assert_array_equal
 import pandas as pd
+import pytest
 
 import talib
 
@@ -49,3 +50,80 @@ def test_MAVP():
     assert_array_equal(sma3.index, range(10, 20))
     assert_array_equal(result.values[2::2], sma2.values[2::2])
     assert_array_equal(result.values[3::2], sma3.values[3::2])
+
+
+def test_dataframe_input():
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2024-01-01', periods=30)
+    close = pd.DataFrame(rng.random((30, 3)), index=index, columns=['a', 'b', 'c'])
+    result = talib.SMA(close, timeperiod=5)
+    assert isinstance(result, pd.DataFrame)
+    assert_array_equal(result.index, index)
+    assert_array_equal(result.columns, ['a', 'b', 'c'])
+    for column in close.columns:
+        assert_array_equal(result[column].values, talib.SMA(close[column].values, timeperiod=5))
+
+    slowk, slowd = talib.STOCH(close + 1, close - 1, close)
+    assert isinstance(slowk, pd.DataFrame)
+    assert_array_equal(slowd['b'].values, talib.STOCH(close['b'].values + 1, close['b'].values - 1, close['b'].values)[1])
+
+
+def test_zero_copy_input():
+    values = np.random.random(100)
+    series = pd.Series(values)
+    assert np.shares_memory(talib._to_numpy(series), values)
+    assert_array_equal(talib.SMA(series).values, talib.SMA(values))
+
+    # nullable and integer columns are converted, with NaN for missing values
+    nullable = pd.Series([1.0, None, 3.0, 4.0], dtype='Float64')
+    assert_array_equal(talib._to_numpy(nullable), [1.0, np.nan, 3.0, 4.0])
+    result = talib.MOM(pd.Series([1, 2, 4, 8]), timeperiod=1)
+    assert_array_equal(result.values, [np.nan, 1, 2, 4])
+
+    # float32 data stays float32, for the single precision functions
+    single = pd.Series(values.astype(np.float32))
+    assert talib._to_numpy(single).dtype == np.float32
+    assert np.shares_memory(talib._to_numpy(single), single.values)
+    assert_array_equal(talib.SMA(single).values, talib.SMA(values.astype(np.float32).astype(np.float64)))
+
+
+def test_arrow_input():
+    pa = pytest.importorskip('pyarrow')
+    values = np.random.random(100)
+    series = pd.Series(pa.array(values), dtype=pd.ArrowDtype(pa.float64()))
+    buffer = series.array._pa_array.chunk(0).buffers()[1]
+    assert talib._to_numpy(series).__array_interface__['data'][0] == buffer.address
+    result = talib.SMA(series)
+    assert isinstance(result, pd.Series)
+    assert_array_equal(result.values, talib.SMA(values))
+
+    frame = pd.DataFrame({'a': values, 'b': values[::-1].copy()})
+    assert np.shares_memory(talib._to_numpy(frame), frame['a'].to_numpy())
+
+
+def test_scan_patterns():
+    rng = np.random.default_rng(0)
+    index = pd.date_range('2024-01-01', periods=300, freq='h')
+    close = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, (300, 2)), axis=0), index=index, columns=['EURUSD', 'GBPUSD'])
+    open = close.shift(1).fillna(close)
+    high = np.maximum(open, close) + 0.5
+    low = np.minimum(open, close) - 0.5
+
+    # wide frames: the columns are the symbols and the index the timestamps
+    hits = talib.scan_patterns(open, high, low, close, patterns=['CDLDOJI', 'CDLENGULFING'])
+    expected = []
+    for symbol in close.columns:
+        doji = talib.CDLDOJI(open[symbol], high[symbol], low[symbol], close[symbol])
+        engulfing = talib.CDLENGULFING(open[symbol], high[symbol], low[symbol], close[symbol])
+        for timestamp in index:
+            for name, result in (('CDLDOJI', doji), ('CDLENGULFING', engulfing)):
+                if result[timestamp]:
+                    expected.append((symbol, timestamp, name, 1 if result[timestamp] > 0 else -1))
+    assert hits == expected
+    assert isinstance(hits[0][1], pd.Timestamp)
+
+    symbol = 'GBPUSD'
+    hits = talib.scan_patterns(open[symbol], high[symbol], low[symbol], close[symbol], symbols=symbol)
+    assert {hit[0] for hit in hits} == {symbol}
+    assert [hit[1:] for hit in hits if hit[2] == 'CDLDOJI'] == [
+        hit[1:] for hit in expected if hit[0] == symbol and hit[2] == 'CDLDOJI']
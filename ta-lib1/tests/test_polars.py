@@ -1,5 +1,5 @@
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_almost_equal, assert_array_equal
 import polars as pl
 
 import talib
@@ -86,3 +86,84 @@ def test_AVR():
     low = df['low']
     close = df['close']
     atr = talib.ATR(high, low, close, timeperiod=14)
+
+
+def test_zero_copy_input():
+    values = pl.Series(np.random.random(100))
+    assert np.shares_memory(talib._to_numpy(values), values.to_numpy())
+    assert_array_equal(talib.SMA(values).to_numpy(), talib.SMA(values.to_numpy()))
+
+    # nulls become NaN
+    values = pl.Series([1.0, None, 3.0, 4.0])
+    assert_array_equal(talib._to_numpy(values), [1.0, np.nan, 3.0, 4.0])
+
+    df = pl.DataFrame({'close': np.random.random(100)})
+    result = abstract.Function('SMA')(df)
+    assert_array_equal(result.to_numpy(), talib.SMA(df['close'].to_numpy()))
+
+
+def test_expr():
+    import talib.expr
+
+    rng = np.random.default_rng(0)
+    close = np.cumsum(rng.standard_normal(200)) + 100
+    df = pl.DataFrame({
+        'symbol': ['a'] * 100 + ['b'] * 100,
+        'close': close,
+    }).with_columns(high=pl.col('close') + 1, low=pl.col('close') - 1)
+
+    result = df.lazy().with_columns(
+        pl.col('close').ta.rsi(10).over('symbol').alias('rsi'),
+        pl.col('high').ta.atr('low', 'close', timeperiod=5).over('symbol').alias('atr'),
+        pl.col('close').ta.macd().over('symbol').alias('macd'),
+        pl.col('close').ta.cdldoji(pl.col('high'), pl.col('low'), pl.col('close')).alias('doji'),
+    ).collect()
+    assert result.schema['doji'] == pl.Int32
+    for symbol, values in (('a', close[:100]), ('b', close[100:])):
+        rows = result.filter(pl.col('symbol') == symbol)
+        assert_array_equal(rows['rsi'].to_numpy(), talib.RSI(values, 10))
+        assert_array_equal(rows['atr'].to_numpy(), talib.ATR(values + 1, values - 1, values, 5))
+        assert_array_equal(rows['macd'].struct.field('macdsignal').to_numpy(), talib.MACD(values)[1])
+
+    result = df.group_by('symbol', maintain_order=True).agg(pl.col('close').ta.sma(3))
+    assert_array_equal(result['close'][1].to_numpy(), talib.SMA(close[100:], 3))
+
+
+def test_expr_by():
+    import talib.expr
+
+    rng = np.random.default_rng(1)
+    close = np.cumsum(rng.standard_normal(300)) + 100
+    df = pl.DataFrame({
+        'symbol': ['a'] * 150 + ['b'] * 100 + ['c'] * 10 + ['d'] * 40,
+        'close': close,
+    }).with_columns(high=pl.col('close') + 1, low=pl.col('close') - 1)
+    expressions = {
+        # one call over every group
+        'sma': lambda **by: pl.col('close').ta.sma(20, **by),
+        'bbands': lambda **by: pl.col('close').ta.bbands(20, **by),
+        'maxindex': lambda **by: pl.col('close').ta.maxindex(15, **by),
+        'doji': lambda **by: pl.col('open').ta.cdldoji('high', 'low', 'close', **by),
+        # one call per group
+        'rsi': lambda **by: pl.col('close').ta.rsi(10, **by),
+        'macd': lambda **by: pl.col('close').ta.macd(**by),
+        'ema': lambda **by: pl.col('close').ta.ma(12, talib.MA_Type.EMA, **by),
+    }
+
+    df = df.with_columns(open=pl.col('close').shift(1).fill_null(100.0))
+    for frame in (df, df.sample(fraction=1.0, shuffle=True, seed=2)):
+        result = frame.with_columns(**dict((name, expr(by='symbol')) for name, expr in expressions.items()))
+        expected = frame.with_columns(**dict((name, expr().over('symbol')) for name, expr in expressions.items()))
+        assert result.schema == expected.schema
+        for name in expressions:
+            a, b = result[name], expected[name]
+            if a.dtype == pl.Struct:
+                a, b = a.struct.unnest(), b.struct.unnest()
+            assert_array_almost_equal(a.to_numpy(), b.to_numpy(), decimal=9)
+
+    # a NaN in a group does not reach the next ones
+    frame = df.with_columns(close=pl.when(pl.int_range(pl.len()) == 140).then(np.nan).otherwise(pl.col('close')))
+    result = frame.with_columns(sma=pl.col('close').ta.sma(5, by='symbol'))['sma'].to_numpy()
+    assert np.isnan(result[140:150]).all()
+    assert_array_equal(result[150:], talib.SMA(close[150:250], 5).tolist()
+                       + talib.SMA(close[250:260], 5).tolist() + talib.SMA(close[260:], 5).tolist())
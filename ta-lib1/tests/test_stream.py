@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 import talib
 from talib import stream
@@ -65,3 +66,80 @@ def test_MAXINDEX():
     a = np.array([1., 2, 3, 4, 5, 6, 7, 8, 7, 7, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5, 15])
     r = stream.MAXINDEX(a, 10)
     assert r == 21
+
+
+def test_stateful_streaming():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 200))
+    close[:3] = np.nan
+    high = close + rng.random(200)
+    low = close - rng.random(200)
+    volume = rng.integers(1, 100, 200).astype(float)
+
+    rsi = stream.RSI(timeperiod=14)
+    assert isinstance(rsi, talib.stream.StreamingIndicator)
+    values = [rsi.update(value) for value in close]
+    np.testing.assert_array_equal(values, talib.RSI(close, timeperiod=14))
+
+    # prime with the history, then update with every new value
+    ema = stream.EMA(timeperiod=10)
+    assert ema.prime(close[:150]) == talib.EMA(close[:150], timeperiod=10)[-1]
+    for i in range(150, 200):
+        assert ema.update(close[i]) == talib.EMA(close[:i + 1], timeperiod=10)[-1]
+
+    macd = stream.MACD(fastperiod=12, slowperiod=26, signalperiod=9)
+    values = np.array([macd.update(value) for value in close]).T
+    for value, expected in zip(values, talib.MACD(close)):
+        np.testing.assert_array_equal(value, expected)
+
+    atr = stream.ATR()
+    assert atr.prime(high, low, close) == talib.ATR(high, low, close)[-1]
+    assert stream.OBV().prime(close, volume) == talib.OBV(close, volume)[-1]
+    assert stream.SMA(5).prime(close) == talib.SMA(close, 5)[-1]
+
+    bbands = stream.BBANDS(20, 2.0, 1.5)
+    values = np.array([bbands.update(value) for value in close]).T
+    for value, expected in zip(values, talib.BBANDS(close, 20, 2.0, 1.5)):
+        np.testing.assert_array_equal(value, expected)
+    stoch = stream.STOCH(fastk_period=14, slowk_period=3, slowd_period=5)
+    values = np.array([stoch.update(*bar) for bar in zip(high, low, close)]).T
+    for value, expected in zip(values, talib.STOCH(high, low, close, 14, 3, 0, 5, 0)):
+        np.testing.assert_array_equal(value, expected)
+    with pytest.raises(Exception):
+        stream.BBANDS(matype=talib.MA_Type.EMA)
+
+    # the results follow the unstable period set at creation
+    talib.set_unstable_period('RSI', 10)
+    try:
+        rsi = stream.RSI()
+        values = [rsi.update(value) for value in close]
+        np.testing.assert_array_equal(values, talib.RSI(close))
+    finally:
+        talib.set_unstable_period('RSI', 0)
+
+    # arrays still return the last value of the stream functions
+    assert not np.isnan(stream.RSI(close))
+
+    with pytest.raises(Exception):
+        stream.RSI(timeperiod=1)
+
+
+def test_streaming_from_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    rng = np.random.default_rng(1)
+    closes = [100 + np.cumsum(rng.normal(0, 1, 5000)) for _ in range(16)]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda close: stream.RSI(close, 14), closes))
+    assert results == [stream.RSI(close, 14) for close in closes]
+
+
+def test_streaming_float32():
+    rng = np.random.default_rng(2)
+    close = (100 + np.cumsum(rng.normal(0, 1, 200))).astype(np.float32)
+    high, low = close + 1, close - 1
+    # float32 inputs are read by the TA_S_* functions, in double precision
+    assert stream.RSI(close) == stream.RSI(close.astype(np.float64))
+    assert stream.ATR(high, low, close) == stream.ATR(*(x.astype(np.float64) for x in (high, low, close)))
+    assert stream.MACD(close) == stream.MACD(close.astype(np.float64))
+    with pytest.raises(Exception):
+        stream.ATR(high, low, close.astype(np.float64))
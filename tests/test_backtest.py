@@ -0,0 +1,261 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest import backtest, sweep
+
+
+def frame(rows):
+    """Build a backtest input from (Open, High, Low, Close, Position) rows."""
+    return pd.DataFrame(rows, columns=['Open', 'High', 'Low', 'Close', 'Position'],
+                        index=pd.date_range('2024-01-01', periods=len(rows), freq='h'))
+
+
+def only_trade(result):
+    trades = result['trades']
+    assert len(trades) == 1
+    return trades.iloc[0]
+
+
+def test_stop_loss_exit():
+    data = frame([
+        (100, 100, 100, 100, 0),
+        (100, 100, 100, 100, 1),    # entry at 100, stop 99, target 102
+        (100, 100.5, 99.5, 100, 0),
+        (99.8, 100, 98.5, 99, 0),   # trades through the stop
+        (99, 101, 98, 100, 0),
+    ])
+    result = backtest(data)
+    trade = only_trade(result)
+    assert trade['exit_reason'] == 'stop_loss'
+    assert trade['exit_time'] == data.index[3]
+    assert trade['exit_price'] == pytest.approx(99)
+    assert trade['return'] == pytest.approx(-0.01)
+    assert trade['bars'] == 2
+    assert result['stats']['stop_losses'] == 1
+    assert result['stats']['take_profits'] == 0
+    # flat after the exit
+    assert result['equity'].iloc[-1] == pytest.approx(10000 * 0.99)
+    assert result['equity'].iloc[3] == result['equity'].iloc[-1]
+
+
+def test_take_profit_exit():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100.5, 103, 100, 101, 0),  # trades through the target
+        (101, 101, 101, 101, 0),
+    ])
+    result = backtest(data)
+    trade = only_trade(result)
+    assert trade['exit_reason'] == 'take_profit'
+    assert trade['exit_price'] == pytest.approx(102)
+    assert trade['return'] == pytest.approx(0.02)
+    assert result['stats']['take_profits'] == 1
+    assert result['stats']['win_rate'] == 1.0
+    assert result['stats']['total_return'] == pytest.approx(0.02)
+
+
+def test_signal_exit():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100, 101, 99.5, 100.5, 0),
+        (100.5, 101.5, 100, 101, -1),
+        (101, 110, 90, 101, 0),     # after the exit, so neither level counts
+    ])
+    trade = only_trade(backtest(data, short=False))
+    assert trade['exit_reason'] == 'signal'
+    assert trade['exit_time'] == data.index[2]
+    assert trade['exit_price'] == 101
+
+
+def test_opposite_signal_reverses_into_a_short():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100, 101, 99.5, 100.5, 0),
+        (100.5, 101.5, 100, 101, -1),   # closes the long, opens a short at 101
+        (101, 101.5, 100.5, 100, 0),
+        (100, 100.5, 99.5, 99.5, 0),
+    ])
+    result = backtest(data)
+    trades = result['trades']
+    assert trades['side'].tolist() == ['long', 'short']
+    assert trades['exit_reason'].tolist() == ['signal', 'open']
+    assert trades['entry_time'].iloc[1] == trades['exit_time'].iloc[0] == data.index[2]
+    assert trades['return'].tolist() == pytest.approx([0.01, 1 - 99.5 / 101])
+    assert result['stats']['long_trades'] == result['stats']['short_trades'] == 1
+    # the short earns as the price falls
+    assert result['equity'].iloc[-1] == pytest.approx(10000 * 1.01 * (2 - 99.5 / 101))
+
+
+@pytest.mark.parametrize('bar, exit_price, reason', [
+    ((101.5, 102.5, 100, 102, 0), 102.01, 'stop_loss'),     # stop 1% above the entry
+    ((100.5, 101, 98.5, 99, 0), 98.98, 'take_profit'),      # target 2% below the entry
+    ((103, 104, 102.5, 103.5, 0), 103, 'stop_loss'),        # gaps above the stop: filled at the open
+    ((98, 98.5, 97, 97.5, 0), 98, 'take_profit'),           # gaps below the target: filled at the open
+    ((101, 103, 98, 100, 0), 102.01, 'stop_loss'),          # both levels: the stop wins
+])
+def test_short_stop_loss_and_take_profit(bar, exit_price, reason):
+    data = frame([(101, 101, 101, 101, 1), (101, 101, 101, 101, -1), bar, (100, 100, 100, 100, 0)])
+    trade = backtest(data)['trades'].iloc[1]
+    assert trade['side'] == 'short'
+    assert trade['exit_reason'] == reason
+    assert trade['exit_price'] == pytest.approx(exit_price)
+    assert trade['return'] == pytest.approx(1 - exit_price / 101)
+
+
+def test_long_only_ignores_sell_signals():
+    data = frame([
+        (100, 100, 100, 100, 0),
+        (100, 100, 100, 100, -1),
+        (100, 101, 98, 99, 0),
+    ])
+    assert backtest(data, short=False)['trades'].empty
+    trade = only_trade(backtest(data))
+    assert trade['side'] == 'short'
+    assert trade['exit_reason'] == 'stop_loss'
+
+
+@pytest.mark.parametrize('bar, exit_price, reason', [
+    ((97, 98, 96, 97.5, 0), 97, 'stop_loss'),        # gaps below the stop: filled at the open
+    ((104, 105, 103.5, 104.5, 0), 104, 'take_profit'),  # gaps above the target: filled at the open
+])
+def test_gap_through_fills_at_the_open(bar, exit_price, reason):
+    data = frame([(100, 100, 100, 100, 1), bar, (100, 100, 100, 100, 0)])
+    trade = only_trade(backtest(data))
+    assert trade['exit_reason'] == reason
+    assert trade['exit_price'] == exit_price
+    assert trade['return'] == pytest.approx(exit_price / 100 - 1)
+
+
+def test_stop_wins_a_bar_hitting_both_levels():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100, 103, 98, 102.5, 0),   # low under the stop and high over the target
+    ])
+    result = backtest(data)
+    trade = only_trade(result)
+    assert trade['exit_reason'] == 'stop_loss'
+    assert trade['exit_price'] == pytest.approx(99)
+    assert result['stats']['stop_losses'] == 1
+    assert result['stats']['take_profits'] == 0
+
+
+def test_trade_open_at_the_end_is_marked_to_the_last_close():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100, 101, 99.5, 100.5, 0),
+        (100.5, 101.5, 100, 101, 0),
+    ])
+    result = backtest(data)
+    trade = only_trade(result)
+    assert trade['exit_reason'] == 'open'
+    assert trade['exit_time'] == data.index[-1]
+    assert trade['exit_price'] == 101
+    assert result['equity'].iloc[-1] == pytest.approx(10000 * 1.01)
+    assert result['stats']['exposure'] == pytest.approx(2 / 3)
+
+
+def test_entry_on_the_last_bar():
+    data = frame([
+        (100, 100, 100, 100, 0),
+        (100, 100, 100, 100, 1),
+    ])
+    result = backtest(data)
+    trade = only_trade(result)
+    assert trade['exit_reason'] == 'open'
+    assert trade['bars'] == 0
+    assert trade['return'] == 0
+    assert result['stats']['exposure'] == 0
+    assert (result['equity'] == 10000).all()
+
+
+def test_fees_are_charged_on_entry_and_exit():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100.5, 103, 100, 101, 0),
+    ])
+    result = backtest(data, fee_percent=0.1)
+    trade = only_trade(result)
+    assert trade['return'] == pytest.approx(1.02 * 0.999 ** 2 - 1)
+    assert result['equity'].iloc[-1] == pytest.approx(10000 * (1 + trade['return']))
+
+
+def test_no_trades():
+    result = backtest(frame([(100, 101, 99, 100, 0)] * 3))
+    assert result['trades'].empty
+    assert result['stats']['trades'] == 0
+    assert result['stats']['total_return'] == 0
+    assert result['stats']['profit_factor'] == 0.0
+
+
+def loop_backtest(data, stop_loss_percent, take_profit_percent):
+    """Bar by bar reference of the trade exits."""
+    rows = list(data[['Open', 'High', 'Low', 'Close', 'Position']].itertuples(index=False))
+    trades = []
+    for entry, row in enumerate(rows):
+        direction = row.Position
+        if direction == 0:
+            continue
+        stop = row.Close * (1 - direction * stop_loss_percent / 100)
+        target = row.Close * (1 + direction * take_profit_percent / 100)
+        exit_bar, exit_price, reason = len(rows) - 1, rows[-1].Close, 'open'
+        for bar in range(entry + 1, len(rows)):
+            if direction * (rows[bar].Low if direction > 0 else rows[bar].High) <= direction * stop:
+                fill = min(rows[bar].Open, stop) if direction > 0 else max(rows[bar].Open, stop)
+                exit_bar, exit_price, reason = bar, fill, 'stop_loss'
+            elif direction * (rows[bar].High if direction > 0 else rows[bar].Low) >= direction * target:
+                fill = max(rows[bar].Open, target) if direction > 0 else min(rows[bar].Open, target)
+                exit_bar, exit_price, reason = bar, fill, 'take_profit'
+            elif rows[bar].Position == -direction:
+                exit_bar, exit_price, reason = bar, rows[bar].Close, 'signal'
+            else:
+                continue
+            break
+        trades.append((entry, exit_bar, exit_price, reason))
+    return trades
+
+
+def test_matches_a_bar_by_bar_loop():
+    rng = np.random.default_rng(7)
+    n = 2000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.006, n)))
+    opens = np.append(100, close[:-1]) * np.exp(rng.normal(0, 0.003, n))
+    high = np.maximum(opens, close) * np.exp(np.abs(rng.normal(0, 0.004, n)))
+    low = np.minimum(opens, close) * np.exp(-np.abs(rng.normal(0, 0.004, n)))
+    signal = (rng.random(n) < 0.1).astype(int)
+    position = np.diff(signal, prepend=0)
+    data = frame(list(zip(opens, high, low, close, position)))
+
+    for stop_loss_percent, take_profit_percent in [(1, 2), (0.5, 0.5), (3, 1)]:
+        result = backtest(data, stop_loss_percent, take_profit_percent)
+        trades = result['trades']
+        expected = loop_backtest(data, stop_loss_percent, take_profit_percent)
+        assert len(trades) == len(expected)
+        entries = data.index.get_indexer(trades['entry_time'])
+        exits = data.index.get_indexer(trades['exit_time'])
+        for trade, entry, exit_bar, (expected_entry, expected_exit, exit_price, reason) in zip(
+                trades.itertuples(), entries, exits, expected):
+            assert entry == expected_entry
+            assert exit_bar == expected_exit
+            assert trade.exit_price == pytest.approx(exit_price)
+            assert trade.exit_reason == reason
+        # without fees the equity compounds the trade returns
+        assert result['equity'].iloc[-1] == pytest.approx(10000 * np.prod(1 + trades['return']))
+
+        long_only = backtest(data, stop_loss_percent, take_profit_percent, short=False)['trades']
+        assert (long_only['side'] == 'long').all()
+        pd.testing.assert_frame_equal(long_only.reset_index(drop=True),
+                                      trades[trades['side'] == 'long'].reset_index(drop=True))
+
+
+def test_sweep():
+    data = frame([
+        (100, 100, 100, 100, 1),
+        (100, 101.5, 99.2, 101, 0),
+    ])
+    table = sweep(data, [0.5, 1], [1, 2])
+    assert len(table) == 4
+    stats = table.set_index(['stop_loss_percent', 'take_profit_percent'])
+    assert stats.loc[(0.5, 1), 'stop_losses'] == 1
+    assert stats.loc[(1, 1), 'take_profits'] == 1
+    assert stats.loc[(1, 2), 'stop_losses'] + stats.loc[(1, 2), 'take_profits'] == 0
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+
+from candle_aggregator import CandleAggregator, CandleRing
+
+
+def make_aggregator(**kwargs):
+    return CandleAggregator(intervals={'1m': 60}, **kwargs)
+
+
+def test_bars_from_ticks():
+    aggregator = make_aggregator()
+    for price, epoch in [(1.0, 0), (3.0, 10), (0.5, 20), (2.0, 30), (4.0, 61)]:
+        aggregator.add_tick('R_100', price, epoch)
+    data = aggregator.frame('R_100', '1m', now=70)
+    assert list(data.index) == [pd.Timestamp(0, unit='s'), pd.Timestamp(60, unit='s')]
+    assert data.iloc[0].tolist() == [1.0, 3.0, 0.5, 2.0, 4.0]
+    assert data.iloc[1].tolist() == [4.0, 4.0, 4.0, 4.0, 1.0]
+    assert len(aggregator.frame('R_100', '1m', include_forming=False, now=70)) == 1
+
+
+def test_late_tick_after_read_time_finalize():
+    aggregator = make_aggregator()
+    for epoch in (0, 30, 61, 125):
+        aggregator.add_tick('R_100', 1.0 + epoch, epoch)
+    # the 00:02 bar ends at 180 and is closed out by the read
+    data = aggregator.frame('R_100', '1m', now=200)
+    assert len(data) == 3
+    aggregator.add_tick('R_100', 9.0, 170)
+    data = aggregator.frame('R_100', '1m', now=200)
+    assert data.index.is_unique
+    assert len(data) == 3
+    assert data['Close'].iloc[-1] == 126.0
+
+
+def test_duplicate_ticks():
+    aggregator = make_aggregator()
+    aggregator.add_tick('R_100', 1.0, 0)
+    aggregator.add_tick('R_100', 2.0, 5)
+    aggregator.add_tick('R_100', 2.0, 5)
+    data = aggregator.frame('R_100', '1m', now=30)
+    assert data['Volume'].tolist() == [2.0]
+    assert data['Close'].tolist() == [2.0]
+
+
+def test_out_of_order_ticks():
+    aggregator = make_aggregator()
+    aggregator.add_tick('R_100', 1.0, 0)
+    aggregator.add_tick('R_100', 2.0, 65)
+    # older than the previous tick: dropped, in the same bucket or an earlier one
+    aggregator.add_tick('R_100', 5.0, 62)
+    aggregator.add_tick('R_100', 7.0, 50)
+    data = aggregator.frame('R_100', '1m', now=100)
+    assert data['Close'].tolist() == [1.0, 2.0]
+    assert data['Volume'].tolist() == [1.0, 1.0]
+    assert data['High'].tolist() == [1.0, 2.0]
+
+
+def test_ring_capacity_and_views():
+    ring = CandleRing(capacity=4)
+    for bar in range(20):
+        ring.start(bar * 60, float(bar))
+        ring.finalize()
+        epochs, values = ring.view()
+        assert len(epochs) == min(bar + 1, 4)
+        assert epochs[-1] == bar * 60
+        np.testing.assert_array_equal(values[3], epochs / 60.0)
+        assert values[3].flags['C_CONTIGUOUS']
+
+    # a view stays valid for `capacity` more bars, across a compaction
+    epochs, values = ring.view()
+    kept = epochs.copy()
+    for bar in range(20, 24):
+        ring.start(bar * 60, float(bar))
+        ring.finalize()
+        np.testing.assert_array_equal(epochs, kept)
+    assert ring.view()[0].tolist() == [1200, 1260, 1320, 1380]
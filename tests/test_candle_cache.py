@@ -0,0 +1,89 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import candle_cache
+from candle_cache import CandleStore
+
+START = pd.Timestamp('2024-01-01')
+
+
+def bars(count, revision=0.0):
+    index = START + pd.to_timedelta(np.arange(count), unit='min')
+    close = 100.0 + np.arange(count) + revision
+    return pd.DataFrame({'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(count, 10.0)}, index=index)
+
+
+def downloader(data):
+    def download(start, stop):
+        return data[(data.index >= start) & (data.index < stop)]
+    return download
+
+
+def minute(position):
+    return START + pd.Timedelta(minutes=position)
+
+
+def test_top_ups_only_write_the_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(candle_cache, 'TAIL_ROWS', 10)
+    store = CandleStore(str(tmp_path), retention={})
+    path = store.path('yfinance', 'EURUSD=X', '1m')
+    tail_path = store.tail_path('yfinance', 'EURUSD=X', '1m')
+
+    store.get('yfinance', 'EURUSD=X', '1m', minute(10), minute(30), downloader(bars(100)))
+    assert len(store._read(path)) == 20
+    assert not os.path.exists(tail_path)
+
+    # the last bar is revised and four are added: only the tail is written
+    data = bars(100)
+    data.loc[minute(29):, 'Close'] += 0.5
+    result = store.get('yfinance', 'EURUSD=X', '1m', minute(10), minute(34), downloader(data))
+    pd.testing.assert_frame_equal(result, data.iloc[10:34])
+    assert len(store._read(path)) == 20
+    assert len(store._read(tail_path)) == 5
+    pd.testing.assert_frame_equal(store.load('yfinance', 'EURUSD=X', '1m'), data.iloc[10:34])
+
+    # past TAIL_ROWS bars the tail is folded into the main file
+    store.get('yfinance', 'EURUSD=X', '1m', minute(10), minute(39), downloader(data))
+    assert len(store._read(tail_path)) == 10
+    store.get('yfinance', 'EURUSD=X', '1m', minute(10), minute(50), downloader(data))
+    assert not os.path.exists(tail_path)
+    pd.testing.assert_frame_equal(store._read(path), data.iloc[10:50])
+
+    # a backfill rewrites the main file too
+    store.get('yfinance', 'EURUSD=X', '1m', minute(10), minute(52), downloader(data))
+    assert os.path.exists(tail_path)
+    store.get('yfinance', 'EURUSD=X', '1m', minute(0), minute(52), downloader(data))
+    assert not os.path.exists(tail_path)
+    pd.testing.assert_frame_equal(store.load('yfinance', 'EURUSD=X', '1m'), data.iloc[:52])
+    assert store._locks == {}
+
+
+def test_batch_top_ups_only_write_the_tail(tmp_path):
+    store = CandleStore(str(tmp_path), retention={})
+    data = bars(100)
+
+    def download(symbols, start, stop):
+        return {symbol: downloader(data)(start, stop) for symbol in symbols}
+
+    store.get_many('yfinance', ['A', 'B'], '1m', minute(0), minute(20), download)
+    store.get('yfinance', 'A', '1m', minute(0), minute(30), downloader(data))
+    # B's top-up starts with A's last bar, the bars B already has are unchanged
+    results = store.get_many('yfinance', ['A', 'B'], '1m', minute(0), minute(40), download)
+    for symbol in ('A', 'B'):
+        pd.testing.assert_frame_equal(results[symbol], data.iloc[:40])
+        assert len(store._read(store.path('yfinance', symbol, '1m'))) == 20
+    assert store._locks == {}
+
+    # revised bars before the last stored one rewrite the main file
+    revised = bars(100, revision=0.25)
+    store.get_many('yfinance', ['A'], '1m', minute(0), minute(45),
+                   lambda symbols, start, stop: {'A': revised.iloc[30:45]})
+    assert len(store._read(store.path('yfinance', 'A', '1m'))) == 45
+    store.get_many('yfinance', ['A', 'B'], '1m', minute(0), minute(50),
+                   lambda symbols, start, stop: {symbol: revised.iloc[30:50] for symbol in symbols})
+    assert not os.path.exists(store.tail_path('yfinance', 'B', '1m'))
+    pd.testing.assert_frame_equal(store.load('yfinance', 'B', '1m'),
+                                  pd.concat([data.iloc[:30], revised.iloc[30:50]]))
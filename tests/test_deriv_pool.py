@@ -0,0 +1,53 @@
+import asyncio
+from types import SimpleNamespace
+
+from deriv_pool import DerivConnectionPool
+
+
+class FakeAPI:
+    def __init__(self):
+        self.subscription_manager = SimpleNamespace(sources={})
+        self.closed = False
+        self.pings = 0
+
+    async def send(self, request):
+        return {'echo': request}
+
+    async def ping(self):
+        self.pings += 1
+
+    async def disconnect(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    pool = DerivConnectionPool(**kwargs)
+    opened = []
+
+    async def connect(app_id, api_token):
+        opened.append(FakeAPI())
+        return opened[-1]
+    pool._connect = connect
+    return pool, opened
+
+
+def test_idle_connections_are_closed():
+    pool, opened = make_pool(ping_interval=0.05, idle_timeout=0.2)
+
+    async def scenario():
+        busy = await pool.acquire(1, 'busy')
+        idle = await pool.acquire(1, 'idle')
+        streaming = await pool.acquire(1, 'streaming')
+        opened[2].subscription_manager.sources['ticks'] = object()
+        for _ in range(8):
+            await busy.send({'ping': 1})
+            await asyncio.sleep(0.05)
+        assert await idle.send({'ping': 1}) == {'echo': {'ping': 1}}
+
+    asyncio.run(scenario())
+    busy, idle, streaming, reopened = opened
+    assert not busy.closed and busy.pings > 0
+    # the idle connection was closed and the next request opened a new one
+    assert idle.closed and not reopened.closed
+    assert not streaming.closed
+    assert set(pool._connections) == set(pool._last_used) == {('1', 'busy'), ('1', 'idle'), ('1', 'streaming')}
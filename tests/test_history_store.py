@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import history_store as history_module
+from candle_aggregator import OHLCV_COLUMNS
+from candle_cache import CandleStore
+from history_store import EPOCH_FILE, INDEX_FILE, HistoryStore, epoch
+
+START = 1_700_000_000
+
+
+@pytest.fixture(autouse=True)
+def small_stride(monkeypatch):
+    # several index blocks without writing thousands of bars
+    monkeypatch.setattr(history_module, 'INDEX_STRIDE', 8)
+
+
+def bars(first, count, step=60):
+    epochs = START + (first + np.arange(count)) * step
+    close = 100.0 + first + np.arange(count, dtype=np.float64)
+    data = pd.DataFrame({'Open': close - 0.5, 'High': close + 1, 'Low': close - 1, 'Close': close,
+                         'Volume': np.full(count, 10.0)}, index=pd.to_datetime(epochs, unit='s'))
+    return data
+
+
+def test_append_and_locate(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    assert store.append('EURUSD', '1m', bars(0, 30)) == 30
+    assert store.append('EURUSD', '1m', bars(30, 20)) == 20
+
+    history = store.open('EURUSD', '1m')
+    assert len(history) == 50
+    assert len(history.index) == 7
+    for position in (0, 7, 8, 9, 31, 49):
+        assert history.locate(START + position * 60) == position
+        assert history.locate(START + position * 60, 'right') == position + 1
+        # between two bars
+        assert history.locate(START + position * 60 + 1) == position + 1
+    assert history.locate(START - 1) == 0
+    assert history.locate(START + 50 * 60) == 50
+
+    epochs, columns = history.arrays(START + 10 * 60, START + 25 * 60)
+    assert isinstance(epochs, np.memmap)
+    assert all(isinstance(values, np.memmap) for values in columns.values())
+    np.testing.assert_array_equal(epochs, START + np.arange(10, 25) * 60)
+    np.testing.assert_array_equal(columns['Close'], bars(0, 50)['Close'].to_numpy()[10:25])
+    pd.testing.assert_frame_equal(history.frame(START + 10 * 60, START + 25 * 60),
+                                  bars(0, 50).iloc[10:25].rename_axis('timestamp'), check_freq=False)
+
+
+def test_append_replaces_last_bar_and_ignores_older_ones(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.append('EURUSD', '1m', bars(0, 10))
+    update = bars(9, 3)
+    update['Close'] += 0.25
+    # bar 9 is rewritten, 10 and 11 appended, the older bars are ignored
+    assert store.append('EURUSD', '1m', pd.concat([bars(0, 5), update])) == 3
+
+    epochs, columns = store.arrays('EURUSD', '1m')
+    np.testing.assert_array_equal(epochs, START + np.arange(12) * 60)
+    assert columns['Close'][8] == bars(0, 10)['Close'].iloc[8]
+    np.testing.assert_array_equal(columns['Close'][9:], update['Close'].to_numpy())
+
+
+def test_append_fills_missing_columns(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.append('R_100', '1m', bars(0, 5).drop(columns='Volume'))
+    _, columns = store.arrays('R_100', '1m')
+    assert np.isnan(columns['Volume']).all()
+
+
+def test_reopen_existing_store(tmp_path):
+    HistoryStore(str(tmp_path)).append('EURUSD', '1h', bars(0, 20, step=3600))
+
+    store = HistoryStore(str(tmp_path))
+    history = store.open('EURUSD', '1h')
+    assert len(history) == 20
+    assert history.locate(START + 12 * 3600) == 12
+    assert store.append('EURUSD', '1h', bars(20, 5, step=3600)) == 5
+    epochs, _ = store.arrays('EURUSD', '1h')
+    np.testing.assert_array_equal(epochs, START + np.arange(25) * 3600)
+    # other keys stay empty
+    assert len(store.open('EURUSD', '1m')) == 0
+    assert store.open('EURUSD', '1m').bounds(START) == (0, 0)
+
+
+def test_recover_from_torn_append(tmp_path):
+    store = HistoryStore(str(tmp_path))
+    store.append('EURUSD', '1m', bars(0, 20))
+    directory = store.path('EURUSD', '1m')
+
+    # an append interrupted after some columns: the epoch file, written
+    # last, is short of a whole bar and the index misses the new block
+    extra = bars(20, 6)
+    for column in OHLCV_COLUMNS[:3]:
+        with open(os.path.join(directory, f"{column.lower()}.f64"), 'ab') as f:
+            f.write(extra[column].to_numpy().tobytes())
+    with open(os.path.join(directory, EPOCH_FILE), 'ab') as f:
+        f.write(b'\0' * 5)
+    os.truncate(os.path.join(directory, INDEX_FILE), 8)
+
+    history = HistoryStore(str(tmp_path)).open('EURUSD', '1m')
+    assert len(history) == 20
+    np.testing.assert_array_equal(history.index, START + np.array([0, 8, 16]) * 60)
+    for column in OHLCV_COLUMNS:
+        assert os.path.getsize(os.path.join(directory, f"{column.lower()}.f64")) == 20 * 8
+    assert os.path.getsize(os.path.join(directory, EPOCH_FILE)) == 20 * 8
+
+    # the next append continues from the last complete bar
+    assert store.append('EURUSD', '1m', extra) == 6
+    epochs, columns = store.arrays('EURUSD', '1m')
+    np.testing.assert_array_equal(epochs, START + np.arange(26) * 60)
+    np.testing.assert_array_equal(columns['Close'], bars(0, 26)['Close'].to_numpy())
+
+
+def test_epoch():
+    assert epoch('2020-01-01') == 1577836800
+    assert epoch(pd.Timestamp('2020-01-01 01:00', tz='Europe/Paris')) == 1577836800
+
+
+def _append_concurrently(root, first):
+    store = HistoryStore(root)
+    for count in range(1, 40):
+        store.append('EURUSD', '1m', bars(first, count))
+
+
+def test_appends_from_several_processes(tmp_path):
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=_append_concurrently, args=(str(tmp_path), first)) for first in (0, 0, 5)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+        assert process.exitcode == 0
+
+    directory = HistoryStore(str(tmp_path)).path('EURUSD', '1m')
+    history = HistoryStore(str(tmp_path)).open('EURUSD', '1m')
+    for column in OHLCV_COLUMNS:
+        assert os.path.getsize(os.path.join(directory, f"{column.lower()}.f64")) == len(history) * 8
+    np.testing.assert_array_equal(history.epochs, np.unique(history.epochs))
+    expected = bars(0, 50).set_index(bars(0, 50).index.rename('timestamp'))
+    pd.testing.assert_frame_equal(history.frame(), expected.loc[history.frame().index], check_freq=False)
+
+
+def test_candle_store_archives_downloads(tmp_path):
+    history = HistoryStore(str(tmp_path / 'history'))
+    store = CandleStore(str(tmp_path / 'cache'), retention={}, history=history)
+    end = pd.Timestamp(START + 40 * 60, unit='s')
+    downloads = []
+
+    def downloader(start, stop):
+        downloads.append((start, stop))
+        data = bars(0, 40)
+        return data[(data.index >= start) & (data.index < stop)]
+
+    store.get('yfinance', 'EURUSD=X', '1m', pd.Timestamp(START + 20 * 60, unit='s'), end, downloader)
+    assert len(history.open('EURUSD=X', '1m')) == 20
+    store.get('yfinance', 'EURUSD=X', '1m', pd.Timestamp(START + 20 * 60, unit='s'), end, downloader)
+    assert len(downloads) == 2
+    # the backfill is older than the archived bars, so only the cache keeps it
+    store.get('yfinance', 'EURUSD=X', '1m', pd.Timestamp(START, unit='s'), end, downloader)
+    epochs, _ = history.arrays('EURUSD=X', '1m')
+    np.testing.assert_array_equal(epochs, START + np.arange(20, 40) * 60)
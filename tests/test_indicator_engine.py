@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('talib')
+
+from feature_sets import SIGNAL_FEATURES, compute_features  # noqa: E402
+from indicator_engine import IndicatorEngine, signal_conditions  # noqa: E402
+
+
+def candles(count, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, count))
+    return pd.DataFrame({'Open': close, 'High': close + rng.random(count), 'Low': close - rng.random(count),
+                         'Close': close, 'Volume': rng.integers(1, 100, count).astype(float)},
+                        index=pd.date_range('2024-01-01', periods=count, freq='h'))
+
+
+def assert_row_equal(row, expected):
+    pd.testing.assert_series_equal(row[expected.index].astype(float), expected.astype(float),
+                                   check_names=False, check_exact=True)
+
+
+def batch_rows(data):
+    features = compute_features(data, SIGNAL_FEATURES)
+    features['Signal'] = np.where(np.all(signal_conditions(features), axis=0), 1, 0)
+    features['Position'] = features['Signal'].diff()
+    return features
+
+
+def test_engine_matches_the_batch_features():
+    data = candles(300)
+    expected = batch_rows(data)
+    engine = IndicatorEngine()
+    # a long history first, then one new bar at a time
+    for stop in [200] + list(range(201, 301)):
+        assert_row_equal(engine.update(data.iloc[:stop]), expected.iloc[stop - 1])
+
+
+def test_engine_recomputes_the_forming_bar_and_replays_rewritten_history():
+    data = candles(150, seed=1)
+    engine = IndicatorEngine()
+    engine.update(data)
+    forming = data.copy()
+    forming.iloc[-1, forming.columns.get_loc('Close')] += 0.5
+    expected = batch_rows(forming).iloc[-1]
+    assert_row_equal(engine.update(forming), expected)
+
+    rewritten = data.copy()
+    # the last committed bar changed
+    rewritten.iloc[-2, rewritten.columns.get_loc('Close')] -= 1
+    expected = batch_rows(rewritten).iloc[-1]
+    assert_row_equal(engine.update(rewritten), expected)
@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from deriv_api.errors import ResponseError
+from flask_socketio import join_room, leave_room
+
+from candle_aggregator import candle_aggregator
+from deriv_pool import deriv_pool
+
+# Minimum seconds between two signal recomputations for the same symbol
+SIGNAL_REFRESH_SECONDS = 60
+
+
+class TickStreamManager:
+    """Fans Deriv tick subscriptions out to per-symbol SocketIO rooms.
+
+    Exactly one upstream `ticks` subscription is kept per symbol however many
+    clients watch it. It is opened for the first viewer and forgotten when the
+    last one leaves. Every tick is emitted to the `ticks:<symbol>` room as a
+    `tick` event; when `signal_fn(api, symbol)` is given, the trade signal is
+    recomputed at most every `signal_refresh` seconds and emitted as `signal`.
+    Ticks are also fed to `aggregator`, which builds intraday candles from them.
+    """
+
+    def __init__(self, socketio, signal_fn=None, signal_refresh=SIGNAL_REFRESH_SECONDS, pool=deriv_pool,
+                 aggregator=candle_aggregator):
+        self.socketio = socketio
+        self.signal_fn = signal_fn
+        self.signal_refresh = signal_refresh
+        self.pool = pool
+        self.aggregator = aggregator
+        # reentrant: a done callback of an upstream may run inside _start
+        self._lock = threading.RLock()
+        self._viewers = {}
+        self._upstream = {}
+        self._credentials = {}
+        self._signal_due = {}
+        self._signal_busy = set()
+        self._signal_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tick-signals')
+
+    @staticmethod
+    def room(symbol):
+        return f'ticks:{symbol}'
+
+    def subscribe(self, sid, symbol, app_id, api_token):
+        """Add `sid` to the symbol's room; must be called from a SocketIO event handler."""
+        join_room(self.room(symbol))
+        with self._lock:
+            self._viewers.setdefault(symbol, set()).add(sid)
+            if symbol in self._upstream:
+                return
+            self._credentials[symbol] = (app_id, api_token)
+            self._start(symbol)
+        logging.info(f"Opening upstream tick subscription for {symbol}")
+
+    def unsubscribe(self, sid, symbol):
+        leave_room(self.room(symbol), sid=sid, namespace='/')
+        self._release(sid, symbol)
+
+    def unsubscribe_all(self, sid):
+        """Drop `sid` from every symbol; SocketIO already removes it from its rooms on disconnect."""
+        with self._lock:
+            symbols = [symbol for symbol, viewers in self._viewers.items() if sid in viewers]
+        for symbol in symbols:
+            self._release(sid, symbol)
+
+    def _release(self, sid, symbol):
+        with self._lock:
+            viewers = self._viewers.get(symbol)
+            if viewers is None:
+                return
+            viewers.discard(sid)
+            if viewers:
+                return
+            del self._viewers[symbol]
+            self._credentials.pop(symbol, None)
+            # a failed open has already removed its upstream
+            upstream = self._upstream.pop(symbol, None)
+        if upstream is None:
+            return
+        logging.info(f"Closing upstream tick subscription for {symbol}")
+        upstream.add_done_callback(self._dispose)
+
+    def _dispose(self, future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        # disposing the last observer makes DerivAPI forget the subscription
+        self.pool.call_soon(future.result().dispose)
+
+    def _start(self, symbol):
+        """Open the upstream subscription of `symbol`; must be called with the lock held."""
+        # the credentials are read now, a concurrent _release may remove them before _open runs
+        upstream = self.pool.submit(self._open(symbol, self._credentials[symbol]))
+        self._upstream[symbol] = upstream
+        upstream.add_done_callback(lambda future: self._opened(symbol, future))
+
+    def _opened(self, symbol, future):
+        if future.cancelled() or future.exception() is None:
+            return
+        error = future.exception()
+        logging.error(f"Opening the tick subscription for {symbol} failed: {error}")
+        self.socketio.emit('tick_error', {'symbol': symbol, 'errors': str(error)}, to=self.room(symbol))
+        with self._lock:
+            # forget the failed open, so that the next subscribe retries
+            if self._upstream.get(symbol) is future:
+                del self._upstream[symbol]
+                self._credentials.pop(symbol, None)
+
+    async def _open(self, symbol, credentials):
+        api = await self.pool.acquire(*credentials)
+        source = await api.subscribe({'ticks': symbol})
+        return source.subscribe(
+            on_next=lambda response: self._on_tick(symbol, response),
+            on_error=lambda error: self._on_error(symbol, error))
+
+    def _on_tick(self, symbol, response):
+        tick = response.get('tick', {})
+        if self.aggregator is not None:
+            self.aggregator.add_tick(symbol, tick.get('quote'), tick.get('epoch'))
+        self.socketio.emit('tick', {
+            'symbol': symbol,
+            'quote': tick.get('quote'),
+            'epoch': tick.get('epoch'),
+        }, to=self.room(symbol))
+        self._maybe_refresh_signal(symbol)
+
+    def _on_error(self, symbol, error):
+        logging.error(f"Tick subscription for {symbol} failed: {error}")
+        self.socketio.emit('tick_error', {'symbol': symbol, 'errors': str(error)}, to=self.room(symbol))
+        with self._lock:
+            if symbol not in self._viewers:
+                return
+            if isinstance(error, ResponseError):
+                # the request itself was rejected (e.g. unknown symbol), retrying will not help
+                self._upstream.pop(symbol, None)
+                return
+            if symbol not in self._credentials:
+                return
+            logging.info(f"Reopening upstream tick subscription for {symbol}")
+            self._start(symbol)
+
+    def _maybe_refresh_signal(self, symbol):
+        if self.signal_fn is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if symbol in self._signal_busy or now < self._signal_due.get(symbol, 0):
+                return
+            credentials = self._credentials.get(symbol)
+            if credentials is None:
+                return
+            self._signal_busy.add(symbol)
+        self._signal_executor.submit(self._refresh_signal, symbol, credentials)
+
+    def _refresh_signal(self, symbol, credentials):
+        try:
+            # indicator work runs here, off the pool loop that delivers ticks
+            trade_signal, entry_price, probability, timeframe_displayed = asyncio.run(
+                self._compute_signal(symbol, credentials))
+            self.socketio.emit('signal', {
+                'symbol': symbol,
+                'signal': trade_signal,
+                'entry_price': entry_price,
+                'probability': f'{probability}%',
+                'timeframe_displayed': timeframe_displayed,
+            }, to=self.room(symbol))
+        except Exception as e:
+            logging.error(f"Failed to refresh signal for {symbol}: {e}")
+        finally:
+            with self._lock:
+                self._signal_busy.discard(symbol)
+                self._signal_due[symbol] = time.monotonic() + self.signal_refresh
+
+    async def _compute_signal(self, symbol, credentials):
+        api = await self.pool.acquire(*credentials)
+        return await self.signal_fn(api, symbol)